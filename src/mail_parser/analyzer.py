@@ -1,6 +1,6 @@
 # src/mail_parser/analyzer.py
 
-from collections import defaultdict
+from collections import defaultdict, deque
 
 class ThreadAnalyzer:
     def __init__(self, metadata_map):
@@ -28,11 +28,11 @@ class ThreadAnalyzer:
             # Start a new thread if it's not a reply or its parent is missing
             if not parent_id or parent_id not in self.metadata_map:
                 thread_ids = []
-                q = [msg_id]
+                q = deque([msg_id])
                 visited_in_thread = {msg_id}
                 
                 while q:
-                    current_id = q.pop(0)
+                    current_id = q.popleft()
                     thread_ids.append(current_id)
                     processed_ids.add(current_id)
                     
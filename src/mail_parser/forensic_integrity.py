@@ -1,60 +1,112 @@
 # src/mail_parser/forensic_integrity.py
 import datetime
+import functools
 import getpass
 import hashlib
-import json
 import logging
+import mmap
 import os
 import platform
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
+from .file_utils import copy_file_data
+from .json_utils import dumps_json_line, read_json_lines, write_json
 
-@dataclass
+# 이 크기를 넘는 파일은 읽기와 해시 계산을 겹쳐서 처리
+PIPELINE_THRESHOLD_BYTES = 64 * 1024 * 1024
+PIPELINE_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _get_system_info() -> Dict:
+    """시스템 정보 (프로세스 수명 동안 불변이므로 한 번만 조회)"""
+    return {
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'python_version': platform.python_version(),
+        'hostname': platform.node(),
+        'machine': platform.machine(),
+        'system': platform.system()
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _get_collector() -> str:
+    """수집자(현재 사용자) 이름"""
+    return getpass.getuser()
+
+
+@dataclass(frozen=True, slots=True)
 class ChainOfCustodyRecord:
-    """연계보관성 기록"""
+    """연계보관성 기록 (생성 후 변경 불가)"""
     original_hash: str
     timestamp: str
     collector: str
-    system_info: Dict
+    system_info: Dict = field(hash=False)
     verification_status: str
     file_path: str
     file_size: int
     notes: Optional[str] = None
+    captured_mtime_ns: Optional[int] = None
 
 
 class ForensicIntegrityService:
     """포렌식 무결성 검증 서비스"""
 
-    def __init__(self):
+    def __init__(self, journal_path: Optional[str] = None):
+        """
+        Args:
+            journal_path: 지정하면 기록 생성 즉시 JSONL 저널에 한 줄씩 추가합니다.
+                (이전 실행의 기록은 저널에 그대로 두고, 내보내기에는 이번 세션 기록만 포함)
+        """
         self.custody_records: List[ChainOfCustodyRecord] = []
         self.logger = logging.getLogger(__name__)
+        # 경로 -> ((mtime_ns, size), sha256): 파일이 바뀌지 않았으면 재해시 생략
+        self._hash_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+        self._jsonl_path = journal_path
+        self._jsonl_file = None
+        # 이번 세션 기록이 시작되는 저널 바이트 위치
+        self._jsonl_start = 0
+        if journal_path:
+            journal_dir = os.path.dirname(journal_path)
+            if journal_dir:
+                os.makedirs(journal_dir, exist_ok=True)
+            self._jsonl_file = open(journal_path, 'ab')
+            self._jsonl_start = self._jsonl_file.tell()
+
+    def close(self):
+        """저널 파일 닫기"""
+        if self._jsonl_file is not None:
+            self._jsonl_file.close()
+            self._jsonl_file = None
 
     def create_chain_of_custody(self, file_path: str, notes: str = None) -> ChainOfCustodyRecord:
         """연계보관성 기록 생성"""
         try:
             file_hash = self._calculate_sha256(file_path)
-            file_size = os.path.getsize(file_path)
+            file_stat = os.stat(file_path)
 
             record = ChainOfCustodyRecord(
                 original_hash=file_hash,
                 timestamp=datetime.datetime.utcnow().isoformat() + "Z",
-                collector=getpass.getuser(),
-                system_info={
-                    'platform': platform.platform(),
-                    'processor': platform.processor(),
-                    'python_version': platform.python_version(),
-                    'hostname': platform.node(),
-                    'machine': platform.machine(),
-                    'system': platform.system()
-                },
+                collector=_get_collector(),
+                system_info=dict(_get_system_info()),
                 verification_status="VERIFIED",
                 file_path=file_path,
-                file_size=file_size,
-                notes=notes
+                file_size=file_stat.st_size,
+                notes=notes,
+                captured_mtime_ns=file_stat.st_mtime_ns
             )
 
             self.custody_records.append(record)
+            if self._jsonl_file is not None:
+                self._jsonl_file.write(
+                    dumps_json_line(self._record_to_dict(record)))
+                self._jsonl_file.flush()
             self.logger.info(
                 f"연계보관성 기록 생성: {file_path} -> {file_hash[:16]}...")
             return record
@@ -67,15 +119,96 @@ class ForensicIntegrityService:
         """SHA-256 해시 계산 (대용량 파일 지원)"""
         hash_sha256 = hashlib.sha256()
         try:
-            with open(file_path, "rb") as f:
-                # 64KB 청크로 읽어서 메모리 효율적 처리
-                for chunk in iter(lambda: f.read(65536), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+            file_stat = os.stat(file_path)
+            stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+            cached = self._hash_cache.get(file_path)
+            if cached and cached[0] == stat_key:
+                return cached[1]
+
+            if file_stat.st_size > PIPELINE_THRESHOLD_BYTES:
+                digest = self._calculate_sha256_pipelined(file_path)
+            else:
+                with open(file_path, "rb") as f:
+                    # 64KB 청크로 읽어서 메모리 효율적 처리
+                    for chunk in iter(lambda: f.read(65536), b""):
+                        hash_sha256.update(chunk)
+                digest = hash_sha256.hexdigest()
+
+            self._hash_cache[file_path] = (stat_key, digest)
+            return digest
         except Exception as e:
             self.logger.error(f"해시 계산 실패: {file_path} - {str(e)}")
             raise
 
+    def _calculate_sha256_pipelined(self, file_path: str) -> str:
+        """SHA-256 해시 계산 (읽기 스레드와 해시 계산을 이중 버퍼로 병행)"""
+        hash_sha256 = hashlib.sha256()
+        chunks: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=2)
+        errors: List[Exception] = []
+
+        def _reader():
+            try:
+                with open(file_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(PIPELINE_CHUNK_BYTES), b""):
+                        chunks.put(chunk)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                chunks.put(None)
+
+        # 파일 읽기와 hashlib.update 모두 GIL을 해제하므로 두 작업이 겹쳐 실행됨
+        reader = threading.Thread(target=_reader, daemon=True)
+        reader.start()
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                break
+            hash_sha256.update(chunk)
+        reader.join()
+
+        if errors:
+            raise errors[0]
+        return hash_sha256.hexdigest()
+
+    def copy_and_hash(self, src: str, dst: str) -> str:
+        """파일을 복사하면서 원본의 SHA-256을 계산
+
+        원본을 mmap으로 열어 별도 스레드에서 해시를 계산하는 동안 커널 복사
+        (copy_file_range)를 수행하므로, 두 작업이 같은 페이지 캐시를 공유합니다.
+        """
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                file_stat = os.fstat(fsrc.fileno())
+                if file_stat.st_size == 0:
+                    digest = hashlib.sha256().hexdigest()
+                else:
+                    with mmap.mmap(fsrc.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        result: Dict[str, object] = {}
+
+                        def _hash():
+                            try:
+                                result['digest'] = hashlib.sha256(mm).hexdigest()
+                            except Exception as e:
+                                result['error'] = e
+
+                        hasher = threading.Thread(target=_hash, daemon=True)
+                        hasher.start()
+                        try:
+                            copy_file_data(fsrc, fdst, file_stat.st_size)
+                        finally:
+                            hasher.join()
+
+                    if 'error' in result:
+                        raise result['error']
+                    digest = result['digest']
+
+            self._hash_cache[src] = (
+                (file_stat.st_mtime_ns, file_stat.st_size), digest)
+            return digest
+        except Exception as e:
+            self.logger.error(f"복사 및 해시 계산 실패: {src} -> {dst} - {str(e)}")
+            raise
+
     def verify_integrity(self, file_path: str, original_hash: str) -> bool:
         """파일 무결성 검증"""
         try:
@@ -94,6 +227,26 @@ class ForensicIntegrityService:
             self.logger.error(f"무결성 검증 중 오류: {str(e)}")
             return False
 
+    def verify_integrity_against_record(self, record: ChainOfCustodyRecord) -> bool:
+        """연계보관성 기록 기준 무결성 검증
+
+        기록 시점의 수정 시각과 크기가 그대로면 해시 계산 없이 통과시키고,
+        메타데이터가 바뀐 경우에만 SHA-256을 다시 계산합니다.
+        """
+        try:
+            file_stat = os.stat(record.file_path)
+        except OSError as e:
+            self.logger.error(f"무결성 검증 중 오류: {str(e)}")
+            return False
+
+        if (record.captured_mtime_ns is not None and
+                file_stat.st_mtime_ns == record.captured_mtime_ns and
+                file_stat.st_size == record.file_size):
+            self.logger.info(f"무결성 검증 성공 (메타데이터 일치): {record.file_path}")
+            return True
+
+        return self.verify_integrity(record.file_path, record.original_hash)
+
     def export_custody_log(self, output_path: str = None) -> str:
         """연계보관성 로그 내보내기"""
         if not output_path:
@@ -103,30 +256,24 @@ class ForensicIntegrityService:
         # 출력 디렉토리 생성
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
+        # 저널이 있으면 이미 직렬화된 이번 세션의 레코드를 그대로 사용
+        if self._jsonl_path:
+            records = read_json_lines(self._jsonl_path, self._jsonl_start)
+        else:
+            records = [self._record_to_dict(record)
+                       for record in self.custody_records]
+
         custody_data = {
             'report_info': {
                 'generated_at': datetime.datetime.utcnow().isoformat() + "Z",
                 'generator': 'Email Evidence Processor v2.0',
-                'total_records': len(self.custody_records)
+                'total_records': len(records)
             },
-            'records': [
-                {
-                    'original_hash': record.original_hash,
-                    'timestamp': record.timestamp,
-                    'collector': record.collector,
-                    'system_info': record.system_info,
-                    'verification_status': record.verification_status,
-                    'file_path': record.file_path,
-                    'file_size_bytes': record.file_size,
-                    'notes': record.notes
-                }
-                for record in self.custody_records
-            ]
+            'records': records
         }
 
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(custody_data, f, indent=2, ensure_ascii=False)
+            write_json(output_path, custody_data)
 
             self.logger.info(f"연계보관성 로그 저장: {output_path}")
             return output_path
@@ -134,6 +281,20 @@ class ForensicIntegrityService:
             self.logger.error(f"연계보관성 로그 저장 실패: {str(e)}")
             raise
 
+    @staticmethod
+    def _record_to_dict(record: ChainOfCustodyRecord) -> Dict:
+        """내보내기용 레코드 딕셔너리"""
+        return {
+            'original_hash': record.original_hash,
+            'timestamp': record.timestamp,
+            'collector': record.collector,
+            'system_info': record.system_info,
+            'verification_status': record.verification_status,
+            'file_path': record.file_path,
+            'file_size_bytes': record.file_size,
+            'notes': record.notes
+        }
+
     def get_custody_summary(self) -> Dict:
         """연계보관성 요약 정보"""
         if not self.custody_records:
@@ -1,58 +1,83 @@
 # src/mail_parser/formatter.py
 
+import html
 import os
+import re
+from xml.sax.saxutils import escape
 
 from reportlab.lib.enums import TA_CENTER
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer
 
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+# 폰트 경로는 MAIL_PARSER_FONT 환경 변수로 지정할 수 있습니다.
+_DEFAULT_FONT_PATH = r'C:\dev\python-email\email_files\NanumGothic.ttf'
+_FONT_NAME = None
+
+
+def _register_font() -> str:
+    """한글 폰트를 프로세스당 한 번만 등록하고 사용할 폰트 이름을 반환합니다."""
+    global _FONT_NAME
+    if _FONT_NAME is not None:
+        return _FONT_NAME
+
+    try:
+        if 'NanumGothic' in pdfmetrics.getRegisteredFontNames():
+            _FONT_NAME = 'NanumGothic'
+            return _FONT_NAME
+
+        font_path = os.environ.get('MAIL_PARSER_FONT', _DEFAULT_FONT_PATH)
+        if not os.path.exists(font_path):
+            # 폰트 파일이 없으면 경고 메시지를 출력하고 기본 폰트를 사용합니다.
+            print(f"경고: 폰트 파일 '{font_path}'을(를) 찾을 수 없습니다. 기본 폰트를 사용합니다.")
+            _FONT_NAME = 'Helvetica'
+        else:
+            pdfmetrics.registerFont(TTFont('NanumGothic', font_path))
+            _FONT_NAME = 'NanumGothic'
+    except Exception as e:
+        print(f"경고: 폰트 등록 중 오류 발생: {e}. 기본 폰트를 사용합니다.")
+        _FONT_NAME = 'Helvetica'  # Fallback to a default font
+
+    return _FONT_NAME
+
 
 class CourtFormatter:
     def __init__(self):
-        try:
-            # 폰트 파일이 현재 디렉토리에 있다고 가정합니다.
-            # 실제 배포 시에는 폰트 경로를 적절히 설정해야 합니다.
-            font_path = r'C:\dev\python-email\email_files\NanumGothic.ttf'
-            if not os.path.exists(font_path):
-                # 폰트 파일이 없으면 경고 메시지를 출력하고 기본 폰트를 사용합니다.
-                print(f"경고: 폰트 파일 '{font_path}'을(를) 찾을 수 없습니다. 기본 폰트를 사용합니다.")
-                self.font_name = 'Helvetica'
-            else:
-                pdfmetrics.registerFont(TTFont('NanumGothic', font_path))
-                self.font_name = 'NanumGothic'
-        except Exception as e:
-            print(f"경고: 폰트 등록 중 오류 발생: {e}. 기본 폰트를 사용합니다.")
-            self.font_name = 'Helvetica'  # Fallback to a default font
+        self.font_name = _register_font()
+
+        # 스타일은 PDF마다 다시 만들 필요가 없으므로 한 번만 생성
+        normal_style = getSampleStyleSheet()['Normal']
+        self.evidence_style = ParagraphStyle(
+            'EvidenceNumber', parent=normal_style,
+            alignment=TA_CENTER, fontName=self.font_name, fontSize=14)
+        self.body_style = ParagraphStyle(
+            'EvidenceBody', parent=normal_style,
+            fontName=self.font_name, fontSize=10)
 
     def to_pdf(self, html_content, output_filepath, evidence_number):
         doc = SimpleDocTemplate(output_filepath, pagesize=letter)
-        styles = getSampleStyleSheet()
-
-        evidence_style = styles['Normal']
-        evidence_style.alignment = TA_CENTER
-        evidence_style.fontName = self.font_name
-        evidence_style.fontSize = 14
+        evidence_style = self.evidence_style
+        body_style = self.body_style
 
         story = []
 
         story.append(Paragraph(evidence_number, evidence_style))
         story.append(Spacer(1, 0.2 * inch))
 
-        import re
-        text_content = re.sub(r'<[^>]+>', '', html_content)
-
-        body_style = styles['Normal']
-        body_style.fontName = self.font_name
-        body_style.fontSize = 10
+        text_content = _TAG_RE.sub('', html_content)
 
-        for line in text_content.split('\n'):
-            if line.strip():
-                story.append(Paragraph(line, body_style))
-                story.append(Spacer(1, 0.05 * inch))
+        # 줄마다 Paragraph/Spacer를 만들지 않고 <br/>로 이어 단일 Paragraph로 배치
+        body_text = '<br/>'.join(
+            escape(html.unescape(line))
+            for line in text_content.split('\n') if line.strip())
+        if body_text:
+            story.append(Paragraph(body_text, body_style))
 
         try:
             print(f"PDF 생성을 시도 중: {output_filepath}")
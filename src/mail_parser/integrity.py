@@ -1,10 +1,35 @@
 # src/mail_parser/integrity.py
 
+import functools
 import hashlib
-import json
+import logging
 import os
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from .json_utils import write_json
+
+# 해시 캐시에 보관할 최대 문자열 길이 (큰 본문이 캐시 키로 메모리에 남지 않도록)
+CONTENT_HASH_CACHE_MAX_CHARS = 64 * 1024
+
+
+def _content_hash(content: str, algorithm: str) -> str:
+    """문자열 해시 계산 (짧은 내용은 반복 시 캐시 사용)"""
+    if len(content) <= CONTENT_HASH_CACHE_MAX_CHARS:
+        return _cached_content_hash(content, algorithm)
+    return _compute_content_hash(content, algorithm)
+
+
+def _compute_content_hash(content: str, algorithm: str) -> str:
+    """문자열 해시 계산"""
+    if algorithm == 'sha256':
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    hash_obj = hashlib.new(algorithm)
+    hash_obj.update(content.encode('utf-8'))
+    return hash_obj.hexdigest()
+
+
+_cached_content_hash = functools.lru_cache(maxsize=4096)(_compute_content_hash)
 
 
 class IntegrityManager:
@@ -16,6 +41,7 @@ class IntegrityManager:
         self.output_dir = output_dir
         self.integrity_log = []
         self.hash_records = {}
+        self.logger = logging.getLogger('mail_parser.integrity')
 
     def calculate_file_hash(self, filepath: str, algorithm: str = 'sha256') -> Optional[str]:
         """
@@ -36,12 +62,14 @@ class IntegrityManager:
                     hash_obj.update(chunk)
 
             hash_value = hash_obj.hexdigest()
+            file_stat = os.stat(filepath)
 
             # 해시 기록 저장
             self.hash_records[filepath] = {
                 'algorithm': algorithm,
                 'hash': hash_value,
-                'size': os.path.getsize(filepath),
+                'size': file_stat.st_size,
+                'mtime_ns': file_stat.st_mtime_ns,
                 'timestamp': datetime.now().isoformat(),
                 'filename': os.path.basename(filepath)
             }
@@ -52,13 +80,36 @@ class IntegrityManager:
             self._log_error(f"해시 계산 실패: {filepath} - {str(e)}")
             return None
 
+    def calculate_file_hashes(self, filepath: str,
+                              algorithms: Tuple[str, ...] = ('sha256', 'md5')) -> Dict[str, str]:
+        """
+        한 번의 파일 읽기로 여러 알고리즘의 해시값을 함께 계산합니다.
+
+        Args:
+            filepath: 해시를 계산할 파일 경로
+            algorithms: 계산할 해시 알고리즘 목록
+
+        Returns:
+            알고리즘: 해시값 딕셔너리 (오류 시 빈 딕셔너리)
+        """
+        try:
+            hash_objs = {alg: hashlib.new(alg) for alg in algorithms}
+            with open(filepath, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b""):
+                    for hash_obj in hash_objs.values():
+                        hash_obj.update(chunk)
+
+            return {alg: hash_obj.hexdigest() for alg, hash_obj in hash_objs.items()}
+
+        except Exception as e:
+            self._log_error(f"해시 계산 실패: {filepath} - {str(e)}")
+            return {}
+
     def calculate_content_hash(self, content: str, algorithm: str = 'sha256') -> str:
         """
         문자열 내용의 해시값을 계산합니다.
         """
-        hash_obj = hashlib.new(algorithm)
-        hash_obj.update(content.encode('utf-8'))
-        return hash_obj.hexdigest()
+        return _content_hash(content, algorithm)
 
     def verify_file_integrity(self, filepath: str, expected_hash: str, algorithm: str = 'sha256') -> bool:
         """
@@ -72,7 +123,9 @@ class IntegrityManager:
         Returns:
             무결성 검증 결과 (True/False)
         """
-        current_hash = self.calculate_file_hash(filepath, algorithm)
+        current_hash = self._get_recorded_hash(filepath, algorithm)
+        if current_hash is None:
+            current_hash = self.calculate_file_hash(filepath, algorithm)
 
         if current_hash is None:
             return False
@@ -83,6 +136,24 @@ class IntegrityManager:
 
         return is_valid
 
+    def _get_recorded_hash(self, filepath: str, algorithm: str) -> Optional[str]:
+        """
+        직전에 계산한 해시가 있고 파일 크기와 수정 시각이 그대로면 그 값을 반환합니다.
+        """
+        record = self.hash_records.get(filepath)
+        if not record or record['algorithm'] != algorithm:
+            return None
+
+        try:
+            file_stat = os.stat(filepath)
+        except OSError:
+            return None
+
+        if (file_stat.st_size == record['size'] and
+                file_stat.st_mtime_ns == record.get('mtime_ns')):
+            return record['hash']
+        return None
+
     def generate_integrity_report(self, report_path: Optional[str] = None) -> str:
         """
         무결성 검증 보고서를 생성합니다.
@@ -110,8 +181,7 @@ class IntegrityManager:
         os.makedirs(os.path.dirname(report_path), exist_ok=True)
 
         try:
-            with open(report_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2, ensure_ascii=False)
+            write_json(report_path, report_data)
 
             self._log_info(f"무결성 보고서 생성 완료: {report_path}")
             return report_path
@@ -199,16 +269,16 @@ class IntegrityManager:
 
     def _log_info(self, message: str):
         """정보 로그 기록"""
-        print(f"[무결성] {message}")
+        self.logger.info(f"[무결성] {message}")
 
     def _log_error(self, message: str):
         """오류 로그 기록"""
-        print(f"[무결성 오류] {message}")
+        self.logger.error(f"[무결성 오류] {message}")
 
     def _log_verification(self, filepath: str, expected: str, actual: str, is_valid: bool):
         """검증 로그 기록"""
         status = "성공" if is_valid else "실패"
-        print(f"[무결성 검증] {os.path.basename(filepath)}: {status}")
+        self.logger.info(f"[무결성 검증] {os.path.basename(filepath)}: {status}")
 
         verification_entry = {
             'timestamp': datetime.now().isoformat(),
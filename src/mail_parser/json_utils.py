@@ -0,0 +1,68 @@
+"""
+JSON serialization utilities.
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Iterator, List, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(data: Any) -> bytes:
+    """들여쓰기된 UTF-8 JSON 바이트를 반환합니다 (orjson이 있으면 사용)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def dumps_json_line(data: Any) -> bytes:
+    """한 줄짜리 JSON 레코드(JSONL용, 개행 포함)를 반환합니다."""
+    if ORJSON_AVAILABLE:
+        # 개행도 orjson이 함께 기록 (bytes 연결로 인한 복사 없음)
+        return orjson.dumps(
+            data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def write_json(file_path: Union[str, Path], data: Any) -> None:
+    """JSON 파일을 저장합니다."""
+    with open(file_path, 'wb') as f:
+        f.write(dumps_json(data))
+
+
+def write_json_gz(file_path: Union[str, Path], data: Any, compresslevel: int = 1) -> None:
+    """gzip으로 압축된 JSON 파일을 저장합니다 (기본 압축 수준 1: 속도 우선)."""
+    with gzip.open(file_path, 'wb', compresslevel=compresslevel) as f:
+        f.write(dumps_json(data))
+
+
+def read_json(file_path: Union[str, Path]) -> Any:
+    """JSON 파일을 읽습니다."""
+    with open(file_path, 'rb') as f:
+        content = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content.decode('utf-8'))
+
+
+def iter_json_lines(file_path: Union[str, Path], start: int = 0) -> Iterator[Any]:
+    """JSONL 파일의 레코드를 한 줄씩 읽어 반환합니다 (start: 읽기 시작할 바이트 위치)."""
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    with open(file_path, 'rb') as f:
+        if start:
+            f.seek(start)
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def read_json_lines(file_path: Union[str, Path], start: int = 0) -> List[Any]:
+    """JSONL 파일의 모든 레코드를 읽습니다 (start: 읽기 시작할 바이트 위치)."""
+    return list(iter_json_lines(file_path, start))
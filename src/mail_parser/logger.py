@@ -1,13 +1,61 @@
 # src/mail_parser/logger.py
 import logging
+import logging.handlers
 import os
-from datetime import datetime
 
+# 이미 구성된 로거: 이름 -> (로거, 로그 디렉토리 절대 경로, log_queue)
+# (같은 인자로 반복 호출 시 핸들러를 다시 만들지 않음)
+_LOGGERS = {}
 
-def setup_logger(name='mail_parser', log_dir='logs'):
+
+def _close_handlers(logger):
+    """
+    로거의 핸들러를 모두 닫고 제거합니다.
+    MemoryHandler는 close()가 버퍼만 flush하고 대상 핸들러는 닫지 않으므로 대상도 함께 닫습니다.
+    """
+    for handler in list(logger.handlers):
+        # MemoryHandler.close()가 target을 None으로 바꾸므로 먼저 보관
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
+    logger.handlers.clear()
+
+
+def setup_logger(name='mail_parser', log_dir='logs', log_queue=None):
     """
     메일 파서용 로깅 시스템 설정
+
+    같은 이름과 인자로 다시 호출하면 기존 로거를 그대로 반환하고,
+    log_dir 또는 log_queue가 달라지면 경고 후 새 인자로 다시 구성합니다.
+    log_queue를 지정하면(워커 프로세스용) 파일/콘솔 대신 QueueHandler로
+    기록을 보내며, 부모 프로세스에서 start_log_listener로 받아 기록합니다.
     """
+    log_dir_abs = os.path.abspath(log_dir)
+    cached = _LOGGERS.get(name)
+    if cached is not None:
+        cached_logger, cached_dir, cached_queue = cached
+        if cached_queue is log_queue and (log_queue is not None or cached_dir == log_dir_abs):
+            return cached_logger
+
+    logger = _configure_logger(name, log_dir, log_queue)
+    _LOGGERS[name] = (logger, log_dir_abs, log_queue)
+    if cached is not None:
+        logger.warning(f"로거 '{name}' 설정 변경: 로그 디렉토리 {cached[1]} -> {log_dir_abs}, "
+                       f"큐 사용 {cached[2] is not None} -> {log_queue is not None}")
+    return logger
+
+
+def _configure_logger(name, log_dir, log_queue):
+    """로거 핸들러를 (다시) 구성합니다."""
+    if log_queue is not None:
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.DEBUG)
+        _close_handlers(logger)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger.propagate = False
+        return logger
+
     # 로그 디렉토리 생성
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -16,15 +64,15 @@ def setup_logger(name='mail_parser', log_dir='logs'):
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
 
-    # 기존 핸들러 제거 (중복 방지)
-    if logger.handlers:
-        logger.handlers.clear()
+    # 기존 핸들러 제거 (중복 방지, 버퍼링된 기록이 유실되지 않도록 닫으면서 flush)
+    _close_handlers(logger)
 
-    # 파일 핸들러 - 상세 로그
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_filename = f"mail_parser_{timestamp}.log"
-    file_handler = logging.FileHandler(
+    # 파일 핸들러 - 상세 로그 (실행마다 새 파일 대신 크기 기준 순환)
+    log_filename = f"{name}.log"
+    file_handler = logging.handlers.RotatingFileHandler(
         os.path.join(log_dir, log_filename),
+        maxBytes=50_000_000,
+        backupCount=5,
         encoding='utf-8'
     )
     file_handler.setLevel(logging.DEBUG)
@@ -44,13 +92,32 @@ def setup_logger(name='mail_parser', log_dir='logs'):
     file_handler.setFormatter(detailed_formatter)
     console_handler.setFormatter(simple_formatter)
 
+    # 파일 기록은 메모리에 모아 두었다가 일괄 기록 (ERROR 이상은 즉시 기록)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    buffered_file_handler.setLevel(logging.DEBUG)
+
     # 핸들러 추가
-    logger.addHandler(file_handler)
+    logger.addHandler(buffered_file_handler)
     logger.addHandler(console_handler)
-
     return logger
 
 
+def start_log_listener(log_queue, name='mail_parser', log_dir='logs'):
+    """
+    워커 프로세스들이 log_queue로 보낸 기록을 부모 프로세스의 로거 핸들러로
+    전달하는 QueueListener를 시작합니다. 종료 시 listener.stop()을 호출하세요.
+    """
+    logger = setup_logger(name, log_dir)
+    listener = logging.handlers.QueueListener(
+        log_queue, *logger.handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
 def log_processing_step(logger, step, message, level='info'):
     """
     처리 단계별 로깅 헬퍼 함수
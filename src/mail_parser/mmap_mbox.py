@@ -0,0 +1,130 @@
+# src/mail_parser/mmap_mbox.py
+"""
+mmap 기반 mbox 리더.
+
+파일을 메모리 매핑한 뒤 'From ' 구분선 위치만 한 번에 찾아 메시지 오프셋 목록을 만들고,
+각 메시지는 조회할 때만 파싱합니다. (mailbox.mbox와 같은 정수 키 0..N-1 사용)
+"""
+
+import email
+import mmap
+import re
+from email.message import Message
+from email.parser import BytesHeaderParser
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+# 줄 맨 앞의 'From ' 구분선 (mailbox.mbox와 같은 판정 기준)
+_FROM_LINE_RE = re.compile(rb'(?m)^From ')
+# 원본 메시지를 파일로 복사할 때의 청크 크기
+COPY_CHUNK_BYTES = 64 * 1024
+# 헤더와 본문을 구분하는 첫 빈 줄
+_HEADER_END_RE = re.compile(rb'\r?\n\r?\n')
+# 커널 미리 읽기 힌트 (madvise, Unix 전용) 지원 여부
+_HAS_MADVISE = hasattr(mmap.mmap, 'madvise') and hasattr(mmap, 'MADV_WILLNEED')
+
+
+class MMapMbox:
+    """메모리 매핑된 mbox 파일의 메시지를 오프셋으로 조회하는 읽기 전용 컨테이너"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self.mm: Optional[mmap.mmap] = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 매핑할 수 없음
+            self.mm = None
+
+        # (메시지 시작, 메시지 끝) 오프셋 - 'From ' 줄과 구분용 빈 줄은 제외
+        self.offsets: List[Tuple[int, int]] = []
+        if self.mm is not None:
+            self._build_offsets()
+
+    def _build_offsets(self) -> None:
+        mm = self.mm
+        starts = [m.start() for m in _FROM_LINE_RE.finditer(mm)]
+        ends = starts[1:] + [len(mm)]
+        for start, end in zip(starts, ends):
+            body_start = mm.find(b'\n', start, end)
+            body_start = end if body_start == -1 else body_start + 1
+            # 다음 'From ' 앞의 구분용 빈 줄 제외
+            if end - body_start >= 2 and mm[end - 2:end] == b'\n\n':
+                end -= 1
+            self.offsets.append((body_start, end))
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, int) and 0 <= key < len(self.offsets)
+
+    def __getitem__(self, key) -> Message:
+        return self.get_message(key)
+
+    def keys(self) -> List[int]:
+        return list(range(len(self.offsets)))
+
+    def get_bytes(self, key: int) -> bytes:
+        """메시지 원본 바이트 ('From ' 구분선 제외)"""
+        if key not in self:
+            raise KeyError(key)
+        start, end = self.offsets[key]
+        return self.mm[start:end]
+
+    def copy_to(self, key: int, fileobj: BinaryIO) -> None:
+        """메시지 원본 바이트를 중간 bytes 복사본 없이 청크 단위로 기록합니다."""
+        if key not in self:
+            raise KeyError(key)
+        start, end = self.offsets[key]
+        view = memoryview(self.mm)
+        try:
+            for pos in range(start, end, COPY_CHUNK_BYTES):
+                fileobj.write(view[pos:min(pos + COPY_CHUNK_BYTES, end)])
+        finally:
+            view.release()
+
+    def get_message(self, key: int) -> Message:
+        return email.message_from_bytes(self.get_bytes(key))
+
+    def get_headers(self, key: int) -> Message:
+        """본문을 건너뛰고 헤더 영역만 파싱한 메시지"""
+        if key not in self:
+            raise KeyError(key)
+        start, end = self.offsets[key]
+        match = _HEADER_END_RE.search(self.mm, start, end)
+        header_end = match.end() if match else end
+        return BytesHeaderParser().parsebytes(self.mm[start:header_end])
+
+    def iter_headers(self) -> Iterator[Tuple[int, Message]]:
+        for key in range(len(self.offsets)):
+            yield key, self.get_headers(key)
+
+    def iteritems(self, readahead: int = 0) -> Iterator[Tuple[int, Message]]:
+        """
+        메시지를 순서대로 파싱하여 반환합니다.
+        readahead > 0 이면 현재 위치에서 readahead 바이트 앞까지 커널에 미리 읽기를
+        요청하여 (MADV_WILLNEED) 파싱하는 동안 디스크 읽기가 함께 진행되도록 합니다.
+        """
+        if readahead <= 0 or self.mm is None or not _HAS_MADVISE:
+            for key in range(len(self.offsets)):
+                yield key, self.get_message(key)
+            return
+
+        self.mm.madvise(mmap.MADV_SEQUENTIAL)
+        size = len(self.mm)
+        advised_end = 0
+        for key, (start, end) in enumerate(self.offsets):
+            if end > advised_end:
+                # madvise 시작 위치는 페이지 경계여야 함
+                advise_start = start - start % mmap.PAGESIZE
+                advised_end = min(size, max(end, start + readahead))
+                self.mm.madvise(mmap.MADV_WILLNEED, advise_start,
+                                advised_end - advise_start)
+            yield key, self.get_message(key)
+
+    def close(self) -> None:
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+        self._file.close()
@@ -2,9 +2,9 @@
 Evidence data model for court submission.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from pathlib import Path
 from enum import Enum
 
@@ -23,7 +23,7 @@ class EvidenceStatus(Enum):
     ERROR = "error"          # 오류
 
 
-@dataclass
+@dataclass(slots=True)
 class EvidenceModel:
     """법정 증거 데이터 모델"""
 
@@ -41,7 +41,7 @@ class EvidenceModel:
     original_file: Optional[Path] = None
     html_file: Optional[Path] = None
     pdf_file: Optional[Path] = None
-    attachment_files: List[Path] = None
+    attachment_files: Set[Path] = None
 
     # 처리 정보
     status: EvidenceStatus = EvidenceStatus.PENDING
@@ -62,33 +62,54 @@ class EvidenceModel:
     tags: List[str] = None
     notes: Optional[str] = None
 
+    # 파생 값 캐시 (직렬화/비교 대상 아님)
+    _evidence_label: str = field(default='', init=False, repr=False, compare=False)
+    _evidence_number: str = field(default='', init=False, repr=False, compare=False)
+    _completion_cache: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """초기화 후 처리"""
         if self.attachment_files is None:
-            self.attachment_files = []
+            self.attachment_files = set()
+        elif not isinstance(self.attachment_files, set):
+            self.attachment_files = set(self.attachment_files)
         if self.tags is None:
             self.tags = []
         if self.created_date is None:
             self.created_date = datetime.now()
 
+        self._evidence_label = f"{self.evidence_type.value} 제{self.evidence_sequence}호증"
+        self._evidence_number = f"{self.evidence_type.value}{self.evidence_sequence}"
+
     @property
     def evidence_label(self) -> str:
         """증거 라벨 반환 (예: 갑 제1호증)"""
-        return f"{self.evidence_type.value} 제{self.evidence_sequence}호증"
+        return self._evidence_label
 
     @property
     def evidence_number(self) -> str:
         """증거 번호 반환 (예: 갑1)"""
-        return f"{self.evidence_type.value}{self.evidence_sequence}"
+        return self._evidence_number
 
     @property
     def is_complete(self) -> bool:
-        """증거가 완전한지 확인"""
-        return (
+        """증거가 완전한지 확인 (상태/파일 경로가 바뀔 때만 파일 존재 여부 재확인)"""
+        cache_key = (self.status, self.html_file, self.pdf_file)
+        if self._completion_cache is None or self._completion_cache[0] != cache_key:
+            return self.refresh_completion()
+        return self._completion_cache[1]
+
+    def refresh_completion(self) -> bool:
+        """파일 존재 여부를 다시 확인하여 완료 상태를 갱신"""
+        is_complete = bool(
             self.status == EvidenceStatus.COMPLETED and
             self.html_file and self.html_file.exists() and
             self.pdf_file and self.pdf_file.exists()
         )
+        self._completion_cache = (
+            (self.status, self.html_file, self.pdf_file), is_complete)
+        return is_complete
 
     @property
     def has_attachments(self) -> bool:
@@ -102,13 +123,11 @@ class EvidenceModel:
 
     def add_attachment(self, file_path: Path) -> None:
         """첨부파일 추가"""
-        if file_path not in self.attachment_files:
-            self.attachment_files.append(file_path)
+        self.attachment_files.add(file_path)
 
     def remove_attachment(self, file_path: Path) -> None:
         """첨부파일 제거"""
-        if file_path in self.attachment_files:
-            self.attachment_files.remove(file_path)
+        self.attachment_files.discard(file_path)
 
     def mark_completed(self) -> None:
         """처리 완료로 표시"""
@@ -140,7 +159,7 @@ class EvidenceModel:
             'original_file': str(self.original_file) if self.original_file else None,
             'html_file': str(self.html_file) if self.html_file else None,
             'pdf_file': str(self.pdf_file) if self.pdf_file else None,
-            'attachment_files': [str(f) for f in self.attachment_files],
+            'attachment_files': sorted(str(f) for f in self.attachment_files),
             'status': self.status.value,
             'created_date': self.created_date.isoformat(),
             'processed_date': self.processed_date.isoformat() if self.processed_date else None,
@@ -172,7 +191,7 @@ class EvidenceModel:
             'original_file') else None
         html_file = Path(data['html_file']) if data.get('html_file') else None
         pdf_file = Path(data['pdf_file']) if data.get('pdf_file') else None
-        attachment_files = [Path(f) for f in data.get('attachment_files', [])]
+        attachment_files = {Path(f) for f in data.get('attachment_files', [])}
 
         return cls(
             evidence_id=data['evidence_id'],
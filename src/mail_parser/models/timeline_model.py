@@ -4,10 +4,24 @@ Timeline data model for email visualization.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Set
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Set, Tuple
 from enum import Enum
 
 
+@lru_cache(maxsize=65536)
+def _wall_clock_keys(timestamp: datetime) -> Tuple[str, str]:
+    return timestamp.date().isoformat(), timestamp.time().isoformat('seconds')
+
+
+def _timestamp_keys(timestamp: datetime) -> Tuple[str, str]:
+    """타임스탬프의 ("YYYY-MM-DD", "HH:MM:SS") 문자열 (같은 시각은 캐시 사용, strftime 미사용)"""
+    # 시간대가 다른 같은 순간은 서로 같다고 비교되므로, 표시되는 벽시계 시각으로 캐시
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.replace(tzinfo=None)
+    return _wall_clock_keys(timestamp)
+
+
 class TimelineEventType(Enum):
     """타임라인 이벤트 유형"""
     EMAIL_SENT = "email_sent"
@@ -47,6 +61,45 @@ class TimelineEvent:
         if self.metadata is None:
             self.metadata = {}
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # 필드가 바뀌면 캐시한 웹용 딕셔너리 폐기
+        object.__setattr__(self, name, value)
+        self.__dict__.pop('_web_dicts', None)
+
+    def to_web_dict(self, iso_timestamp: bool = False) -> Dict[str, Any]:
+        """
+        웹 응답용 이벤트 딕셔너리 (시각은 'time': HH:MM:SS, iso_timestamp이면 'timestamp': ISO 형식).
+        처음 만든 딕셔너리를 캐시해 두고 그 사본을 반환합니다.
+        """
+        web_dicts = self.__dict__.setdefault('_web_dicts', {})
+        web_dict = web_dicts.get(iso_timestamp)
+        if web_dict is None:
+            if iso_timestamp:
+                time_item = ('timestamp', self.timestamp.isoformat())
+            else:
+                time_item = ('time', self.time_key)
+            web_dict = web_dicts[iso_timestamp] = dict((
+                ('id', self.event_id),
+                ('type', self.event_type.value),
+                time_item,
+                ('title', self.title),
+                ('description', self.description),
+                ('participants', self.participants),
+                ('attachments', self.attachments),
+                ('metadata', self.metadata),
+            ))
+        return web_dict.copy()
+
+    @property
+    def date_key(self) -> str:
+        """이벤트 날짜 문자열 (YYYY-MM-DD)"""
+        return _timestamp_keys(self.timestamp)[0]
+
+    @property
+    def time_key(self) -> str:
+        """이벤트 시각 문자열 (HH:MM:SS)"""
+        return _timestamp_keys(self.timestamp)[1]
+
 
 @dataclass
 class TimelineModel:
@@ -128,10 +181,10 @@ class TimelineModel:
 
     def get_events_by_date(self, target_date: datetime) -> List[TimelineEvent]:
         """특정 날짜의 이벤트 조회"""
-        target_str = target_date.strftime("%Y-%m-%d")
+        target_str = _timestamp_keys(target_date)[0]
         return [
             event for event in self.events
-            if event.timestamp.strftime("%Y-%m-%d") == target_str
+            if event.date_key == target_str
         ]
 
     def get_events_by_type(self, event_type: TimelineEventType) -> List[TimelineEvent]:
@@ -1,12 +1,341 @@
 # src/mail_parser/packaging.py
 
-import json
+import hashlib
 import os
-import shutil
+import sys
+import tarfile
+import time
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from .json_utils import dumps_json
+from .performance import EmailProcessingOptimizer
+
+# 이 크기 이하 파일은 작업 스레드에서 미리 압축 (초과 파일은 zipfile 스트리밍)
+PARALLEL_COMPRESS_MAX_BYTES = 32 * 1024 * 1024
+# 미리 압축 중이거나 기록을 기다리는 파일의 원본 크기 합 상한 (CPU 수와 무관한 메모리 한도)
+PARALLEL_PENDING_MAX_BYTES = 4 * PARALLEL_COMPRESS_MAX_BYTES
+# 증거 파일 대부분이 이미 압축된 형식이므로 압축률보다 속도를 우선
+COMPRESS_LEVEL = 1
+READ_CHUNK_BYTES = 1024 * 1024
+# 메일 폴더 탐색 스레드 수 상한
+WALK_MAX_WORKERS = 16
+# 대용량이 아닌 패키지의 압축 스레드 수 (CPU를 모두 점유할 만큼 작업이 많지 않음)
+SMALL_PACKAGE_WORKERS = 2
+
+# 자체적으로 압축된 형식 (다시 deflate해도 크기가 거의 줄지 않으므로 그대로 저장)
+_STORED_EXTS = frozenset(
+    {'.pdf', '.jpg', '.jpeg', '.png', '.zip', '.docx', '.xlsx'})
+
+# os.sendfile로 일반 파일 간 복사가 가능한 플랫폼 (macOS 등은 소켓 대상만 지원)
+SENDFILE_SUPPORTED = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+# 이 크기 미만의 첨부파일은 하나의 tar로 묶어 ZIP 멤버 수를 줄임
+SMALL_ATTACHMENT_BYTES = 1024 * 1024
+ATTACHMENT_BUNDLE_NAME = "02_첨부파일/attachments.tar"
+_ATTACHMENT_PREFIX = "02_첨부파일/"
+
+# 패키지에 포함되는 SHA-256 목록 파일 (sha256sum 형식)
+HASH_MANIFEST_NAME = "hashes.sha256"
+
+# 첨부파일로 간주하는 확장자
+_ATTACHMENT_EXTS = frozenset(
+    {'.pdf', '.doc', '.docx', '.xls', '.xlsx', '.jpg', '.png', '.zip'})
+
+
+# README/체크리스트 템플릿 (format_map으로 채움)
+_README_TEMPLATE = """# {case_name} - 증거 자료 패키지
+
+## 📋 패키지 정보
+
+- **생성일시**: {created_at}
+- **당사자**: {party}
+- **총 증거 폴더**: {folder_count}개
+- **총 파일 수**: {total_files}개
+
+## 📁 디렉토리 구조
+
+### 01_증거파일/
+법원 제출용 PDF 증거 파일들이 저장되어 있습니다.
+- 각 PDF 파일 상단에 "{party} 제○호증" 증거번호가 표기되어 있습니다.
+- 파일명은 [날짜]_메일제목 형식으로 구성되어 있습니다.
+
+### 02_첨부파일/
+원본 첨부파일들이 저장되어 있습니다.
+- 모든 첨부파일은 원본 그대로 보존되었습니다.
+- 파일명 앞에 해당 메일 폴더명이 접두어로 붙어있습니다.
+- 1MB 미만의 작은 첨부파일들은 attachments.tar 하나로 묶여 있습니다.
+  (hashes.sha256에는 묶인 파일마다 개별 해시가 기록되어 있으므로 02_첨부파일/ 안에 풀어 검증할 수 있습니다.)
+
+### 03_보고서/
+증거목록 및 처리 보고서가 저장되어 있습니다.
+- Excel 형태의 증거목록이 포함되어 있습니다.
+- 처리 통계 및 제외된 메일 목록을 확인할 수 있습니다.
+
+## ⚖️ 법원 제출 시 유의사항
+
+1. **증거번호 확인**: 각 PDF 파일의 증거번호가 올바르게 표기되어 있는지 확인하세요.
+2. **첨부파일 원본성**: 첨부파일들은 원본 그대로 보존되어 있습니다.
+3. **무결성 검증**: 필요시 해시값을 통한 무결성 검증이 가능합니다.
+4. **처리 로그**: 모든 처리 과정이 로그로 기록되어 있습니다.
+
+## 📞 문의사항
+
+이 증거 자료에 대한 문의사항이 있으시면 담당 법무팀에 연락하시기 바랍니다.
+
+---
+*이 패키지는 법원 제출용 메일박스 증거 분류 시스템에 의해 자동 생성되었습니다.*
+"""
+
+_CHECKLIST_TEMPLATE = """
+# 법원 제출용 증거 자료 체크리스트
+
+## 📦 패키지 정보
+- 파일명: {package_name}
+- 생성일시: {created_at}
+- 파일크기: {total_size_mb:.2f}MB
+
+## ✅ 제출 전 확인사항
+
+### 1. 파일 무결성
+□ ZIP 파일이 정상적으로 압축되었는가?
+□ 압축 해제 시 모든 파일이 정상 확인되는가?
+□ 각 증거 파일의 증거번호가 올바르게 표기되었는가?
+
+### 2. 증거 내용
+□ 사건과 관련된 메일들만 포함되어 있는가?
+□ 관련 없는 메일들이 적절히 제외되었는가?
+□ 첨부파일들이 모두 포함되어 있는가?
+
+### 3. 형식 준수
+□ PDF 파일 상단에 증거번호가 중앙 정렬로 표기되었는가?
+□ 첨부파일들이 원본 그대로 보존되었는가?
+□ Excel 증거목록이 포함되어 있는가?
+
+### 4. 법적 요구사항
+□ 디지털 포렌식 무결성이 확보되었는가?
+□ 체인 오브 커스터디가 유지되었는가?
+□ 처리 과정 로그가 기록되었는가?
+
+### 5. 최종 확인
+□ 법무팀 검토가 완료되었는가?
+□ 제출할 법원 및 사건번호가 올바른가?
+□ 제출 기한 내에 준비가 완료되었는가?
+
+## 📝 제출 정보
+- 제출 법원: ________________
+- 사건번호: ________________
+- 제출일자: ________________
+- 담당자: ________________
+
+---
+*모든 항목을 확인한 후 법원에 제출하시기 바랍니다.*
+"""
+
+
+def _get_compress_type(file_name: str) -> int:
+    """파일 확장자에 따른 ZIP 압축 방식"""
+    if os.path.splitext(file_name)[1].lower() in _STORED_EXTS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _compress_file(src: str, compress_type: int) -> Tuple[bytes, int, int, str]:
+    """
+    파일을 ZIP 멤버 데이터로 변환합니다 (ZIP_DEFLATED면 raw deflate 스트림).
+    zlib과 hashlib은 처리 중 GIL을 해제하므로 여러 스레드에서 동시에 실행됩니다.
+
+    Returns:
+        (멤버 데이터, CRC32, 원본 크기, SHA-256)
+    """
+    compressor = None
+    if compress_type == zipfile.ZIP_DEFLATED:
+        compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    sha256 = hashlib.sha256()
+    chunks = []
+    crc = 0
+    size = 0
+    with open(src, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_BYTES), b""):
+            crc = zlib.crc32(chunk, crc)
+            sha256.update(chunk)
+            size += len(chunk)
+            chunks.append(compressor.compress(chunk) if compressor else chunk)
+    if compressor:
+        chunks.append(compressor.flush())
+    return b"".join(chunks), crc, size, sha256.hexdigest()
+
+
+def _file_crc32(src: str) -> Tuple[int, int, str]:
+    """파일의 CRC32, 크기, SHA-256을 한 번의 읽기로 계산합니다."""
+    sha256 = hashlib.sha256()
+    crc = 0
+    size = 0
+    with open(src, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_BYTES), b""):
+            crc = zlib.crc32(chunk, crc)
+            sha256.update(chunk)
+            size += len(chunk)
+    return crc, size, sha256.hexdigest()
+
+
+class _HashingWriter:
+    """기록되는 바이트의 SHA-256을 함께 계산하는 쓰기 래퍼"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        return self._fileobj.write(data)
+
+
+class _HashingReader:
+    """읽어 간 바이트의 SHA-256을 함께 계산하는 읽기 래퍼"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self.sha256.update(data)
+        return data
+
+
+def _normalized_tarinfo(tar: tarfile.TarFile, src: str, name: str) -> tarfile.TarInfo:
+    """소유자 정보(uid/gid/사용자명)를 제거한 tar 멤버 헤더를 만듭니다."""
+    tarinfo = tar.gettarinfo(src, arcname=name)
+    tarinfo.uid = tarinfo.gid = 0
+    tarinfo.uname = tarinfo.gname = ""
+    return tarinfo
+
+
+# 미리 압축한 멤버를 직접 기록할 때 쓰는 zipfile 내부 속성 (CPython 3.8~3.13에서 확인,
+# tests/test_packaging.py가 실행 중인 버전에서 존재 여부와 왕복 결과를 검사)
+_RAW_MEMBER_ATTRS = ('_writecheck', '_didModify', '_lock', 'fp', 'start_dir',
+                     'filelist', 'NameToInfo')
+
+
+def _supports_raw_members(zipf: zipfile.ZipFile) -> bool:
+    """
+    zipfile 내부 속성으로 멤버 데이터를 직접 기록할 수 있는지 확인합니다.
+    없으면 공개 API(zipf.open)만 사용하는 스트리밍 기록으로 대체합니다.
+    """
+    return all(hasattr(zipf, attr) for attr in _RAW_MEMBER_ATTRS)
+
+
+def _write_local_header(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo):
+    """
+    ZIP 멤버의 로컬 파일 헤더를 기록합니다 (zipf._lock 안에서 호출).
+    """
+    zipf._writecheck(zinfo)
+    zipf._didModify = True
+    zipf.fp.seek(zipf.start_dir)
+    zinfo.header_offset = zipf.fp.tell()
+    zip64 = (zinfo.file_size > zipfile.ZIP64_LIMIT or
+             zinfo.compress_size > zipfile.ZIP64_LIMIT)
+    zipf.fp.write(zinfo.FileHeader(zip64))
+
+
+def _register_member(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo):
+    """
+    기록을 마친 멤버를 중앙 디렉토리 목록에 추가합니다 (zipf._lock 안에서 호출).
+    """
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+    zipf.start_dir = zipf.fp.tell()
+
+
+def _write_compressed_member(zipf: zipfile.ZipFile, src: str, arc_name: str,
+                             data: bytes, crc: int, file_size: int,
+                             compress_type: int = zipfile.ZIP_DEFLATED):
+    """
+    이미 압축된 데이터를 다시 압축하지 않고 ZIP 멤버로 추가합니다.
+    (로컬 파일 헤더 + 데이터를 직접 기록하고 중앙 디렉토리는 close 시 기록됨)
+    """
+    zinfo = zipfile.ZipInfo.from_file(src, arc_name)
+    zinfo.compress_type = compress_type
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(data)
+
+    with zipf._lock:
+        _write_local_header(zipf, zinfo)
+        zipf.fp.write(data)
+        _register_member(zipf, zinfo)
+
+
+def _write_stored_member_sendfile(zipf: zipfile.ZipFile, src: str, arc_name: str) -> str:
+    """
+    큰 무압축(ZIP_STORED) 멤버를 os.sendfile로 커널 안에서 바로 복사합니다.
+    CRC를 먼저 계산해 헤더에 기록하므로 데이터 디스크립터가 필요 없습니다.
+
+    Returns:
+        원본 파일의 SHA-256
+    """
+    crc, file_size, digest = _file_crc32(src)
+
+    zinfo = zipfile.ZipInfo.from_file(src, arc_name)
+    zinfo.compress_type = zipfile.ZIP_STORED
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = file_size
+
+    with zipf._lock:
+        _write_local_header(zipf, zinfo)
+        # 버퍼를 비운 뒤 파일 디스크립터 위치에서 이어 씀
+        zipf.fp.flush()
+        data_offset = zipf.fp.tell()
+        out_fd = zipf.fp.fileno()
+
+        sent = 0
+        try:
+            with open(src, 'rb') as f:
+                in_fd = f.fileno()
+                while sent < file_size:
+                    count = os.sendfile(out_fd, in_fd, sent, file_size - sent)
+                    if count == 0:
+                        break
+                    sent += count
+
+            if sent != file_size:
+                raise IOError(f"파일 복사 중 크기가 변경되었습니다: {src}")
+        except OSError:
+            # 기록한 로컬 헤더와 일부 데이터를 되돌려 다른 방식으로 다시 기록할 수 있게 함
+            zipf.fp.seek(zinfo.header_offset)
+            zipf.fp.truncate()
+            raise
+
+        zipf.fp.seek(data_offset + sent)
+        _register_member(zipf, zinfo)
+
+    return digest
+
+
+def _write_streamed_member(zipf: zipfile.ZipFile, src: str, arc_name: str,
+                           compress_type: int) -> str:
+    """
+    큰 파일을 청크 단위로 ZIP에 기록하면서 같은 읽기에서 SHA-256을 계산합니다.
+
+    Returns:
+        원본 파일의 SHA-256
+    """
+    zinfo = zipfile.ZipInfo.from_file(src, arc_name)
+    zinfo.compress_type = compress_type
+    zinfo._compresslevel = COMPRESS_LEVEL
+
+    sha256 = hashlib.sha256()
+    with open(src, 'rb') as f, zipf.open(zinfo, 'w') as dest:
+        for chunk in iter(lambda: f.read(READ_CHUNK_BYTES), b""):
+            sha256.update(chunk)
+            dest.write(chunk)
+    return sha256.hexdigest()
 
 
 class EvidencePackager:
@@ -16,11 +345,15 @@ class EvidencePackager:
 
     def __init__(self, base_output_dir: str = "processed_emails"):
         self.base_output_dir = base_output_dir
+        created_at = datetime.now()
+        # 체크리스트에 표기할 생성일시 (create_evidence_package 호출마다 갱신)
+        self._created_at_str = created_at.strftime('%Y-%m-%d %H:%M:%S')
         self.package_info = {
-            'created_at': datetime.now().isoformat(),
+            'created_at': created_at.isoformat(),
             'packaged_folders': [],
             'total_files': 0,
-            'total_size_mb': 0
+            'total_size_mb': 0,
+            'hashes': {}
         }
 
     def create_evidence_package(self,
@@ -38,97 +371,128 @@ class EvidencePackager:
         Returns:
             생성된 패키지 파일 경로
         """
+        # 생성일시는 호출마다 한 번 계산해 메타데이터/README/체크리스트에 함께 사용
+        created_at = datetime.now()
+        created_at_str = created_at.strftime('%Y-%m-%d %H:%M:%S')
+        self.package_info['created_at'] = created_at.isoformat()
+        self._created_at_str = created_at_str
+
         if case_name is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = created_at.strftime("%Y%m%d_%H%M%S")
             case_name = f"메일증거_{party}_{timestamp}"
 
         if output_path is None:
             output_path = f"{case_name}.zip"
 
-        # 패키지 작업 디렉토리 생성
-        package_dir = f"{case_name}_package"
-        if os.path.exists(package_dir):
-            shutil.rmtree(package_dir)
-        os.makedirs(package_dir)
-
+        # 스테이징 디렉토리 없이 원본 파일을 바로 ZIP에 기록
         try:
-            # 1. 증거 파일들 구조화
-            self._organize_evidence_files(package_dir, party)
-
-            # 2. 메타데이터 및 목록 생성
-            self._create_package_metadata(package_dir, case_name, party)
-
-            # 3. README 파일 생성
-            self._create_package_readme(package_dir, case_name, party)
+            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                # 1. 증거 파일들 구조화
+                entries, bundled_entries = self._organize_evidence_files(party)
+
+                # 2. 압축 파일에 기록 (SHA-256 해시 동시 계산)
+                self._create_zip_package(zipf, entries)
+                self._create_attachment_bundle(zipf, bundled_entries)
+                self._create_hash_manifest(zipf)
+
+                # 3. 메타데이터 및 목록 생성
+                self._create_package_metadata(zipf, case_name, party)
+
+                # 4. README 파일 생성
+                self._create_package_readme(zipf, case_name, party, created_at_str)
+        except Exception:
+            # 불완전한 압축 파일은 남기지 않음
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            raise
 
-            # 4. 압축 파일 생성
-            zip_path = self._create_zip_package(package_dir, output_path)
-
-            print(f"📦 증거 패키지 생성 완료: {zip_path}")
-            return zip_path
+        # 파일 크기 계산
+        package_size_mb = os.path.getsize(output_path) / 1024 / 1024
+        self.package_info['total_size_mb'] = package_size_mb
 
-        finally:
-            # 임시 디렉토리 정리
-            if os.path.exists(package_dir):
-                shutil.rmtree(package_dir)
+        print(f"📦 증거 패키지 생성 완료: {output_path}")
+        return output_path
 
-    def _organize_evidence_files(self, package_dir: str, party: str):
+    def _organize_evidence_files(self, party: str) -> Tuple[List[Tuple[str, str, int]],
+                                                            List[Tuple[str, str, int]]]:
         """
         증거 파일들을 체계적으로 구조화합니다.
-        """
-        # 기본 디렉토리 구조 생성
-        evidence_dir = os.path.join(package_dir, "01_증거파일")
-        attachments_dir = os.path.join(package_dir, "02_첨부파일")
-        reports_dir = os.path.join(package_dir, "03_보고서")
+        os.scandir의 DirEntry 정보를 재사용하여 항목마다 stat 호출을 반복하지 않습니다.
+        SMALL_ATTACHMENT_BYTES 미만의 첨부파일은 tar 묶음 대상으로 분리합니다.
 
-        os.makedirs(evidence_dir, exist_ok=True)
-        os.makedirs(attachments_dir, exist_ok=True)
-        os.makedirs(reports_dir, exist_ok=True)
+        Returns:
+            (개별 ZIP 멤버 목록, tar로 묶을 첨부파일 목록)
+            각 항목은 (원본 경로, 압축 파일 내 경로, 파일 크기)
+        """
+        entries: List[Tuple[str, str, int]] = []
+        bundled_entries: List[Tuple[str, str, int]] = []
+        report_entries: List[Tuple[str, str, int]] = []
 
         if not os.path.exists(self.base_output_dir):
             print(f"⚠️  출력 디렉토리가 없습니다: {self.base_output_dir}")
-            return
-
-        # 처리된 메일 폴더들을 순회
-        for item in os.listdir(self.base_output_dir):
-            item_path = os.path.join(self.base_output_dir, item)
-
-            if not os.path.isdir(item_path):
-                continue
-
-            self.package_info['packaged_folders'].append(item)
-
-            # PDF 증거 파일 복사
-            pdf_dir = os.path.join(item_path, "pdf_evidence")
-            if os.path.exists(pdf_dir):
-                for pdf_file in os.listdir(pdf_dir):
-                    if pdf_file.endswith('.pdf'):
-                        src = os.path.join(pdf_dir, pdf_file)
-                        dst = os.path.join(evidence_dir, f"{item}_{pdf_file}")
-                        shutil.copy2(src, dst)
-                        self.package_info['total_files'] += 1
-
-            # 첨부파일들 복사
-            for file in os.listdir(item_path):
-                file_path = os.path.join(item_path, file)
-
-                if os.path.isfile(file_path) and not file.endswith('.html'):
-                    # 첨부파일로 간주되는 파일들
-                    if any(file.lower().endswith(ext) for ext in
-                           ['.pdf', '.doc', '.docx', '.xls', '.xlsx', '.jpg', '.png', '.zip']):
-                        dst = os.path.join(attachments_dir, f"{item}_{file}")
-                        shutil.copy2(file_path, dst)
-                        self.package_info['total_files'] += 1
-
-        # Excel 보고서 복사
-        for file in os.listdir(self.base_output_dir):
-            if file.endswith('.xlsx') and '증거목록' in file:
-                src = os.path.join(self.base_output_dir, file)
-                dst = os.path.join(reports_dir, file)
-                shutil.copy2(src, dst)
-                self.package_info['total_files'] += 1
-
-    def _create_package_metadata(self, package_dir: str, case_name: str, party: str):
+            return entries, bundled_entries
+
+        # 처리된 메일 폴더들과 Excel 보고서를 한 번에 순회
+        item_dirs: List[os.DirEntry] = []
+        with os.scandir(self.base_output_dir) as it:
+            for item_entry in it:
+                if item_entry.is_dir():
+                    item_dirs.append(item_entry)
+                elif (os.path.splitext(item_entry.name)[1] == '.xlsx' and
+                      '증거목록' in item_entry.name):
+                    # Excel 보고서
+                    report_entries.append((item_entry.path,
+                                           f"03_보고서/{item_entry.name}",
+                                           item_entry.stat().st_size))
+
+        # 메일 폴더별 탐색은 서로 독립적이므로 스레드 풀에서 디렉토리 I/O를 겹쳐 수행
+        # (결과 집계는 순서대로 현재 스레드에서 하므로 잠금 불필요)
+        max_workers = min(WALK_MAX_WORKERS, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for item_entry, item_files in zip(
+                    item_dirs, executor.map(self._collect_item_files, item_dirs)):
+                self.package_info['packaged_folders'].append(item_entry.name)
+                for entry in item_files:
+                    if (entry[1].startswith(_ATTACHMENT_PREFIX) and
+                            entry[2] < SMALL_ATTACHMENT_BYTES):
+                        bundled_entries.append(entry)
+                    else:
+                        entries.append(entry)
+
+        entries.extend(report_entries)
+        self.package_info['total_files'] += len(entries) + len(bundled_entries)
+        return entries, bundled_entries
+
+    def _collect_item_files(self, item_entry: os.DirEntry) -> List[Tuple[str, str, int]]:
+        """
+        메일 폴더 하나의 PDF 증거 파일과 첨부파일 목록을 만듭니다.
+        """
+        item = item_entry.name
+        pdf_entries: List[Tuple[str, str, int]] = []
+        attachment_entries: List[Tuple[str, str, int]] = []
+
+        with os.scandir(item_entry.path) as it:
+            for entry in it:
+                file = entry.name
+
+                if file == "pdf_evidence" and entry.is_dir():
+                    # PDF 증거 파일
+                    with os.scandir(entry.path) as pdf_it:
+                        for pdf_entry in pdf_it:
+                            if pdf_entry.name.endswith('.pdf'):
+                                pdf_entries.append((pdf_entry.path,
+                                                    f"01_증거파일/{item}_{pdf_entry.name}",
+                                                    pdf_entry.stat().st_size))
+
+                elif os.path.splitext(file)[1].lower() in _ATTACHMENT_EXTS and entry.is_file():
+                    # 첨부파일로 간주되는 파일들 (.html 본문은 확장자 집합에 없으므로 제외)
+                    attachment_entries.append((entry.path,
+                                               f"02_첨부파일/{item}_{file}",
+                                               entry.stat().st_size))
+
+        return pdf_entries + attachment_entries
+
+    def _create_package_metadata(self, zipf: zipfile.ZipFile, case_name: str, party: str):
         """
         패키지 메타데이터를 생성합니다.
         """
@@ -142,12 +506,13 @@ class EvidencePackager:
             },
             'file_structure': {
                 '01_증거파일': 'PDF 형태의 법원 제출용 증거 파일들',
-                '02_첨부파일': '원본 첨부파일들 (문서, 이미지 등)',
+                '02_첨부파일': '원본 첨부파일들 (문서, 이미지 등, 1MB 미만은 attachments.tar로 묶음)',
                 '03_보고서': '증거목록 및 처리 보고서'
             },
             'packaged_folders': self.package_info['packaged_folders'],
             'integrity_info': {
                 'hash_algorithm': 'SHA-256',
+                'hash_manifest': HASH_MANIFEST_NAME,
                 'verification_required': True,
                 'chain_of_custody': '모든 파일의 처리 과정이 로그로 기록됨'
             },
@@ -158,75 +523,133 @@ class EvidencePackager:
             }
         }
 
-        metadata_path = os.path.join(package_dir, "package_metadata.json")
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        zipf.writestr("package_metadata.json", dumps_json(metadata))
 
-    def _create_package_readme(self, package_dir: str, case_name: str, party: str):
+    def _create_package_readme(self, zipf: zipfile.ZipFile, case_name: str, party: str,
+                               created_at_str: str):
         """
         패키지 설명서를 생성합니다.
         """
-        readme_content = f"""# {case_name} - 증거 자료 패키지
-
-## 📋 패키지 정보
-
-- **생성일시**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-- **당사자**: {party}
-- **총 증거 폴더**: {len(self.package_info['packaged_folders'])}개
-- **총 파일 수**: {self.package_info['total_files']}개
-
-## 📁 디렉토리 구조
-
-### 01_증거파일/
-법원 제출용 PDF 증거 파일들이 저장되어 있습니다.
-- 각 PDF 파일 상단에 "{party} 제○호증" 증거번호가 표기되어 있습니다.
-- 파일명은 [날짜]_메일제목 형식으로 구성되어 있습니다.
-
-### 02_첨부파일/
-원본 첨부파일들이 저장되어 있습니다.
-- 모든 첨부파일은 원본 그대로 보존되었습니다.
-- 파일명 앞에 해당 메일 폴더명이 접두어로 붙어있습니다.
-
-### 03_보고서/
-증거목록 및 처리 보고서가 저장되어 있습니다.
-- Excel 형태의 증거목록이 포함되어 있습니다.
-- 처리 통계 및 제외된 메일 목록을 확인할 수 있습니다.
-
-## ⚖️ 법원 제출 시 유의사항
-
-1. **증거번호 확인**: 각 PDF 파일의 증거번호가 올바르게 표기되어 있는지 확인하세요.
-2. **첨부파일 원본성**: 첨부파일들은 원본 그대로 보존되어 있습니다.
-3. **무결성 검증**: 필요시 해시값을 통한 무결성 검증이 가능합니다.
-4. **처리 로그**: 모든 처리 과정이 로그로 기록되어 있습니다.
-
-## 📞 문의사항
-
-이 증거 자료에 대한 문의사항이 있으시면 담당 법무팀에 연락하시기 바랍니다.
+        readme_content = _README_TEMPLATE.format_map({
+            'case_name': case_name,
+            'created_at': created_at_str,
+            'party': party,
+            'folder_count': len(self.package_info['packaged_folders']),
+            'total_files': self.package_info['total_files']
+        })
 
----
-*이 패키지는 법원 제출용 메일박스 증거 분류 시스템에 의해 자동 생성되었습니다.*
-"""
-
-        readme_path = os.path.join(package_dir, "README.md")
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        zipf.writestr("README.md", readme_content)
 
-    def _create_zip_package(self, package_dir: str, output_path: str) -> str:
+    def _create_zip_package(self, zipf: zipfile.ZipFile, entries: List[Tuple[str, str, int]]):
         """
-        디렉토리를 ZIP 파일로 압축합니다.
+        원본 파일들을 ZIP 파일에 바로 기록합니다.
+        파일을 읽는 동안 SHA-256도 함께 계산해 package_info['hashes']에 저장합니다.
+
+        작은 파일은 스레드 풀에서 병렬로 압축한 뒤 순서대로 이어 붙이고,
+        큰 파일은 메모리 사용을 제한하기 위해 zipfile이 스트리밍으로 압축합니다.
+        PDF/이미지 등 이미 압축된 형식은 ZIP_STORED로 그대로 저장하며,
+        큰 무압축 파일은 Linux에서 sendfile로 사용자 공간을 거치지 않고 복사합니다
+        (sendfile이 실패하면 청크 단위 기록으로 되돌아감).
         """
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(package_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arc_name = os.path.relpath(file_path, package_dir)
-                    zipf.write(file_path, arc_name)
+        # 모든 코어를 쓰는 병렬 압축은 스트리밍 처리가 권장되는 대용량 패키지에만 적용
+        total_size_mb = sum(file_size for _, _, file_size in entries) / 1024 / 1024
+        max_workers = os.cpu_count() or 1
+        if not EmailProcessingOptimizer.should_use_streaming(total_size_mb):
+            max_workers = min(max_workers, SMALL_PACKAGE_WORKERS)
+        pending = deque()
+        hashes = self.package_info['hashes']
+
+        if not _supports_raw_members(zipf):
+            # 지원 범위 밖의 zipfile 구현: 모든 파일을 공개 API로 순서대로 기록
+            for src, arc_name, _ in entries:
+                hashes[arc_name] = _write_streamed_member(
+                    zipf, src, arc_name, _get_compress_type(arc_name))
+            return
 
-        # 파일 크기 계산
-        package_size_mb = os.path.getsize(output_path) / 1024 / 1024
-        self.package_info['total_size_mb'] = package_size_mb
+        # 대기 중인 파일들의 원본 크기 합 (압축 결과와 읽기 버퍼 메모리의 상한)
+        pending_bytes = 0
+
+        def _flush_one():
+            nonlocal pending_bytes
+            src, arc_name, compress_type, future, src_size = pending.popleft()
+            data, crc, file_size, digest = future.result()
+            _write_compressed_member(zipf, src, arc_name, data, crc, file_size,
+                                     compress_type)
+            hashes[arc_name] = digest
+            pending_bytes -= src_size
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for src, arc_name, file_size in entries:
+                compress_type = _get_compress_type(arc_name)
+
+                if file_size > PARALLEL_COMPRESS_MAX_BYTES:
+                    # 순서 유지를 위해 대기 중인 결과를 먼저 기록
+                    while pending:
+                        _flush_one()
+                    if compress_type == zipfile.ZIP_STORED and SENDFILE_SUPPORTED:
+                        try:
+                            hashes[arc_name] = _write_stored_member_sendfile(
+                                zipf, src, arc_name)
+                            continue
+                        except OSError as e:
+                            print(f"⚠️  sendfile 복사 실패, 일반 복사로 재시도: {src} ({e})")
+                    hashes[arc_name] = _write_streamed_member(
+                        zipf, src, arc_name, compress_type)
+                    continue
+
+                # 메모리에 보관되는 압축 결과를 개수와 원본 크기 합으로 제한
+                while pending and (len(pending) >= max_workers * 2 or
+                                   pending_bytes + file_size > PARALLEL_PENDING_MAX_BYTES):
+                    _flush_one()
+                pending.append((src, arc_name, compress_type,
+                                executor.submit(_compress_file, src, compress_type),
+                                file_size))
+                pending_bytes += file_size
+
+            while pending:
+                _flush_one()
+
+    def _create_attachment_bundle(self, zipf: zipfile.ZipFile,
+                                  bundled_entries: List[Tuple[str, str, int]]):
+        """
+        작은 첨부파일들을 tar 스트림으로 묶어 하나의 ZIP 멤버로 기록합니다.
+        파일마다 ZIP 멤버를 만드는 대신 한 번에 이어 쓰므로 멤버 수와 파일 처리 비용이 줄어듭니다.
+        묶인 파일마다 SHA-256을 따로 계산해 해시 목록에 02_첨부파일/<이름>으로 남깁니다.
+        """
+        if not bundled_entries:
+            return
 
-        return output_path
+        zinfo = zipfile.ZipInfo(ATTACHMENT_BUNDLE_NAME,
+                                time.localtime(time.time())[:6])
+        zinfo.compress_type = _get_compress_type(ATTACHMENT_BUNDLE_NAME)
+        zinfo._compresslevel = COMPRESS_LEVEL
+        zinfo.external_attr = 0o644 << 16
+
+        # tar 헤더/패딩을 감안한 크기로 ZIP64 필요 여부 판단
+        estimated_size = sum(file_size + 1024 for _, _, file_size in bundled_entries)
+        force_zip64 = estimated_size > zipfile.ZIP64_LIMIT
+
+        hashes = self.package_info['hashes']
+        with zipf.open(zinfo, 'w', force_zip64=force_zip64) as dest:
+            writer = _HashingWriter(dest)
+            with tarfile.open(fileobj=writer, mode='w|') as tar:
+                for src, arc_name, _ in bundled_entries:
+                    tarinfo = _normalized_tarinfo(
+                        tar, src, arc_name[len(_ATTACHMENT_PREFIX):])
+                    with open(src, 'rb') as f:
+                        reader = _HashingReader(f)
+                        tar.addfile(tarinfo, reader)
+                    hashes[arc_name] = reader.sha256.hexdigest()
+
+        hashes[ATTACHMENT_BUNDLE_NAME] = writer.sha256.hexdigest()
+
+    def _create_hash_manifest(self, zipf: zipfile.ZipFile):
+        """
+        패키지 파일들의 SHA-256 목록을 생성합니다 (sha256sum -c 로 검증 가능).
+        """
+        lines = [f"{digest}  {arc_name}\n"
+                 for arc_name, digest in self.package_info['hashes'].items()]
+        zipf.writestr(HASH_MANIFEST_NAME, "".join(lines))
 
     def create_delivery_checklist(self, package_path: str, output_path: str = None) -> str:
         """
@@ -236,53 +659,17 @@ class EvidencePackager:
             base_name = os.path.splitext(package_path)[0]
             output_path = f"{base_name}_체크리스트.txt"
 
-        checklist_content = f"""
-# 법원 제출용 증거 자료 체크리스트
-
-## 📦 패키지 정보
-- 파일명: {os.path.basename(package_path)}
-- 생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-- 파일크기: {self.package_info['total_size_mb']:.2f}MB
-
-## ✅ 제출 전 확인사항
-
-### 1. 파일 무결성
-□ ZIP 파일이 정상적으로 압축되었는가?
-□ 압축 해제 시 모든 파일이 정상 확인되는가?
-□ 각 증거 파일의 증거번호가 올바르게 표기되었는가?
-
-### 2. 증거 내용
-□ 사건과 관련된 메일들만 포함되어 있는가?
-□ 관련 없는 메일들이 적절히 제외되었는가?
-□ 첨부파일들이 모두 포함되어 있는가?
-
-### 3. 형식 준수
-□ PDF 파일 상단에 증거번호가 중앙 정렬로 표기되었는가?
-□ 첨부파일들이 원본 그대로 보존되었는가?
-□ Excel 증거목록이 포함되어 있는가?
-
-### 4. 법적 요구사항
-□ 디지털 포렌식 무결성이 확보되었는가?
-□ 체인 오브 커스터디가 유지되었는가?
-□ 처리 과정 로그가 기록되었는가?
-
-### 5. 최종 확인
-□ 법무팀 검토가 완료되었는가?
-□ 제출할 법원 및 사건번호가 올바른가?
-□ 제출 기한 내에 준비가 완료되었는가?
-
-## 📝 제출 정보
-- 제출 법원: ________________
-- 사건번호: ________________
-- 제출일자: ________________
-- 담당자: ________________
-
----
-*모든 항목을 확인한 후 법원에 제출하시기 바랍니다.*
-"""
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(checklist_content)
+        checklist_content = _CHECKLIST_TEMPLATE.format_map({
+            'package_name': os.path.basename(package_path),
+            'created_at': self._created_at_str,
+            'total_size_mb': self.package_info['total_size_mb']
+        })
+
+        # 인코딩을 한 번에 끝내고 단일 write로 기록 (텍스트 모드의 줄바꿈 변환은 직접 적용)
+        if os.linesep != "\n":
+            checklist_content = checklist_content.replace("\n", os.linesep)
+        with open(output_path, 'wb') as f:
+            f.write(checklist_content.encode('utf-8'))
 
         print(f"📋 체크리스트가 생성되었습니다: {output_path}")
         return output_path
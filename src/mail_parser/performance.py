@@ -1,24 +1,65 @@
 # src/mail_parser/performance.py
 
+import atexit
 import os
 import time
+from array import array
+from collections import defaultdict
 from contextlib import contextmanager
 from functools import wraps
-from typing import Any, Dict, Optional
+from typing import Any, DefaultDict, Dict, List, NamedTuple, Optional
 
 import psutil
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from .json_utils import write_json, write_json_gz
+
+# 시계열 지표 보관 개수 (장시간 스트리밍 처리 시 메모리 상한)
+METRIC_HISTORY_SIZE = 10_000
+
+# timing_decorator 누적 통계: 함수 이름 -> [호출 횟수, 총 소요 시간(ns)]
+_TIMINGS: DefaultDict[str, List[int]] = defaultdict(lambda: [0, 0])
+
+
+class Metric(NamedTuple):
+    """기록된 성능 지표 하나"""
+    name: str
+    value: Any
+    timestamp: float
+    elapsed_since_start: float
+
 
 class PerformanceMonitor:
     """
     성능 모니터링 클래스
     """
 
+    __slots__ = (
+        'metrics', '_history_names', '_history_values', '_history_ts',
+        '_history_idx', 'start_time', 'process',
+        'memory_threshold_mb', '_mem_cache', '_mem_cache_ts', '_mem_ttl',
+        'processing_metrics', '_last_cpu_time', '_last_cpu_wall'
+    )
+
     def __init__(self):
-        self.metrics = {}
+        # 지표 이름별 최신 값
+        self.metrics: Dict[str, Metric] = {}
+        # 최근 METRIC_HISTORY_SIZE개의 시계열 (필드별 배열로 나눈 고정 크기 링 버퍼)
+        self._history_names: List[Optional[str]] = [None] * METRIC_HISTORY_SIZE
+        self._history_values: List[Any] = [None] * METRIC_HISTORY_SIZE
+        self._history_ts = array('d', bytes(8 * METRIC_HISTORY_SIZE))
+        self._history_idx = 0
         self.start_time = time.time()
         self.process = psutil.Process()
         self.memory_threshold_mb = 2048  # 2GB 임계값
+        # 메모리 조회 결과 캐시 (짧은 TTL 동안 /proc 재조회 생략)
+        self._mem_cache = None
+        self._mem_cache_ts = 0.0
+        self._mem_ttl = 0.05
         self.processing_metrics = {
             'emails_per_second': 0,
             'memory_peak_mb': 0,
@@ -27,21 +68,57 @@ class PerformanceMonitor:
             'total_processed': 0,
             'total_errors': 0
         }
+        # CPU 사용률 계산 기준점 (getrusage 누적 CPU 시간, 단조 시계)
+        self._last_cpu_time = self._get_process_cpu_time()
+        self._last_cpu_wall = time.monotonic()
 
     def record_metric(self, name: str, value: Any):
         """
         성능 지표를 기록합니다.
         """
-        self.metrics[name] = {
-            'value': value,
-            'timestamp': time.time(),
-            'elapsed_since_start': time.time() - self.start_time
-        }
+        now = time.time()
+        self.metrics[name] = Metric(name, value, now, now - self.start_time)
+
+        i = self._history_idx % METRIC_HISTORY_SIZE
+        self._history_names[i] = name
+        self._history_values[i] = value
+        self._history_ts[i] = now
+        self._history_idx += 1
+
+        # 메모리 피크는 기록 시점에 갱신 (요약 시 전체 지표 재탐색 불필요)
+        if ('memory_rss_mb' in name and
+                value > self.processing_metrics['memory_peak_mb']):
+            self.processing_metrics['memory_peak_mb'] = value
+
+    def get_metric_history(self, name: Optional[str] = None) -> List[Metric]:
+        """
+        링 버퍼에 남아 있는 지표 시계열을 기록 순서대로 반환합니다.
+
+        Args:
+            name: 지정하면 해당 이름의 지표만 반환
+        """
+        count = min(self._history_idx, METRIC_HISTORY_SIZE)
+        first = self._history_idx - count
+        history = []
+        for n in range(first, self._history_idx):
+            i = n % METRIC_HISTORY_SIZE
+            metric_name = self._history_names[i]
+            if name is not None and metric_name != name:
+                continue
+            ts = self._history_ts[i]
+            history.append(Metric(metric_name, self._history_values[i],
+                                  ts, ts - self.start_time))
+        return history
 
     def get_memory_usage(self) -> Dict[str, float]:
         """
         현재 메모리 사용량을 반환합니다.
+        (_mem_ttl 초 이내의 반복 호출에는 캐시된 값을 반환)
         """
+        now = time.monotonic()
+        if self._mem_cache is not None and now - self._mem_cache_ts < self._mem_ttl:
+            return self._mem_cache
+
         try:
             memory_info = self.process.memory_info()
             system_memory = psutil.virtual_memory()
@@ -52,7 +129,7 @@ class PerformanceMonitor:
             if current_usage_mb > self.processing_metrics['memory_peak_mb']:
                 self.processing_metrics['memory_peak_mb'] = current_usage_mb
 
-            return {
+            self._mem_cache = {
                 'rss_mb': current_usage_mb,  # 물리 메모리
                 'vms_mb': memory_info.vms / 1024 / 1024,  # 가상 메모리
                 'percent': self.process.memory_percent(),
@@ -60,6 +137,8 @@ class PerformanceMonitor:
                 'system_available_mb': system_memory.available / 1024 / 1024,
                 'system_used_percent': system_memory.percent
             }
+            self._mem_cache_ts = now
+            return self._mem_cache
         except Exception:
             return {
                 'rss_mb': 0, 'vms_mb': 0, 'percent': 0,
@@ -100,21 +179,6 @@ class PerformanceMonitor:
         except Exception:
             return False
 
-    def get_performance_summary(self) -> Dict:
-        """성능 요약 정보 반환"""
-        current_memory = self.get_memory_usage()
-        elapsed_total = time.time() - self.start_time
-
-        return {
-            'total_runtime_seconds': elapsed_total,
-            'current_memory': current_memory,
-            'processing_metrics': self.processing_metrics,
-            'peak_memory_mb': self.processing_metrics['memory_peak_mb'],
-            'average_emails_per_second': self.processing_metrics['emails_per_second'],
-            'error_rate_percent': self.processing_metrics['error_rate'],
-            'memory_efficiency': self._calculate_memory_efficiency()
-        }
-
     def _calculate_memory_efficiency(self) -> str:
         """메모리 효율성 등급 계산"""
         peak_mb = self.processing_metrics['memory_peak_mb']
@@ -130,11 +194,32 @@ class PerformanceMonitor:
         else:
             return 'Critical'
 
+    @staticmethod
+    def _get_process_cpu_time() -> float:
+        """프로세스의 누적 CPU 시간(사용자 + 시스템, 초)"""
+        if resource is None:
+            return 0.0
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime + usage.ru_stime
+
     def get_cpu_usage(self) -> float:
         """
         현재 CPU 사용률을 반환합니다.
+        (직전 호출 이후의 getrusage CPU 시간 증가분 기준, Windows에서는 psutil 사용)
         """
-        return self.process.cpu_percent()
+        if resource is None:
+            return self.process.cpu_percent()
+
+        cpu_time = self._get_process_cpu_time()
+        now = time.monotonic()
+        elapsed = now - self._last_cpu_wall
+        if elapsed <= 0:
+            return 0.0
+
+        percent = 100.0 * (cpu_time - self._last_cpu_time) / elapsed
+        self._last_cpu_time = cpu_time
+        self._last_cpu_wall = now
+        return percent
 
     def record_system_metrics(self, stage: str):
         """
@@ -156,30 +241,62 @@ class PerformanceMonitor:
 
         return {
             'total_runtime_seconds': total_time,
+            'current_memory': current_memory,
             'current_memory_mb': current_memory['rss_mb'],
-            'peak_memory_mb': max([m['value'] for k, m in self.metrics.items()
-                                   if 'memory_rss_mb' in k], default=0),
+            'processing_metrics': self.processing_metrics,
+            'peak_memory_mb': self.processing_metrics['memory_peak_mb'],
+            'average_emails_per_second': self.processing_metrics['emails_per_second'],
+            'error_rate_percent': self.processing_metrics['error_rate'],
+            'memory_efficiency': self._calculate_memory_efficiency(),
             'metrics_count': len(self.metrics),
-            'all_metrics': self.metrics
+            'all_metrics': {
+                name: {
+                    'value': m.value,
+                    'timestamp': m.timestamp,
+                    'elapsed_since_start': m.elapsed_since_start
+                }
+                for name, m in self.metrics.items()
+            }
         }
 
 
 def timing_decorator(func):
     """
     함수 실행 시간을 측정하는 데코레이터
+    (호출마다 출력하지 않고 누적하며, 종료 시 dump_timings로 한 번에 출력)
     """
+    stats = _TIMINGS[func.__qualname__]
+    perf_counter_ns = time.perf_counter_ns
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-
-        print(f"⏱️  {func.__name__}: {end_time - start_time:.2f}초")
-        return result
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats[0] += 1
+            stats[1] += perf_counter_ns() - start
 
     return wrapper
 
 
+def dump_timings():
+    """
+    timing_decorator로 누적된 함수별 실행 시간을 출력합니다.
+    """
+    for name, (calls, total_ns) in sorted(_TIMINGS.items(),
+                                          key=lambda item: item[1][1],
+                                          reverse=True):
+        if calls == 0:
+            continue
+        total_s = total_ns / 1e9
+        print(f"⏱️  {name}: {total_s:.2f}초 "
+              f"({calls}회, 평균 {total_s / calls * 1000:.3f}ms)")
+
+
+atexit.register(dump_timings)
+
+
 @contextmanager
 def performance_context(operation_name: str, monitor: Optional[PerformanceMonitor] = None):
     """
@@ -289,8 +406,8 @@ class EmailProcessingOptimizer:
 def log_performance_metrics(monitor: PerformanceMonitor, output_file: str = None):
     """
     성능 지표를 로그 파일에 기록합니다.
+    (기본 파일 이름은 gzip 압축 .json.gz이며, 지정한 경로는 .gz로 끝날 때만 압축)
     """
-    import json
     from datetime import datetime
 
     summary = monitor.get_performance_summary()
@@ -307,10 +424,12 @@ def log_performance_metrics(monitor: PerformanceMonitor, output_file: str = None
 
     if output_file is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"performance_log_{timestamp}.json"
+        output_file = f"performance_log_{timestamp}.json.gz"
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(performance_log, f, indent=2, ensure_ascii=False)
+    if output_file.endswith('.gz'):
+        write_json_gz(output_file, performance_log)
+    else:
+        write_json(output_file, performance_log)
 
     print(f"📊 성능 로그가 저장되었습니다: {output_file}")
     return output_file
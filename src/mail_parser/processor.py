@@ -1,29 +1,422 @@
 # src/mail_parser/processor.py
 
-import base64
+import binascii
+import email
+import hashlib
+import heapq
 import json
 import mailbox
 import os
+import queue
 import re
 import shutil
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from email.header import Header, decode_header
 from email.message import Message
-from typing import Any, Dict, List, Optional, cast
+from email.parser import BytesHeaderParser
+from functools import cached_property
+from typing import (Any, BinaryIO, Dict, Iterable, Iterator, List, Optional,
+                    Pattern, TextIO, Tuple, cast)
 
 from src.parser.mailbox_processor import process_mailbox
 
 from .analyzer import ThreadAnalyzer
 from .evidence_generator import EvidenceGenerator
+from .file_utils import copy_file_fast
 from .forensic_integrity import ForensicIntegrityService
 from .formatter import CourtFormatter
 from .integrity import IntegrityManager
+from .json_utils import read_json, write_json
 from .logger import (log_email_processing, log_file_operation,
                      log_processing_step, setup_logger)
+from .mmap_mbox import MMapMbox
 from .streaming_processor import StreamingEmailProcessor
 from .utils import decode_text, get_email_date, sanitize_filename
 
 OUTPUT_DIR = 'processed_emails'
 
+# From 헤더의 <주소> 부분 (한 줄 안에서 '>'까지 선형 탐색)
+_SENDER_ADDR_RE = re.compile(r'<([^>\n]+)>')
+
+# HTML 본문의 src="cid:..." / src='cid:...' 참조
+_CID_SRC_RE = re.compile(r"""src=(["'])cid:([^"']+)\1""")
+
+# 한 줄 단위 base64 데이터 (공백/비정상 문자 없음, 패딩은 끝에만)
+_B64_LINE_RE = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+# 이 크기(문자 수) 이상인 base64 첨부파일은 청크 단위로 디코딩하여 기록
+STREAM_DECODE_MIN_CHARS = 1024 * 1024
+# 스트리밍 디코딩 시 한 번에 변환할 base64 문자 수 (4의 배수)
+STREAM_DECODE_CHUNK_CHARS = 64 * 1024
+
+# mbox 메타데이터 캐시 형식 버전 (저장 구조가 바뀌면 증가)
+METADATA_CACHE_VERSION = 2
+
+# 메타데이터 캐시에 헤더 원문 그대로 기록하는 필드 (8비트 원문 헤더는 Header 객체)
+_CACHED_HEADER_FIELDS = ('subject', 'in_reply_to', 'references')
+
+# 스트리밍 처리 시 읽기 스레드가 미리 읽어 둘 최대 메시지 수
+STREAM_PREFETCH_MESSAGES = 64
+
+# HTML 본문 파일 쓰기 버퍼 크기 (내장 이미지를 조각 단위로 기록)
+HTML_WRITE_BUFFER_SIZE = 256 * 1024
+
+
+class _KeywordMatcher:
+    """
+    대소문자 구분 없는 부분 문자열 검사를 키워드 수와 무관하게 한 번의 정규식 탐색으로 수행합니다.
+    (검사 대상 문자열은 호출 측에서 한 번만 소문자로 변환하여 전달)
+    """
+
+    def __init__(self, keywords: List[str]):
+        # 소문자 키워드 -> 설정에 적힌 원래 키워드 (중복 시 앞선 항목 우선)
+        self.originals: Dict[str, str] = {}
+        for keyword in keywords:
+            self.originals.setdefault(keyword.lower(), keyword)
+        # 청크 경계에 걸친 일치를 찾기 위해 필요한 최대 키워드 길이
+        self.max_length = max(map(len, self.originals), default=0)
+        self.pattern: Optional[Pattern[str]] = None
+        if self.originals:
+            self.pattern = re.compile(
+                '|'.join(map(re.escape, self.originals)))
+
+    def search(self, text_lower: str) -> Optional[str]:
+        """일치한 키워드(설정 원문)를 반환하고, 없으면 None"""
+        if self.pattern is None:
+            return None
+        match = self.pattern.search(text_lower)
+        if match is None:
+            return None
+        return self.originals[match.group(0)]
+
+
+def _stream_decode_base64(payload: str, fileobj: BinaryIO) -> bool:
+    """
+    base64 페이로드를 청크 단위로 디코딩하여 기록합니다.
+    전체 디코딩 결과를 메모리에 만들지 않으며, 형식이 일반적이지 않으면 False를 반환합니다.
+    (이 경우 호출 측에서 email 패키지의 관대한 디코딩으로 다시 기록)
+    """
+    buf: List[str] = []
+    size = 0
+    padded = False
+    for line in payload.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if padded or not _B64_LINE_RE.fullmatch(line):
+            return False
+        padded = line.endswith('=')
+        buf.append(line)
+        size += len(line)
+        if size >= STREAM_DECODE_CHUNK_CHARS:
+            data = ''.join(buf)
+            cut = len(data) - len(data) % 4
+            fileobj.write(binascii.a2b_base64(data[:cut]))
+            buf = [data[cut:]]
+            size = len(buf[0])
+
+    data = ''.join(buf)
+    if len(data) % 4:
+        return False
+    if data:
+        fileobj.write(binascii.a2b_base64(data))
+    return True
+
+
+class _PartView:
+    """
+    메시지 파트 하나의 헤더 조회와 페이로드 디코딩 결과를 처음 사용할 때 계산하여 보관합니다.
+    (제외 검사와 본문/첨부 처리에서 같은 파트를 다시 디코딩하지 않도록 공유)
+    """
+
+    def __init__(self, part: Message):
+        self.part = part
+
+    @cached_property
+    def content_type(self) -> str:
+        return self.part.get_content_type()
+
+    @cached_property
+    def maintype(self) -> str:
+        return self.part.get_content_maintype()
+
+    @cached_property
+    def disposition(self) -> str:
+        """소문자로 정규화된 disposition 유형 ('attachment', 'inline', 없으면 '')"""
+        return self.part.get_content_disposition() or ''
+
+    @cached_property
+    def charset(self) -> str:
+        return self.part.get_content_charset() or 'utf-8'
+
+    @cached_property
+    def decoded(self) -> Optional[bytes]:
+        """base64/QP 디코딩된 페이로드"""
+        return self.part.get_payload(decode=True)
+
+    @cached_property
+    def streamable(self) -> bool:
+        """대용량 base64 페이로드이고 아직 디코딩하지 않았으면 스트리밍 기록 대상"""
+        if 'decoded' in self.__dict__ or self.part.is_multipart():
+            return False
+        cte = str(self.part.get('content-transfer-encoding', '')).lower()
+        raw = self.part.get_payload()
+        return (cte == 'base64' and isinstance(raw, str)
+                and len(raw) >= STREAM_DECODE_MIN_CHARS)
+
+    def write_decoded(self, fileobj: BinaryIO) -> bool:
+        """
+        디코딩한 페이로드를 파일에 기록합니다. 내용이 비어 있으면 False.
+        streamable인 경우 청크 단위로 디코딩하고, 실패하면 전체 디코딩 결과로 다시 기록합니다.
+        """
+        if self.streamable:
+            start = fileobj.tell()
+            if _stream_decode_base64(self.part.get_payload(), fileobj):
+                return fileobj.tell() > start
+            fileobj.seek(start)
+            fileobj.truncate()
+        payload = self.decoded
+        if not payload:
+            return False
+        fileobj.write(payload)
+        return True
+
+    @cached_property
+    def text(self) -> str:
+        """파트 charset으로 디코딩한 본문 (알 수 없는 charset이면 cp949)"""
+        payload = self.decoded
+        if not payload:
+            return ''
+        try:
+            return payload.decode(self.charset, errors='ignore')
+        except LookupError:
+            return payload.decode('cp949', errors='ignore')
+
+
+class _PartIndex:
+    """
+    메시지 트리를 한 번만 순회하여 파트를 용도별로 분류합니다.
+    (제외 검사는 text_parts를, 본문/첨부 처리는 나머지 분류를 사용)
+    """
+
+    def __init__(self, msg: Message):
+        # msg.walk() 순서의 전체 파트 뷰 (multipart 컨테이너 포함)
+        self.parts: List[_PartView] = []
+        self.text_parts: List[_PartView] = []
+        self.html_part: Optional[_PartView] = None
+        self.inline_by_cid: Dict[str, _PartView] = {}
+        self.attachments: List[_PartView] = []
+
+        for part in msg.walk():
+            view = _PartView(part)
+            self.parts.append(view)
+            if view.maintype == 'multipart':
+                continue
+            if view.maintype == 'text':
+                self.text_parts.append(view)
+
+            disposition = view.disposition
+            content_id = part.get('Content-ID')
+
+            if not self.html_part and view.content_type == 'text/html' and disposition != 'attachment':
+                self.html_part = view
+            elif content_id and disposition in ('inline', ''):
+                self.inline_by_cid[content_id.strip('<>')] = view
+            elif disposition == 'attachment':
+                self.attachments.append(view)
+
+
+def _date_sort_key(date: Optional[datetime]) -> datetime:
+    """날짜가 없는 메시지는 가장 오래된 것으로 정렬"""
+    return date if date else datetime.min
+
+
+def _attachment_size(part: Message) -> int:
+    """
+    첨부파일의 디코딩 후 크기.
+    base64는 공백을 제외한 인코딩 길이와 패딩 수로 계산하여 페이로드 디코딩을 생략합니다.
+    """
+    cte = str(part.get('content-transfer-encoding', '')).lower()
+    raw = part.get_payload()
+    if cte == 'base64' and isinstance(raw, str):
+        chars = len(raw) - sum(raw.count(ws) for ws in ('\n', '\r', ' ', '\t'))
+        return max(chars * 3 // 4 - raw.count('='), 0)
+    payload = part.get_payload(decode=True)
+    return len(payload) if payload else 0
+
+
+def _last_reference(references: Optional[str]) -> Optional[str]:
+    """
+    References 헤더의 마지막 Message-ID (없으면 None).
+    접힌 헤더의 탭/줄바꿈도 split()과 같이 구분자로 보되, 오른쪽에서 한 번만 분리합니다.
+    """
+    if not references:
+        return None
+    parts = references.rsplit(None, 1)
+    return parts[-1] if parts else None
+
+
+def _iter_mbox_headers(mbox) -> Iterator[Tuple[Any, Message]]:
+    """
+    mbox의 각 메시지에서 헤더 영역만 읽어 파싱한 (키, 메시지)를 반환합니다.
+    메타데이터 수집에는 헤더만 필요하므로 본문 읽기와 멀티파트 분해를 생략합니다.
+    """
+    if isinstance(mbox, MMapMbox):
+        yield from mbox.iter_headers()
+        return
+
+    parser = BytesHeaderParser()
+    for key in mbox.iterkeys():
+        lines = []
+        with mbox.get_file(key) as f:
+            for line in f:
+                lines.append(line)
+                if line in (b'\n', b'\r\n'):
+                    break
+        yield key, parser.parsebytes(b''.join(lines))
+
+
+def _iter_prefetched(items: Iterable[Any], maxsize: int) -> Iterator[Any]:
+    """
+    별도 스레드가 items를 미리 읽어 제한된 크기의 큐에 채우고, 호출 측은 큐에서 꺼내 처리합니다.
+    (mbox 읽기/파싱과 증거 생성을 겹쳐 실행, 호출 측이 중단하면 읽기 스레드도 종료)
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+    errors: List[Exception] = []
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        """큐에 넣을 때까지 기다리되, 호출 측이 중단하면 False (큐가 가득 차도 멈추지 않음)"""
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _reader():
+        try:
+            for item in items:
+                if not _put(item):
+                    return
+        except Exception as e:
+            errors.append(e)
+        # 종료 표시도 같은 방식으로 넣어 호출 측이 먼저 중단해도 join이 끝나도록 함
+        _put(None)
+
+    reader = threading.Thread(target=_reader, daemon=True)
+    reader.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is None:
+                break
+            yield item
+    finally:
+        stop.set()
+        reader.join()
+
+    if errors:
+        raise errors[0]
+
+
+def _metadata_cache_path(cache_dir: str, mbox_path: str) -> str:
+    """mbox 경로/크기/수정 시각으로 캐시 파일 경로를 정합니다 (파일이 바뀌면 다른 경로)"""
+    stat = os.stat(mbox_path)
+    cache_key = f"{os.path.abspath(mbox_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+    digest = hashlib.sha1(cache_key.encode('utf-8', 'surrogateescape')).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.json")
+
+
+def _encode_cached_header(value: Any) -> Any:
+    """Header 객체는 (원문 바이트, charset) 조각 목록으로 바꿔 JSON으로 기록 가능하게 합니다."""
+    if value is None or isinstance(value, str):
+        return value
+    return {'header_chunks': [[chunk.decode('latin-1'), charset]
+                              for chunk, charset in decode_header(value)]}
+
+
+def _decode_cached_header(value: Any) -> Any:
+    """_encode_cached_header로 기록한 값을 같은 조각의 Header 객체로 복원합니다."""
+    if not isinstance(value, dict):
+        return value
+    header = Header()
+    for chunk, charset in value['header_chunks']:
+        header.append(chunk.encode('latin-1'), charset, errors='surrogateescape')
+    return header
+
+
+def _load_metadata_cache(cache_path: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    캐시된 metadata_map을 읽습니다. 없거나 읽을 수 없으면 None.
+    (JSON만 읽으므로 캐시 파일이 변조되어도 코드가 실행되지 않음)
+    """
+    try:
+        cached = read_json(cache_path)
+        if not isinstance(cached, dict) or cached.get('version') != METADATA_CACHE_VERSION:
+            return None
+        metadata_map = cached['metadata_map']
+        for meta in metadata_map.values():
+            if meta['date'] is not None:
+                meta['date'] = datetime.fromisoformat(meta['date'])
+            for field in _CACHED_HEADER_FIELDS:
+                meta[field] = _decode_cached_header(meta[field])
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+    return metadata_map
+
+
+def _save_metadata_cache(cache_path: str, metadata_map: Dict[str, Dict[str, Any]]) -> None:
+    """
+    metadata_map을 임시 파일에 JSON으로 기록한 뒤 교체하여 캐시를 저장합니다.
+    날짜는 ISO 문자열로, Header 객체는 원문 조각 목록으로 기록합니다.
+    """
+    # 캐시 디렉토리는 소유자만 접근 가능하게 생성
+    os.makedirs(os.path.dirname(cache_path) or '.', mode=0o700, exist_ok=True)
+    records = {
+        msg_id: {**meta,
+                 'date': meta['date'].isoformat() if meta['date'] else None,
+                 **{field: _encode_cached_header(meta[field])
+                    for field in _CACHED_HEADER_FIELDS}}
+        for msg_id, meta in metadata_map.items()
+    }
+    tmp_path = f"{cache_path}.tmp{os.getpid()}"
+    try:
+        write_json(tmp_path, {'version': METADATA_CACHE_VERSION,
+                              'metadata_map': records})
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# 병렬 처리 작업 프로세스의 메시지 처리기 (_init_message_worker에서 생성)
+_worker_processor: Optional['EmailEvidenceProcessor'] = None
+
+
+def _init_message_worker(config: Dict[str, Any]) -> None:
+    """작업 프로세스 초기화: 로거/서비스 없이 설정 기반 필터만 준비"""
+    global _worker_processor
+    processor = EmailEvidenceProcessor.__new__(EmailEvidenceProcessor)
+    processor.config = config
+    processor.mbox = None
+    processor._compile_filters()
+    _worker_processor = processor
+
+
+def _process_message_worker(meta: Dict[str, Any], raw_msg: bytes,
+                            output_base_dir: str) -> Optional[str]:
+    """작업 프로세스에서 메시지 원본 바이트를 파싱하여 처리"""
+    full_msg = email.message_from_bytes(raw_msg)
+    return _worker_processor._process_message(meta, full_msg, output_base_dir,
+                                              raw_msg=raw_msg)
+
 
 class EmailEvidenceProcessor:
     def __init__(self, config_path):
@@ -59,10 +452,67 @@ class EmailEvidenceProcessor:
         # feature flag: use thread-based mailbox loader (experimental)
         self.use_threaded_loader: bool = self.config.get(
             'processing_options', {}).get('use_threaded_loader', False)
+        # feature flag: mmap 기반 오프셋 인덱스 mbox 리더 사용
+        self.use_mmap_mbox: bool = self.config.get(
+            'processing_options', {}).get('use_mmap_mbox', False)
+        # feature flag: mbox 메타데이터를 디스크에 캐시하여 같은 파일 재로드 시 헤더 파싱 생략
+        self.use_metadata_cache: bool = self.config.get(
+            'processing_options', {}).get('use_metadata_cache', False)
+        self.metadata_cache_dir: str = self.config.get(
+            'processing_options', {}).get('metadata_cache_dir', os.path.join('.cache', 'mbox_metadata'))
         self.evidence_generator = EvidenceGenerator(self)
+        # 마지막으로 읽은 (mbox 키, 메시지) - 같은 메시지의 연속 조회 시 재파싱 생략
+        self._msg_cache: Optional[Tuple[Any, Message]] = None
+        self._compile_filters()
 
         log_processing_step(self.logger, '초기화', '프로세서 초기화 완료')
 
+    def _compile_filters(self) -> None:
+        """
+        self.config에서 메시지 단위 처리에 필요한 상태를 준비합니다.
+        (병렬 작업 프로세스에서도 이 상태만으로 메시지를 처리)
+        """
+        # 제외/필수 키워드 매처는 설정에서 한 번만 컴파일
+        required_keywords_config = self.config.get('required_keywords', {})
+        if isinstance(required_keywords_config, dict):
+            required_keywords = required_keywords_config.get('keywords', [])
+        else:
+            required_keywords = required_keywords_config or []
+        self._exclude_kw_matcher = _KeywordMatcher(
+            self.config.get('exclude_keywords', []))
+        self._exclude_sender_matcher = _KeywordMatcher(
+            self.config.get('exclude_senders', []))
+        self._exclude_domain_matcher = _KeywordMatcher(
+            self.config.get('exclude_domains', []))
+        self._required_kw_matcher = _KeywordMatcher(required_keywords)
+        self._required_keywords: Tuple[str, ...] = tuple(required_keywords)
+
+        # 날짜 범위도 메시지마다 파싱하지 않도록 date 객체로 미리 변환
+        date_range_config = self.config.get('date_range', {})
+        self._start_date_str = date_range_config.get('start')
+        self._end_date_str = date_range_config.get('end')
+        self._start_date = datetime.strptime(
+            self._start_date_str, '%Y-%m-%d').date() if self._start_date_str else None
+        self._end_date = datetime.strptime(
+            self._end_date_str, '%Y-%m-%d').date() if self._end_date_str else None
+        # 본문을 파트 단위로 검사할 때 이전 청크에서 이어 붙일 길이
+        self._keyword_overlap = max(self._exclude_kw_matcher.max_length,
+                                    self._required_kw_matcher.max_length) - 1
+        # 마지막으로 분류한 (메시지 객체, 파트 인덱스) - 한 메시지만 보관하여 메모리 제한
+        self._parts_cache: Optional[Tuple[Message, _PartIndex]] = None
+
+    def _part_index(self, msg: Message) -> _PartIndex:
+        """
+        메시지의 파트 인덱스를 만들어 캐시합니다.
+        같은 메시지 객체에 대한 제외 검사와 본문 처리가 순회와 디코딩 결과를 공유합니다.
+        """
+        cached = self._parts_cache
+        if cached is not None and cached[0] is msg:
+            return cached[1]
+        index = _PartIndex(msg)
+        self._parts_cache = (msg, index)
+        return index
+
     def load_mbox(self, mbox_path: str) -> None:
         log_processing_step(self.logger, 1, f"mbox 파일 로드 시작: {mbox_path}")
 
@@ -74,43 +524,72 @@ class EmailEvidenceProcessor:
 
         # Default: keep original mailbox.mbox behavior for compatibility
         try:
-            self.mbox = mailbox.mbox(mbox_path)
+            if self.use_mmap_mbox:
+                mbox = MMapMbox(mbox_path)
+            else:
+                mbox = mailbox.mbox(mbox_path)
+            # 다시 로드할 때 이전 mbox의 mmap/파일 핸들을 닫음
+            self.close_mbox()
+            self.mbox = mbox
+            self._msg_cache = None
             log_file_operation(self.logger, 'mbox 로드', mbox_path, success=True)
         except Exception as e:
             log_file_operation(self.logger, 'mbox 로드',
                                mbox_path, success=False, error_msg=str(e))
             raise
 
+        cache_path = None
+        if self.use_metadata_cache:
+            cache_path = _metadata_cache_path(self.metadata_cache_dir, mbox_path)
+            cached = _load_metadata_cache(cache_path)
+            if cached is not None:
+                self.metadata_map.update(cached)
+                log_processing_step(
+                    self.logger, 2,
+                    f"메타데이터 캐시 사용: 총 {len(cached)}개의 고유 메시지 ({cache_path})"
+                )
+                return
+
         log_processing_step(self.logger, 2, f"메타데이터 수집 시작")
         metadata_count = 0
+        collected: Dict[str, Dict[str, Any]] = {}
 
-        for key, msg in self.mbox.items():
+        # 헤더만 파싱하여 하나씩 순회 (본문은 실제 처리 시점에 읽음)
+        for key, msg in _iter_mbox_headers(self.mbox):
             # cast to Message so static checkers know .get is available
             msg = cast(Message, msg)
             msg_id = msg.get('Message-ID')
             if not msg_id:
                 continue
 
-            references = msg.get('References', "").split()
-            self.metadata_map[msg_id] = {
+            collected[msg_id] = {
                 'key': key,
                 'subject': msg.get('Subject', ''),
                 'date': get_email_date(msg),
                 'in_reply_to': msg.get('In-Reply-To'),
-                'references': references[-1] if references else None
+                'references': _last_reference(msg.get('References'))
             }
             metadata_count += 1
+        self.metadata_map.update(collected)
 
         log_processing_step(
             self.logger, 2,
             f"메타데이터 수집 완료: 총 {metadata_count}개의 고유 메시지"
         )
 
+        if cache_path is not None:
+            try:
+                _save_metadata_cache(cache_path, collected)
+            except Exception as e:
+                log_file_operation(self.logger, '메타데이터 캐시 저장',
+                                   cache_path, success=False, error_msg=str(e))
+
     def backup_mbox(self, mbox_path):
         """간단한 mbox 백업 유틸리티"""
         try:
             dst = f"{mbox_path}.bak"
-            shutil.copy2(mbox_path, dst)
+            # 지원되는 파일시스템에서는 reflink로 데이터 복사 없이 백업
+            copy_file_fast(mbox_path, dst)
             log_file_operation(self.logger, 'mbox 백업', dst, success=True)
             return dst
         except Exception as e:
@@ -138,7 +617,7 @@ class EmailEvidenceProcessor:
                     'subject': msg.get('Subject', ''),
                     'date': get_email_date(msg),
                     'in_reply_to': msg.get('In-Reply-To'),
-                    'references': (msg.get('References', '').split()[-1] if msg.get('References') else None)
+                    'references': _last_reference(msg.get('References'))
                 }
                 counter += 1
         log_processing_step(
@@ -154,16 +633,52 @@ class EmailEvidenceProcessor:
             for j, msg in enumerate(thread):
                 simple[(i * 100000) + j] = msg
 
+        self.close_mbox()
         self.mbox = simple
+        self._msg_cache = None
+
+    def close_mbox(self) -> None:
+        """로드한 mbox를 닫습니다 (MMapMbox의 mmap과 파일 핸들 해제)."""
+        close = getattr(self.mbox, 'close', None)
+        if close is not None:
+            close()
+        self.mbox = None
+        self._msg_cache = None
+
+    def _get_full_message(self, key) -> Optional[Message]:
+        """
+        mbox 키로 전체 메시지를 가져옵니다 (없으면 None).
+        존재 확인과 조회를 한 번에 수행하고, 직전에 읽은 메시지는 다시 파싱하지 않습니다.
+        """
+        if not self.mbox:
+            return None
+        cached = self._msg_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        try:
+            msg = self.mbox.get_message(key)
+        except KeyError:
+            return None
+        if msg is not None:
+            self._msg_cache = (key, msg)
+        return msg
+
+    def get_all_message_metadata(self, limit: Optional[int] = None):
+        """
+        모든 메시지의 메타데이터와 기본 정보를 최신순으로 가져옵니다.
+        limit이 주어지면 최신 limit개만 선택한 뒤 그 메시지만 읽어 정보를 만듭니다.
+        """
+        items: Any = self.metadata_map.items()
+        if limit is not None:
+            # 전체 정렬 대신 상위 limit개만 선택 (동률 순서는 sort와 동일)
+            items = heapq.nlargest(
+                limit, items, key=lambda item: _date_sort_key(item[1]['date']))
 
-    def get_all_message_metadata(self):
-        """모든 메시지의 메타데이터와 기본 정보를 가져옵니다."""
         messages_info = []
-        for msg_id, meta in self.metadata_map.items():
+        for msg_id, meta in items:
             # mbox에서 전체 메시지 가져오기
-            if self.mbox and meta['key'] in self.mbox:
-                full_msg = self.mbox[meta['key']]
-
+            full_msg = self._get_full_message(meta['key'])
+            if full_msg is not None:
                 # 발신자, 수신자 정보 추출
                 sender = decode_text(full_msg.get('From', ''))
                 recipients = []
@@ -178,13 +693,12 @@ class EmailEvidenceProcessor:
 
                 if full_msg.is_multipart():
                     for part in full_msg.walk():
-                        disposition = part.get('Content-Disposition', '')
-                        if disposition and 'attachment' in disposition:
+                        if part.get_content_disposition() == 'attachment':
                             filename = part.get_filename()
                             if filename:
                                 decoded_filename = decode_text(filename)
-                                payload = part.get_payload(decode=True)
-                                size = len(payload) if payload else 0
+                                # 크기만 필요하므로 디코딩하지 않고 계산
+                                size = _attachment_size(part)
                                 total_size += size
 
                                 attachments.append({
@@ -216,8 +730,9 @@ class EmailEvidenceProcessor:
                     'size': 0
                 })
 
-        messages_info.sort(
-            key=lambda x: x['date'] if x['date'] else datetime.min, reverse=True)
+        if limit is None:
+            messages_info.sort(
+                key=lambda x: _date_sort_key(x['date']), reverse=True)
         return messages_info
 
     def get_message_content(self, msg_id):
@@ -226,11 +741,10 @@ class EmailEvidenceProcessor:
             return None
 
         meta = self.metadata_map[msg_id]
-        if not self.mbox or meta['key'] not in self.mbox:
+        full_msg = self._get_full_message(meta['key'])
+        if full_msg is None:
             return None
 
-        full_msg = self.mbox[meta['key']]
-
         content = {
             'text': '',
             'html': '',
@@ -238,14 +752,14 @@ class EmailEvidenceProcessor:
         }
 
         if full_msg.is_multipart():
-            for part in full_msg.walk():
-                disposition = part.get('Content-Disposition', '')
-                content_type = part.get_content_type()
+            for view in self._part_index(full_msg).parts:
+                disposition = view.disposition
+                content_type = view.content_type
 
-                if not disposition or 'attachment' not in disposition:
+                if disposition != 'attachment':
                     if content_type == 'text/plain' and not content['text']:
                         try:
-                            text_payload = part.get_payload(decode=True)
+                            text_payload = view.decoded
                             if text_payload:
                                 content['text'] = text_payload.decode(
                                     'utf-8', errors='ignore')
@@ -253,21 +767,21 @@ class EmailEvidenceProcessor:
                             pass
                     elif content_type == 'text/html' and not content['html']:
                         try:
-                            html_payload = part.get_payload(decode=True)
+                            html_payload = view.decoded
                             if html_payload:
                                 content['html'] = html_payload.decode(
                                     'utf-8', errors='ignore')
                         except Exception:
                             pass
-                elif disposition and 'attachment' in disposition:
-                    filename = part.get_filename()
+                else:
+                    filename = view.part.get_filename()
                     if filename:
                         decoded_filename = decode_text(filename)
-                        payload = part.get_payload(decode=True)
+                        payload = view.decoded
                         content['attachments'].append({
                             'filename': decoded_filename,
                             'size': len(payload) if payload else 0,
-                            'content_type': part.get_content_type()
+                            'content_type': content_type
                         })
         else:
             # 단일 파트 메시지
@@ -292,12 +806,111 @@ class EmailEvidenceProcessor:
             return None  # HTML 파일 경로를 반환하지 않음
 
         meta = self.metadata_map[msg_id]
-        full_msg = self.mbox.get_message(meta['key'])
+        full_msg = self._get_full_message(meta['key'])
 
         if not full_msg:
             print(f"  - 경고: Key '{meta['key']}'에 해당하는 전체 메시지를 찾을 수 없습니다.")
             return None
 
+        return self._process_message(meta, full_msg, output_base_dir)
+
+    def process_all(self, output_base_dir: str = OUTPUT_DIR,
+                    msg_ids: Optional[List[str]] = None,
+                    workers: Optional[int] = None) -> List[Optional[str]]:
+        """
+        여러 메시지를 처리합니다. workers가 2 이상이면 프로세스 풀에서 병렬로 처리합니다.
+
+        Args:
+            output_base_dir: 출력 디렉토리
+            msg_ids: 처리할 메시지 ID 목록 (None이면 전체)
+            workers: 작업 프로세스 수 (None이면 processing_options.parallel_workers, 기본 1,
+                     0이면 CPU 코어 수)
+
+        Returns:
+            msg_ids 순서대로 생성된 HTML 파일 경로 (제외/HTML 없음은 None)
+        """
+        if msg_ids is None:
+            msg_ids = list(self.metadata_map)
+        if workers is None:
+            workers = self.config.get(
+                'processing_options', {}).get('parallel_workers', 1)
+        workers = workers or os.cpu_count() or 1
+
+        if workers <= 1:
+            return [self.process_single_message(msg_id, output_base_dir)
+                    for msg_id in msg_ids]
+
+        results: List[Optional[str]] = []
+        pending = deque()
+
+        def _collect_one():
+            results.append(pending.popleft().result())
+
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_message_worker,
+                                 initargs=(self.config,)) as executor:
+            for msg_id in msg_ids:
+                raw_msg = self._get_raw_message(msg_id)
+                if raw_msg is None:
+                    # 순서 유지를 위해 대기 중인 결과를 먼저 수집
+                    while pending:
+                        _collect_one()
+                    results.append(self.process_single_message(
+                        msg_id, output_base_dir))
+                    continue
+
+                pending.append(executor.submit(
+                    _process_message_worker,
+                    self.metadata_map[msg_id], raw_msg, output_base_dir))
+                # 메모리에 보관되는 원본 메시지 수 제한
+                if len(pending) >= workers * 4:
+                    _collect_one()
+
+            while pending:
+                _collect_one()
+
+        return results
+
+    def _get_raw_message(self, msg_id: str) -> Optional[bytes]:
+        """작업 프로세스로 보낼 메시지 원본 바이트 (찾을 수 없으면 None)"""
+        meta = self.metadata_map.get(msg_id)
+        if meta is None or not self.mbox:
+            return None
+        try:
+            if hasattr(self.mbox, 'get_bytes'):
+                return self.mbox.get_bytes(meta['key'])
+            full_msg = self._get_full_message(meta['key'])
+            return full_msg.as_bytes() if full_msg else None
+        except KeyError:
+            return None
+
+    def _copy_raw_message(self, key, fileobj) -> bool:
+        """
+        mbox에 저장된 메시지 원본을 파일로 스트리밍 복사합니다.
+        파싱된 메시지를 다시 직렬화하지 않으므로 메모리 사용이 일정합니다.
+
+        Returns:
+            원본을 복사했으면 True (지원하지 않는 mbox 형태면 False)
+        """
+        try:
+            if isinstance(self.mbox, MMapMbox):
+                self.mbox.copy_to(key, fileobj)
+                return True
+            if isinstance(self.mbox, mailbox.mbox):
+                with self.mbox.get_file(key) as src:
+                    shutil.copyfileobj(src, fileobj, 64 * 1024)
+                return True
+        except KeyError:
+            pass
+        return False
+
+    def _process_message(self, meta: Dict[str, Any], full_msg: Message,
+                         output_base_dir: str,
+                         raw_msg: Optional[bytes] = None) -> Optional[str]:
+        """
+        메시지 하나를 제외 검사 후 HTML/첨부파일로 저장합니다.
+        raw_msg가 주어지면 제외 메시지를 저장할 때 재직렬화 대신 그대로 기록합니다.
+        """
         is_excluded, reason = self._is_excluded(full_msg)
         if is_excluded:
             thread_folder_name = sanitize_filename(
@@ -310,7 +923,10 @@ class EmailEvidenceProcessor:
             excluded_filepath = os.path.join(
                 excluded_dir, f"{base_filename}.eml")
             with open(excluded_filepath, 'wb') as f:
-                f.write(full_msg.as_bytes())
+                if raw_msg is not None:
+                    f.write(raw_msg)
+                elif not self._copy_raw_message(meta['key'], f):
+                    f.write(full_msg.as_bytes())
             print(
                 f" - [제외됨] {base_filename} (사유: {reason}). 'excluded' 폴더에 저장됨.")
             return None
@@ -324,70 +940,89 @@ class EmailEvidenceProcessor:
         os.makedirs(thread_path, exist_ok=True)
         print(f"\n[메시지 처리 시작] '{thread_folder_name}'")
 
-        html_body = None
-        html_part = None
-        cid_map = {}
-        attachments = []
-
-        for part in full_msg.walk():
-            if part.get_content_maintype() == 'multipart':
-                continue
-
-            disposition = part.get('Content-Disposition', '')
-            content_id = part.get('Content-ID')
-
-            if not html_part and part.get_content_type() == 'text/html' and 'attachment' not in disposition:
-                html_part = part
-            elif content_id and ('inline' in disposition or not disposition):
-                cid = content_id.strip('<>')
-                cid_map[cid] = part
-            elif 'attachment' in disposition:
-                attachments.append(part)
+        index = self._part_index(full_msg)
+        html_part = index.html_part
+        cid_map = index.inline_by_cid
+        attachments = index.attachments
 
         if html_part:
-            charset = html_part.get_content_charset() or 'utf-8'
-            try:
-                html_body = html_part.get_payload(
-                    decode=True).decode(charset, errors='ignore')
-            except (UnicodeDecodeError, LookupError):
-                html_body = html_part.get_payload(
-                    decode=True).decode('cp949', errors='ignore')
-
-            for cid, image_part in cid_map.items():
-                image_data = image_part.get_payload(decode=True)
-                mime_type = image_part.get_content_type()
-                base64_data = base64.b64encode(image_data).decode('utf-8')
-
-                data_uri = f"data:{mime_type};base64,{base64_data}"
-                html_body = html_body.replace(
-                    f'src="cid:{cid}"', f'src="{data_uri}"')
-                html_body = html_body.replace(
-                    f"src='cid:{cid}'", f"src='{data_uri}'")
+            # _is_excluded에서 이미 디코딩한 경우 그 결과를 재사용
+            html_body = html_part.text
+
+            # 'cid:' 참조가 없는 본문은 치환 탐색 생략
+            inline_images = bool(cid_map) and 'cid:' in html_body
+            if cid_map and not inline_images:
+                print(f"  - 참고: 본문에서 참조되지 않은 인라인 이미지 {len(cid_map)}개")
 
             html_filepath = os.path.join(thread_path, f"{base_filename}.html")
-            with open(html_filepath, 'w', encoding='utf-8') as f:
-                f.write(html_body)
+            with open(html_filepath, 'w', encoding='utf-8',
+                      buffering=HTML_WRITE_BUFFER_SIZE) as f:
+                if inline_images:
+                    self._write_inlined_html(f, html_body, cid_map)
+                else:
+                    f.write(html_body)
             print(f"  - HTML 저장 (이미지 내장): {html_filepath}")
             return html_filepath  # HTML 파일 경로 반환
 
-        for part in attachments:
-            filename = part.get_filename()
+        for view in attachments:
+            filename = view.part.get_filename()
             if filename:
                 decoded_filename = decode_text(filename)
                 sanitized_filename = sanitize_filename(decoded_filename)
                 if sanitized_filename:
                     filepath = os.path.join(thread_path, sanitized_filename)
-                    if not os.path.exists(filepath):
-                        payload = part.get_payload(decode=True)
-                        if payload:
-                            with open(filepath, 'wb') as f:
-                                f.write(payload)
-                            print(f"  - 첨부파일 저장: {filepath}")
-                        else:
-                            print(
-                                f"  - 경고: 첨부파일 '{sanitized_filename}'의 내용이 비어있습니다.")
+                    # 이미 있는 파일은 건너뜀 (존재 확인과 생성을 'x' 모드 open 한 번으로 처리)
+                    try:
+                        f = open(filepath, 'xb')
+                    except FileExistsError:
+                        continue
+                    # 대용량 base64 첨부파일은 디코딩하면서 바로 기록
+                    # (기록 중 실패하면 잘린 파일이 다음 실행에서 건너뛰어지지 않도록 삭제)
+                    try:
+                        with f:
+                            written = view.write_decoded(f)
+                    except BaseException:
+                        os.remove(filepath)
+                        raise
+                    if written:
+                        print(f"  - 첨부파일 저장: {filepath}")
+                    else:
+                        os.remove(filepath)
+                        print(
+                            f"  - 경고: 첨부파일 '{sanitized_filename}'의 내용이 비어있습니다.")
         return None
 
+    @staticmethod
+    def _write_inlined_html(fileobj: TextIO, html_body: str,
+                            cid_map: Dict[str, '_PartView']) -> None:
+        """
+        CID 참조 이미지를 data URI로 바꾸면서 HTML 본문을 조각 단위로 기록합니다.
+        본문을 한 번만 훑으며 치환된 전체 본문 문자열을 만들지 않고,
+        base64 인코딩은 실제로 참조된 CID에 대해서만 한 번씩 수행합니다.
+        """
+        # CID -> (data URI 접두어, base64 문자열), 이미지가 없으면 None
+        data_uris: Dict[str, Optional[Tuple[str, str]]] = {}
+        write = fileobj.write
+        pos = 0
+        for match in _CID_SRC_RE.finditer(html_body):
+            quote, cid = match.group(1), match.group(2)
+            if cid not in data_uris:
+                image_part = cid_map.get(cid)
+                image_data = image_part.decoded if image_part else None
+                data_uris[cid] = (
+                    (f"data:{image_part.content_type};base64,",
+                     binascii.b2a_base64(image_data, newline=False).decode('ascii'))
+                    if image_data is not None else None)
+            data_uri = data_uris[cid]
+            if data_uri is None:
+                continue
+            write(html_body[pos:match.start()])
+            write(f"src={quote}{data_uri[0]}")
+            write(data_uri[1])
+            write(quote)
+            pos = match.end()
+        write(html_body[pos:])
+
     def convert_html_to_pdf(self, html_filepath, party, evidence_number_counter):
         # HTML 파일을 읽고 PDF로 변환하는 별도의 메서드
         try:
@@ -416,82 +1051,77 @@ class EmailEvidenceProcessor:
         """
         향상된 메일 제외 로직
         """
-        exclude_keywords = self.config.get('exclude_keywords', [])
-        exclude_senders = self.config.get('exclude_senders', [])
-        exclude_domains = self.config.get('exclude_domains', [])
-        date_range_config = self.config.get('date_range', {})
-        required_keywords_config = self.config.get('required_keywords', {})
-
-        # required_keywords가 dict인지 확인하고 keywords 배열 추출
-        if isinstance(required_keywords_config, dict):
-            required_keywords = required_keywords_config.get('keywords', [])
-        else:
-            required_keywords = required_keywords_config or []
-
-        start_date_str = date_range_config.get('start')
-        end_date_str = date_range_config.get('end')
-        start_date = datetime.strptime(
-            start_date_str, '%Y-%m-%d').date() if start_date_str else None
-        end_date = datetime.strptime(
-            end_date_str, '%Y-%m-%d').date() if end_date_str else None
+        # 설정값은 _compile_filters에서 미리 준비한 필드만 사용
+        required_keywords = self._required_keywords
+        start_date = self._start_date
+        end_date = self._end_date
 
         subject = decode_text(msg.get('Subject', ''))
 
-        # 메일 본문 추출
-        body = ""
-        for part in msg.walk():
-            if part.get_content_maintype() == 'text':
-                charset = part.get_content_charset() or 'utf-8'
-                try:
-                    body += part.get_payload(decode=True).decode(charset,
-                                                                 errors='ignore')
-                except (UnicodeDecodeError, LookupError):
-                    body += part.get_payload(decode=True).decode('cp949',
-                                                                 errors='ignore')
-
-        full_content = subject + " " + body
         sender = msg.get('From', '')
-        sender_email_match = re.search(r'<(.+?)>', sender)
+        sender_email_match = _SENDER_ADDR_RE.search(sender)
         sender_email = sender_email_match.group(
             1) if sender_email_match else sender
-
-        # 1. 제외 키워드 검사
-        for keyword in exclude_keywords:
-            if keyword.lower() in full_content.lower():
-                return True, f"제외 키워드 '{keyword}' 포함"
+        sender_email_lower = sender_email.lower()
+
+        # 1. 제외 키워드 검사 (제목부터 텍스트 파트 순서로 검사하며 일치하면 즉시 중단,
+        #    필수 키워드 포함 여부도 같은 탐색에서 확인)
+        check_exclude = self._exclude_kw_matcher.pattern is not None
+        found_required = False
+        if check_exclude or required_keywords:
+            overlap = self._keyword_overlap
+            tail = ''
+            for chunk in self._scan_text_chunks(msg, subject):
+                buf = tail + chunk.lower()
+
+                if check_exclude:
+                    keyword = self._exclude_kw_matcher.search(buf)
+                    if keyword is not None:
+                        return True, f"제외 키워드 '{keyword}' 포함"
+
+                if required_keywords and not found_required:
+                    found_required = self._required_kw_matcher.search(
+                        buf) is not None
+                    if found_required and not check_exclude:
+                        break
+
+                tail = buf[-overlap:] if overlap > 0 else ''
 
         # 2. 제외 발신자 검사
-        for ex_sender in exclude_senders:
-            if ex_sender.lower() in sender_email.lower():
-                return True, f"제외 발신자 '{ex_sender}' 포함"
+        ex_sender = self._exclude_sender_matcher.search(sender_email_lower)
+        if ex_sender is not None:
+            return True, f"제외 발신자 '{ex_sender}' 포함"
 
         # 3. 제외 도메인 검사
-        for domain in exclude_domains:
-            if domain.lower() in sender_email.lower():
-                return True, f"제외 도메인 '{domain}' 포함"
+        domain = self._exclude_domain_matcher.search(sender_email_lower)
+        if domain is not None:
+            return True, f"제외 도메인 '{domain}' 포함"
 
         # 4. 날짜 범위 검사
         email_date = get_email_date(msg)
         if email_date:
             email_date_only = email_date.date()
             if start_date and email_date_only < start_date:
-                return True, f"시작일 '{start_date_str}' 이전"
+                return True, f"시작일 '{self._start_date_str}' 이전"
             if end_date and email_date_only > end_date:
-                return True, f"종료일 '{end_date_str}' 이후"
+                return True, f"종료일 '{self._end_date_str}' 이후"
 
         # 5. 필수 키워드 검사 (키워드가 설정된 경우만)
         if required_keywords:  # 빈 배열이 아닌 경우에만 검사
-            found_required = False
-            for req_keyword in required_keywords:
-                if req_keyword.lower() in full_content.lower():
-                    found_required = True
-                    break
-
             if not found_required:
                 return True, f"필수 키워드 미포함 (요구: {', '.join(required_keywords[:3])}...)"
 
         return False, "포함"
 
+    def _scan_text_chunks(self, msg, subject: str):
+        """
+        제외 검사 대상 텍스트를 제목, 텍스트 파트 순서로 하나씩 반환합니다.
+        전체 본문을 이어 붙이지 않으며, 호출 측이 중단하면 이후 파트는 디코딩하지 않습니다.
+        """
+        yield subject + " "
+        for view in self._part_index(msg).text_parts:
+            yield view.text
+
     def process_mbox_with_streaming(self, mbox_path: str, party: str, output_dir: str = None) -> dict:
         """스트리밍을 지원하는 mbox 파일 처리"""
         # 포렌식 무결성 기록 시작
@@ -506,9 +1136,14 @@ class EmailEvidenceProcessor:
         try:
             processed_count = 0
             evidence_files = []
-
-            # 스트리밍 처리
-            for message in self.streaming_processor.stream_emails(mbox_path):
+            stats_interval = self.config.get(
+                'performance_monitoring', {}).get('stats_interval_emails', 1000)
+
+            # 스트리밍 처리 (읽기 스레드가 다음 메시지를 파싱하는 동안 현재 메시지 처리)
+            messages = _iter_prefetched(
+                self.streaming_processor.stream_emails(mbox_path),
+                STREAM_PREFETCH_MESSAGES)
+            for message in messages:
                 if self._should_include_email_streaming(message):
                     evidence_number = self.get_evidence_number(party)
                     evidence_data = self.process_email_to_evidence(
@@ -519,7 +1154,7 @@ class EmailEvidenceProcessor:
                         processed_count += 1
 
                 # 통계 로그
-                if processed_count > 0 and processed_count % self.config.get('performance_monitoring', {}).get('stats_interval_emails', 1000) == 0:
+                if processed_count > 0 and processed_count % stats_interval == 0:
                     stats = self.streaming_processor.get_processing_statistics()
                     self.logger.info(f"처리 통계: {stats}")
 
@@ -543,12 +1178,8 @@ class EmailEvidenceProcessor:
     def _should_include_email_streaming(self, message) -> bool:
         """스트리밍 처리용 이메일 포함 여부 판단"""
         try:
-            subject = decode_text(message.get('Subject', ''))
-            sender = decode_text(message.get('From', ''))
-
-            # 기존 필터링 로직 재사용
-            should_exclude, reason = self.should_exclude_email(
-                subject, sender, "")
+            # 일반 처리와 같은 제외 검사 재사용 (미리 컴파일된 필터 사용)
+            should_exclude, reason = self._is_excluded(message)
             return not should_exclude
 
         except Exception as e:
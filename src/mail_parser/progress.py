@@ -4,6 +4,31 @@ import sys
 import time
 from typing import Optional
 
+# 진행률 바 최소 재출력 간격 (초, 약 30Hz)
+REDRAW_INTERVAL = 1 / 30
+# 진행률 바 출력 형식 (설명, 바, 현재, 전체, 백분율, 남은시간)
+_BAR_FMT = "\r{} |{}| {}/{} ({:.1f}%){}"
+_ETA_FMT = " (남은시간: {:.1f}초)"
+
+# 메일 처리 진행 상황 최소 출력 간격 (초)
+PROGRESS_PRINT_INTERVAL = 0.1
+
+# EmailProcessingProgress.STAGES의 인덱스 (진행 상황을 출력하는 단계)
+STAGE_MAIL, STAGE_PDF = 2, 3
+# 진행 상황 출력 형식 (위치 인자)
+_MAIL_PROGRESS_FMT = "진행률: {}/{} ({:.1f}%) | 처리됨: {}, 제외됨: {}\n"
+_PDF_PROGRESS_FMT = "PDF 변환: {}/{} ({:.1f}%)\n"
+
+
+def _stdout_isatty() -> bool:
+    """표준 출력이 터미널인지 확인합니다 (파일/파이프로 리다이렉트되면 False)."""
+    isatty = getattr(sys.stdout, 'isatty', None)
+    try:
+        return bool(isatty and isatty())
+    except ValueError:
+        # 이미 닫힌 스트림
+        return False
+
 
 class ProgressBar:
     """
@@ -16,6 +41,16 @@ class ProgressBar:
         self.description = description
         self.width = width
         self.start_time = time.time()
+        # 경과 시간 계산용 (시스템 시계 변경의 영향 없음)
+        self._start = time.monotonic()
+        # 마지막 출력 시각과 채워진 칸 수 (변화가 없거나 너무 잦은 출력은 생략)
+        self._last_draw = 0.0
+        self._last_filled = -1
+        # 채워진 칸 수별 바 문자열을 미리 만들어 두고 출력 시 그대로 사용
+        self._bars = tuple("█" * filled + "░" * (width - filled)
+                           for filled in range(width + 1))
+        # 터미널이 아니면 바를 다시 그리지 않음 (로그 파일에 \r 출력이 쌓이는 것 방지)
+        self._isatty = _stdout_isatty()
 
     def update(self, increment: int = 1):
         """
@@ -36,32 +71,50 @@ class ProgressBar:
         진행률을 100%로 설정하고 완료 메시지를 출력합니다.
         """
         self.current = self.total
+        elapsed = time.monotonic() - self._start
+        if not self._isatty:
+            # 바 없이 완료 줄만 출력
+            print(f"{self.description} {self.current}/{self.total} "
+                  f"완료! (소요시간: {elapsed:.1f}초)")
+            return
+        # 마지막 상태는 항상 출력
+        self._last_draw = 0.0
+        self._last_filled = -1
         self._display()
-        elapsed = time.time() - self.start_time
         print(f"\n완료! (소요시간: {elapsed:.1f}초)")
 
     def _display(self):
         """
         진행률 바를 화면에 출력합니다.
         """
-        if self.total == 0:
+        if self.total == 0 or not self._isatty:
             return
 
-        percentage = min(100, (self.current / self.total) * 100)
-        filled_width = int(self.width * self.current / self.total)
-
-        bar = "█" * filled_width + "░" * (self.width - filled_width)
-
-        elapsed = time.time() - self.start_time
-        if self.current > 0 and elapsed > 0:
-            rate = self.current / elapsed
-            eta = (self.total - self.current) / rate if rate > 0 else 0
-            eta_str = f" (남은시간: {eta:.1f}초)" if eta > 0 else ""
-        else:
-            eta_str = ""
-
-        sys.stdout.write(
-            f"\r{self.description} |{bar}| {self.current}/{self.total} ({percentage:.1f}%){eta_str}")
+        # 채워진 칸 수가 그대로면 시각 조회 없이 바로 반환
+        current = self.current
+        total = self.total
+        filled_width = int(self.width * current / total)
+        if filled_width == self._last_filled:
+            return
+        now = time.monotonic()
+        if now - self._last_draw < REDRAW_INTERVAL and current != total:
+            return
+        self._last_draw = now
+        self._last_filled = filled_width
+
+        percentage = min(100, (current / total) * 100)
+        bar = self._bars[max(0, min(filled_width, self.width))]
+
+        eta_str = ""
+        if current > 0:
+            elapsed = now - self._start
+            if elapsed > 0:
+                eta = (total - current) * elapsed / current
+                if eta > 0:
+                    eta_str = _ETA_FMT.format(eta)
+
+        sys.stdout.write(_BAR_FMT.format(
+            self.description, bar, current, total, percentage, eta_str))
         sys.stdout.flush()
 
 
@@ -70,26 +123,36 @@ class EmailProcessingProgress:
     메일 처리 전용 진행률 관리 클래스
     """
 
+    # (단계 이름, 진행률 %) - 인덱스가 단계 ID
+    STAGES = (
+        ("초기화", 0),
+        ("메타데이터 수집", 10),
+        ("메일 처리", 70),
+        ("PDF 변환", 90),
+        ("보고서 생성", 95),
+        ("완료", 100),
+    )
+    _STAGE_IDS = {name: stage_id for stage_id, (name, _) in enumerate(STAGES)}
+
     def __init__(self, total_emails: int):
         self.total_emails = total_emails
         self.processed_emails = 0
         self.excluded_emails = 0
         self.pdf_generated = 0
         self.current_stage = "초기화"
-        self.stages = {
-            "초기화": 0,
-            "메타데이터 수집": 10,
-            "메일 처리": 70,
-            "PDF 변환": 90,
-            "보고서 생성": 95,
-            "완료": 100
-        }
+        # 목록에 없는 단계 이름은 -1 (진행 상황 출력 없음)
+        self._stage_id = 0
+        # 카운터는 매번 갱신하되 출력은 일정 간격으로 모아서 수행
+        self._last_progress_print = 0.0
+        self._progress_pending = False
 
     def set_stage(self, stage_name: str):
         """
         현재 처리 단계를 설정합니다.
         """
+        self.flush_progress()
         self.current_stage = stage_name
+        self._stage_id = self._STAGE_IDS.get(stage_name, -1)
         self._display_stage_info()
 
     def update_email_processed(self, increment: int = 1):
@@ -122,23 +185,48 @@ class EmailProcessingProgress:
 
     def _display_progress(self):
         """
-        진행 상황을 출력합니다.
+        진행 상황을 출력합니다. (PROGRESS_PRINT_INTERVAL보다 잦은 호출은 모아서 다음에 출력)
+        줄 단위 출력이므로 터미널이 아닌 로그/리다이렉트 출력에도 그대로 기록합니다.
+        """
+        now = time.monotonic()
+        if now - self._last_progress_print < PROGRESS_PRINT_INTERVAL:
+            self._progress_pending = True
+            return
+        self._last_progress_print = now
+        self._write_progress()
+
+    def flush_progress(self):
+        """
+        아직 출력하지 않은 진행 상황이 있으면 즉시 출력합니다.
         """
+        if self._progress_pending:
+            self._last_progress_print = time.monotonic()
+            self._write_progress()
+
+    def _write_progress(self):
+        self._progress_pending = False
         total_processed = self.processed_emails + self.excluded_emails
 
-        if self.current_stage == "메일 처리" and self.total_emails > 0:
-            percentage = (total_processed / self.total_emails) * 100
-            print(f"진행률: {total_processed}/{self.total_emails} ({percentage:.1f}%) "
-                  f"| 처리됨: {self.processed_emails}, 제외됨: {self.excluded_emails}")
-        elif self.current_stage == "PDF 변환" and self.processed_emails > 0:
-            percentage = (self.pdf_generated / self.processed_emails) * 100
-            print(
-                f"PDF 변환: {self.pdf_generated}/{self.processed_emails} ({percentage:.1f}%)")
+        stage_id = self._stage_id
+        if stage_id == STAGE_MAIL and self.total_emails > 0:
+            line = _MAIL_PROGRESS_FMT.format(
+                total_processed, self.total_emails,
+                (total_processed / self.total_emails) * 100,
+                self.processed_emails, self.excluded_emails)
+        elif stage_id == STAGE_PDF and self.processed_emails > 0:
+            line = _PDF_PROGRESS_FMT.format(
+                self.pdf_generated, self.processed_emails,
+                (self.pdf_generated / self.processed_emails) * 100)
+        else:
+            return
+        sys.stdout.write(line)
+        sys.stdout.flush()
 
     def display_summary(self):
         """
         최종 처리 요약을 출력합니다.
         """
+        self.flush_progress()
         print("\n" + "="*50)
         print("📊 처리 완료 요약")
         print("="*50)
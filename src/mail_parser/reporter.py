@@ -1,22 +1,171 @@
 # src/mail_parser/reporter.py
 
+import logging
 import os
+from functools import lru_cache
 from datetime import datetime
-from typing import Any, Dict, List
+from operator import itemgetter
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Tuple
+
+from .json_utils import dumps_json_line, iter_json_lines
 
 # Delay importing openpyxl until actually generating Excel to avoid import-time
 # heavy dependency loading (numpy/openpyxl internals). Imports are placed inside
 # functions that require them.
 
+__all__ = ['ReportGenerator']
+
+logger = logging.getLogger(__name__)
+
+# lxml 없이 이 행 수를 넘는 보고서를 만들면 설치 권장 경고
+LXML_RECOMMENDED_ROWS = 1000
+# 이 행 수 이상이면 (설치된 경우) xlsxwriter constant_memory 모드로 기록
+XLSXWRITER_MIN_ROWS = 5000
+# spool 모드에서 항목을 임시로 기록하는 NDJSON 파일 이름 (output_dir 아래, 구분별)
+SPOOL_FILENAMES = {
+    'processed': '.evidence.spool.jsonl',
+    'excluded': '.excluded.spool.jsonl',
+}
+# spool 레코드에서 datetime 값이었던 필드 이름 목록을 담는 키 (다시 읽을 때 datetime으로 복원)
+_SPOOL_DATETIME_KEY = '__datetime_fields__'
+# Excel 보고서를 먼저 기록하는 임시 파일 접미사 (저장 완료 후 최종 경로로 교체)
+TMP_SUFFIX = '.tmp'
+# 제외 항목의 상태 값
+EXCLUDED_STATUS = '제외됨'
+
+# 처리 통계 항목의 표시 이름 (processing_stats 키 순서)
+_KOREAN_STAT_LABELS = {
+    'total_emails': '전체 메일 수',
+    'processed_emails': '처리된 메일 수',
+    'excluded_emails': '제외된 메일 수',
+    'generated_pdfs': '생성된 PDF 수',
+    'total_attachments': '총 첨부파일 수'
+}
+
+# 시트 행에 쓰는 항목 필드 (열 순서) 와 없는 키의 기본값
+_EVIDENCE_FIELDS = (
+    'evidence_number', 'date', 'subject', 'sender', 'receiver',
+    'attachments', 'file_path', 'hash_value', 'status', 'notes'
+)
+_EXCLUDED_FIELDS = ('date', 'subject', 'sender', 'exclusion_reason')
+_FIELD_DEFAULTS = dict.fromkeys(_EVIDENCE_FIELDS + _EXCLUDED_FIELDS, '')
+_FIELD_DEFAULTS['attachments'] = ()
+_get_evidence_fields = itemgetter(*_EVIDENCE_FIELDS)
+_get_excluded_fields = itemgetter(*_EXCLUDED_FIELDS)
+_ATTACHMENTS_COL = _EVIDENCE_FIELDS.index('attachments')
+# 첨부파일이 없는 행의 첨부파일 열 값
+_NO_ATTACH = "없음"
+
+
+@lru_cache(maxsize=4096)
+def _join_attachments(attachments: Tuple[str, ...]) -> str:
+    """첨부파일 이름 목록을 한 칸 문자열로 (같은 목록은 캐시된 문자열 재사용)."""
+    return ", ".join(attachments) or _NO_ATTACH
+
+
+def _evidence_row(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+    """증거목록 한 행의 값 (번호 제외) 을 열 순서대로 반환합니다."""
+    values = _get_evidence_fields({**_FIELD_DEFAULTS, **entry})
+    return (values[:_ATTACHMENTS_COL]
+            + (_join_attachments(tuple(values[_ATTACHMENTS_COL] or ())),)
+            + values[_ATTACHMENTS_COL + 1:])
+
+
+def _excluded_row(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+    """제외된 메일 한 행의 값 (번호 제외) 을 열 순서대로 반환합니다."""
+    return _get_excluded_fields({**_FIELD_DEFAULTS, **entry})
+
+
+def _to_spool_record(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """datetime 값을 ISO 문자열로 바꾸고 해당 필드 이름을 함께 기록합니다."""
+    datetime_fields = [key for key, value in entry.items()
+                       if isinstance(value, datetime)]
+    if not datetime_fields:
+        return entry
+    record = dict(entry)
+    for key in datetime_fields:
+        record[key] = entry[key].isoformat()
+    record[_SPOOL_DATETIME_KEY] = datetime_fields
+    return record
+
+
+def _from_spool_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """_to_spool_record로 기록한 레코드의 datetime 값을 복원합니다."""
+    for key in record.pop(_SPOOL_DATETIME_KEY, ()):
+        record[key] = datetime.fromisoformat(record[key])
+    return record
+
+
+def _save_atomic(save: Callable[[], None], tmp_path: str, output_path: str) -> str:
+    """
+    save()로 tmp_path에 기록한 뒤 output_path로 원자적으로 교체합니다.
+    실패하면 임시 파일을 지우고 원인을 연결한 OSError를 발생시킵니다.
+    """
+    try:
+        save()
+        os.replace(tmp_path, output_path)
+    except Exception as e:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise OSError(f"Excel 파일 저장 실패: {output_path} ({e})") from e
+    return output_path
+
 
 class ReportGenerator:
     """
     증거목록 및 처리 보고서 생성 클래스
     """
 
-    def __init__(self, output_dir: str = "processed_emails"):
+    # 시트 머리글과 열 너비 (openpyxl/xlsxwriter 공용)
+    _HEADERS = (
+        "번호", "증거번호", "날짜", "제목", "발신자", "수신자",
+        "첨부파일", "파일경로", "해시값(SHA-256)", "상태", "비고"
+    )
+    _COL_WIDTHS = (5, 15, 12, 40, 25, 25, 30, 50, 70, 10, 20)
+    _EXCL_HEADERS = ("번호", "날짜", "제목", "발신자", "제외 사유")
+    _EXCL_WIDTHS = (5, 12, 40, 25, 30)
+
+    @classmethod
+    def _ensure_styles(cls):
+        """openpyxl 서식 객체를 클래스 단위로 한 번만 생성합니다 (openpyxl은 지연 import)."""
+        if hasattr(cls, '_HEADER_FONT'):
+            return
+        from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+        thin = Side(style='thin')
+        cls._BORDER = Border(left=thin, right=thin, top=thin, bottom=thin)
+        cls._HEADER_FILL = PatternFill(
+            start_color="366092", end_color="366092", fill_type="solid")
+        cls._HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+        cls._DATA_FONT = Font(name='맑은 고딕', size=10)
+        cls._DATA_ALIGN = Alignment(vertical="center", wrap_text=True)
+        cls._TITLE_FONT = Font(size=14, bold=True)
+        cls._BOLD_FONT = Font(bold=True)
+        cls._EXCL_HEADER_FILL = PatternFill(
+            start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
+        # 마지막에 지정: hasattr 검사가 모든 서식이 준비된 뒤에만 참이 되도록
+        cls._HEADER_FONT = Font(
+            name='맑은 고딕', size=11, bold=True, color="FFFFFF")
+
+    def __init__(self, output_dir: str = "processed_emails", spool: bool = False):
+        """
+        spool=True이면 항목을 메모리 목록 대신 output_dir의 NDJSON 파일에 기록하고,
+        보고서 생성 시 한 줄씩 다시 읽습니다.
+        항목은 추가 시점에 처리/제외로 나누어 보관하므로 시트 작성 시 다시 거르지 않습니다.
+        """
         self.output_dir = output_dir
-        self.evidence_list: List[Dict[str, Any]] = []
+        self._entries: Dict[str, List[Dict[str, Any]]] = {
+            'processed': [], 'excluded': []}
+        self.entry_count = 0
+        # 구분 -> (spool 파일 경로, 열린 파일)
+        self._spools: Dict[str, Tuple[str, BinaryIO]] = {}
+        if spool:
+            os.makedirs(output_dir, exist_ok=True)
+            for kind, filename in SPOOL_FILENAMES.items():
+                path = os.path.join(output_dir, filename)
+                self._spools[kind] = (path, open(path, 'wb', buffering=1 << 20))
         self.processing_stats = {
             'total_emails': 0,
             'processed_emails': 0,
@@ -27,14 +176,55 @@ class ReportGenerator:
 
     def add_evidence_entry(self, entry: Dict[str, Any]):
         entry['status'] = entry.get('status', '')
-        self.evidence_list.append(entry)
+        self._add_entry(entry)
         self.processing_stats['processed_emails'] += 1
 
     def add_excluded_entry(self, entry: Dict[str, Any]):
-        entry['status'] = '제외됨'
-        self.evidence_list.append(entry)
+        entry['status'] = EXCLUDED_STATUS
+        self._add_entry(entry)
         self.processing_stats['excluded_emails'] += 1
 
+    @property
+    def evidence_list(self) -> List[Dict[str, Any]]:
+        """처리된 항목 다음 제외된 항목 (spool 모드에서는 파일에서 읽음)"""
+        return list(self._iter_entries('processed')) + list(self._iter_entries('excluded'))
+
+    def _add_entry(self, entry: Dict[str, Any]):
+        kind = 'excluded' if entry['status'] == EXCLUDED_STATUS else 'processed'
+        spool = self._spools.get(kind)
+        if spool is not None:
+            # json 대체 경로는 datetime을 직렬화하지 못하고 orjson은 문자열로 돌려주므로
+            # 날짜 열 서식이 유지되도록 직접 표시해 두었다가 읽을 때 복원
+            spool[1].write(dumps_json_line(_to_spool_record(entry)))
+        else:
+            self._entries[kind].append(entry)
+        self.entry_count += 1
+
+    def _iter_entries(self, kind: str) -> Iterator[Dict[str, Any]]:
+        """구분('processed'/'excluded')별 항목을 추가된 순서대로 반환합니다."""
+        spool = self._spools.get(kind)
+        if spool is not None:
+            spool[1].flush()
+            for record in iter_json_lines(spool[0]):
+                yield _from_spool_record(record)
+        else:
+            yield from self._entries[kind]
+
+    def close(self):
+        """spool 파일을 닫고 삭제합니다."""
+        for path, f in self._spools.values():
+            f.close()
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._spools = {}
+
+    def _stat_rows(self) -> List[Tuple[str, int]]:
+        """(표시 이름, 값) 목록"""
+        return [(_KOREAN_STAT_LABELS[key], self.processing_stats[key])
+                for key in _KOREAN_STAT_LABELS]
+
     def update_stats(self, stat_name: str, value: int = 1):
         if stat_name in self.processing_stats:
             self.processing_stats[stat_name] += value
@@ -47,140 +237,195 @@ class ReportGenerator:
                 self.output_dir, f"증거목록_{party}_{timestamp}.xlsx")
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        tmp_path = output_path + TMP_SUFFIX
+
+        # 대용량 보고서는 행을 바로 디스크로 내보내는 xlsxwriter 사용 (선택 의존성)
+        if self.entry_count >= XLSXWRITER_MIN_ROWS:
+            try:
+                import xlsxwriter
+            except ImportError:
+                xlsxwriter = None
+            if xlsxwriter is not None:
+                return self._write_with_xlsxwriter(
+                    xlsxwriter, tmp_path, output_path, party)
 
         # lazy import openpyxl to avoid heavy import on module load
-        from openpyxl import Workbook
-        from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-        from openpyxl.utils import get_column_letter
-
-        wb = Workbook()
-        self._create_evidence_sheet(wb, party)
-        self._create_statistics_sheet(wb)
-        self._create_excluded_sheet(wb)
+        from openpyxl import LXML, Workbook
 
-        if 'Sheet' in wb.sheetnames:
-            wb.remove(wb['Sheet'])
+        # openpyxl은 lxml이 설치되어 있으면 자동으로 C 기반 XML 기록기를 사용
+        if not LXML and self.entry_count > LXML_RECOMMENDED_ROWS:
+            logger.warning(
+                "lxml이 설치되지 않아 Excel 저장이 느릴 수 있습니다 "
+                f"({self.entry_count}행). 'pip install lxml' 권장")
 
-        try:
-            wb.save(output_path)
-            return output_path
-        except Exception as e:
-            raise Exception(f"Excel 파일 저장 실패: {str(e)}")
+        # write-only 모드: 셀 객체를 보관하지 않고 행 단위로 바로 XML에 기록
+        wb = Workbook(write_only=True)
+        self._create_evidence_sheet(wb, party)
+        if self._has_stats():
+            self._create_statistics_sheet(wb)
+        if self._has_excluded():
+            self._create_excluded_sheet(wb)
+
+        return _save_atomic(lambda: wb.save(tmp_path), tmp_path, output_path)
+
+    def _has_stats(self) -> bool:
+        """처리 통계에 0이 아닌 값이 하나라도 있는지 (모두 0이면 통계 시트 생략)"""
+        return any(self.processing_stats.values())
+
+    def _has_excluded(self) -> bool:
+        """제외된 메일이 있는지 (없으면 제외된 메일 시트 생략)"""
+        return self.processing_stats['excluded_emails'] > 0
+
+    def _write_with_xlsxwriter(self, xlsxwriter, tmp_path: str,
+                               output_path: str, party: str) -> str:
+        """
+        xlsxwriter constant_memory 모드로 세 시트를 기록합니다.
+        각 행을 쓰는 즉시 임시 파일로 내보내므로 행은 시트별로 순서대로만 기록합니다.
+        """
+        wb = xlsxwriter.Workbook(tmp_path, {
+            'constant_memory': True,
+            'strings_to_urls': False,
+            'remove_timezone': True,
+        })
+
+        # 증거목록 시트 (openpyxl 버전과 같은 서식)
+        ws = wb.add_worksheet(f"{party} 증거목록")
+        for col, width in enumerate(self._COL_WIDTHS):
+            ws.set_column(col, col, width)
+        header_fmt = wb.add_format({
+            'font_name': '맑은 고딕', 'font_size': 11, 'bold': True,
+            'font_color': '#FFFFFF', 'bg_color': '#366092', 'pattern': 1,
+            'align': 'center', 'valign': 'vcenter', 'border': 1})
+        body_props = {'font_name': '맑은 고딕', 'font_size': 10,
+                      'valign': 'vcenter', 'text_wrap': True, 'border': 1}
+        body_fmt = wb.add_format(body_props)
+        date_fmt = wb.add_format(
+            dict(body_props, num_format='yyyy-mm-dd hh:mm:ss'))
+
+        ws.write_row(0, 0, self._HEADERS, header_fmt)
+
+        for row, entry in enumerate(self._iter_entries('processed'), 1):
+            values = _evidence_row(entry)
+            date_value = values[1]
+            ws.write_row(row, 0, (row, values[0]), body_fmt)
+            ws.write(row, 2, date_value,
+                     date_fmt if isinstance(date_value, datetime) else body_fmt)
+            ws.write_row(row, 3, values[2:], body_fmt)
+
+        # 처리 통계 시트
+        if self._has_stats():
+            ws = wb.add_worksheet("처리 통계")
+            ws.set_column(0, 0, 20)
+            ws.set_column(1, 1, 15)
+            bold_fmt = wb.add_format({'bold': True})
+            ws.write(0, 0, "메일박스 처리 통계",
+                     wb.add_format({'font_size': 14, 'bold': True}))
+            ws.write(1, 0,
+                     f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            ws.write_row(3, 0, ("구분", "개수"), bold_fmt)
+            for row, (label, value) in enumerate(self._stat_rows(), 4):
+                ws.write_row(row, 0, (label, value))
+
+        # 제외된 메일 시트
+        if self._has_excluded():
+            ws = wb.add_worksheet("제외된 메일")
+            for col, width in enumerate(self._EXCL_WIDTHS):
+                ws.set_column(col, col, width)
+            ws.write_row(0, 0, self._EXCL_HEADERS,
+                         wb.add_format({'bold': True, 'bg_color': '#FFCCCC', 'pattern': 1}))
+            for row, entry in enumerate(self._iter_entries('excluded'), 1):
+                ws.write_row(row, 0, (row, *_excluded_row(entry)))
+
+        return _save_atomic(wb.close, tmp_path, output_path)
 
     def _create_evidence_sheet(self, wb, party: str):
         # lazy imports
-        from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import NamedStyle
         from openpyxl.utils import get_column_letter
 
-        ws = wb.active
-        ws.title = f"{party} 증거목록"
+        self._ensure_styles()
+        ws = wb.create_sheet(f"{party} 증거목록")
 
-        headers = [
-            "번호", "증거번호", "날짜", "제목", "발신자", "수신자",
-            "첨부파일", "파일경로", "해시값(SHA-256)", "상태", "비고"
-        ]
-
-        header_font = Font(name='맑은 고딕', size=11, bold=True, color="FFFFFF")
-        header_fill = PatternFill(
-            start_color="366092", end_color="366092", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
-
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-
-        processed_entries = [
-            entry for entry in self.evidence_list if entry.get('status') != '제외됨']
-
-        for row, entry in enumerate(processed_entries, 2):
-            ws.cell(row=row, column=1, value=row-1)
-            ws.cell(row=row, column=2, value=entry.get('evidence_number', ''))
-            ws.cell(row=row, column=3, value=entry.get('date', ''))
-            ws.cell(row=row, column=4, value=entry.get('subject', ''))
-            ws.cell(row=row, column=5, value=entry.get('sender', ''))
-            ws.cell(row=row, column=6, value=entry.get('receiver', ''))
-
-            attachments = entry.get('attachments', [])
-            attachment_str = ", ".join(attachments) if attachments else "없음"
-            ws.cell(row=row, column=7, value=attachment_str)
-
-            ws.cell(row=row, column=8, value=entry.get('file_path', ''))
-            ws.cell(row=row, column=9, value=entry.get('hash_value', ''))
-            ws.cell(row=row, column=10, value=entry.get('status', ''))
-            ws.cell(row=row, column=11, value=entry.get('notes', ''))
-
-        column_widths = [5, 15, 12, 40, 25, 25, 30, 50, 70, 10, 20]
-        for col, width in enumerate(column_widths, 1):
+        # write-only 시트는 행을 쓰기 전에 열 너비를 지정해야 함
+        for col, width in enumerate(self._COL_WIDTHS, 1):
             ws.column_dimensions[get_column_letter(col)].width = width
 
-        thin_border = Border(left=Side(style='thin'), right=Side(
-            style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-
-        for row in ws.iter_rows(min_row=1, max_row=len(processed_entries)+1, min_col=1, max_col=len(headers)):
-            for cell in row:
-                cell.border = thin_border
-                if cell.row > 1:
-                    cell.font = Font(name='맑은 고딕', size=10)
-                    cell.alignment = Alignment(
-                        vertical="center", wrap_text=True)
+        # 서식은 이름 있는 스타일로 한 번 등록하고 셀마다 한 번에 지정
+        # (글꼴/테두리/정렬을 셀마다 따로 지정하면 스타일 테이블 조회가 세 번씩 발생)
+        header_style = NamedStyle(
+            name=f"{party} 증거목록 머리글",
+            font=self._HEADER_FONT, fill=self._HEADER_FILL,
+            alignment=self._HEADER_ALIGN, border=self._BORDER)
+        body_style = NamedStyle(
+            name=f"{party} 증거목록 본문",
+            font=self._DATA_FONT, alignment=self._DATA_ALIGN,
+            border=self._BORDER)
+        wb.add_named_style(header_style)
+        wb.add_named_style(body_style)
+
+        def _styled_cell(value, style_name):
+            # 스타일을 먼저 지정해야 날짜 값의 표시 형식이 유지됨
+            cell = WriteOnlyCell(ws)
+            cell.style = style_name
+            cell.value = value
+            return cell
+
+        ws.append([_styled_cell(header, header_style.name)
+                   for header in self._HEADERS])
+
+        body_style_name = body_style.name
+
+        for row_number, entry in enumerate(self._iter_entries('processed'), 1):
+            ws.append([_styled_cell(value, body_style_name)
+                       for value in (row_number, *_evidence_row(entry))])
 
     def _create_statistics_sheet(self, wb):
-        from openpyxl.styles import Font
+        from openpyxl.cell import WriteOnlyCell
+
+        self._ensure_styles()
         ws = wb.create_sheet("처리 통계")
 
-        ws.cell(row=1, column=1, value="메일박스 처리 통계").font = Font(
-            size=14, bold=True)
-        ws.cell(row=2, column=1,
-                value=f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
-        stats_data = [
-            ("구분", "개수"),
-            ("전체 메일 수", self.processing_stats['total_emails']),
-            ("처리된 메일 수", self.processing_stats['processed_emails']),
-            ("제외된 메일 수", self.processing_stats['excluded_emails']),
-            ("생성된 PDF 수", self.processing_stats['generated_pdfs']),
-            ("총 첨부파일 수", self.processing_stats['total_attachments'])
-        ]
+        ws.column_dimensions['A'].width = 20
+        ws.column_dimensions['B'].width = 15
 
-        for row, (label, value) in enumerate(stats_data, 4):
-            ws.cell(row=row, column=1, value=label)
-            ws.cell(row=row, column=2, value=value)
+        title_cell = WriteOnlyCell(ws, value="메일박스 처리 통계")
+        title_cell.font = self._TITLE_FONT
+        ws.append([title_cell])
+        ws.append(
+            [f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
+        ws.append([])
 
-            if row == 4:
-                ws.cell(row=row, column=1).font = Font(bold=True)
-                ws.cell(row=row, column=2).font = Font(bold=True)
+        header_cells = []
+        for header in ("구분", "개수"):
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = self._BOLD_FONT
+            header_cells.append(cell)
+        ws.append(header_cells)
 
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 15
+        for label, value in self._stat_rows():
+            ws.append([label, value])
 
     def _create_excluded_sheet(self, wb):
-        from openpyxl.styles import Font, PatternFill
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
 
+        self._ensure_styles()
         ws = wb.create_sheet("제외된 메일")
 
-        headers = ["번호", "날짜", "제목", "발신자", "제외 사유"]
-
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(
-                start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
-
-        excluded_entries = [
-            entry for entry in self.evidence_list if entry.get('status') == '제외됨']
+        for col, width in enumerate(self._EXCL_WIDTHS, 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
 
-        for row, entry in enumerate(excluded_entries, 2):
-            ws.cell(row=row, column=1, value=row-1)
-            ws.cell(row=row, column=2, value=entry.get('date', ''))
-            ws.cell(row=row, column=3, value=entry.get('subject', ''))
-            ws.cell(row=row, column=4, value=entry.get('sender', ''))
-            ws.cell(row=row, column=5, value=entry.get('exclusion_reason', ''))
+        header_cells = []
+        for header in self._EXCL_HEADERS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = self._BOLD_FONT
+            cell.fill = self._EXCL_HEADER_FILL
+            header_cells.append(cell)
+        ws.append(header_cells)
 
-        column_widths = [5, 12, 40, 25, 30]
-        for col, width in enumerate(column_widths, 1):
-            ws.column_dimensions[get_column_letter(col)].width = width
+        for row_number, entry in enumerate(self._iter_entries('excluded'), 1):
+            ws.append((row_number, *_excluded_row(entry)))
 
     def generate_summary_report(self, output_path: str = None) -> str:
         if output_path is None:
@@ -190,31 +435,30 @@ class ReportGenerator:
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("="*50 + "\n")
-            f.write("메일박스 증거 처리 요약 보고서\n")
-            f.write("="*50 + "\n")
-            f.write(
-                f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            f.write("처리 통계:\n")
-            f.write("-"*30 + "\n")
-            for key, value in self.processing_stats.items():
-                korean_labels = {
-                    'total_emails': '전체 메일 수',
-                    'processed_emails': '처리된 메일 수',
-                    'excluded_emails': '제외된 메일 수',
-                    'generated_pdfs': '생성된 PDF 수',
-                    'total_attachments': '총 첨부파일 수'
-                }
-                label = korean_labels.get(key, key)
-                f.write(f"{label}: {value}개\n")
-
-            f.write(
-                f"\n처리율: {self.processing_stats['processed_emails']/max(self.processing_stats['total_emails'], 1)*100:.1f}%\n")
-
-            if self.processing_stats['excluded_emails'] > 0:
-                f.write(f"\n제외된 메일의 주요 사유:\n")
-                f.write("-"*30 + "\n")
+        lines = [
+            "="*50 + "\n",
+            "메일박스 증거 처리 요약 보고서\n",
+            "="*50 + "\n",
+            f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            "처리 통계:\n",
+            "-"*30 + "\n",
+        ]
+        for key, value in self.processing_stats.items():
+            label = _KOREAN_STAT_LABELS.get(key, key)
+            lines.append(f"{label}: {value}개\n")
+
+        lines.append(
+            f"\n처리율: {self.processing_stats['processed_emails']/max(self.processing_stats['total_emails'], 1)*100:.1f}%\n")
+
+        if self.processing_stats['excluded_emails'] > 0:
+            lines.append(f"\n제외된 메일의 주요 사유:\n")
+            lines.append("-"*30 + "\n")
+
+        # 한 번 인코딩한 바이트를 한 번에 기록 (텍스트 모드의 줄바꿈 변환은 직접 적용)
+        text = "".join(lines)
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        with open(output_path, 'wb') as f:
+            f.write(text.encode('utf-8'))
 
         return output_path
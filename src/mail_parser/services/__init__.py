@@ -1,11 +1,25 @@
 """
 Core services for the email evidence processing system.
+
+서비스 클래스는 처음 접근할 때 해당 모듈만 import합니다 (PEP 562).
 """
 
-from .email_processor import EmailProcessor
-from .evidence_manager import EvidenceManager
-from .timeline_generator import TimelineGenerator
-from .integrity_service import IntegrityService
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .email_processor import EmailProcessor
+    from .evidence_manager import EvidenceManager
+    from .integrity_service import IntegrityService
+    from .timeline_generator import TimelineGenerator
+
+# 공개 이름 -> 정의된 하위 모듈
+_LAZY = {
+    'EmailProcessor': '.email_processor',
+    'EvidenceManager': '.evidence_manager',
+    'TimelineGenerator': '.timeline_generator',
+    'IntegrityService': '.integrity_service',
+}
 
 __all__ = [
     'EmailProcessor',
@@ -13,3 +27,17 @@ __all__ = [
     'TimelineGenerator',
     'IntegrityService'
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    obj = getattr(module, name)
+    # 이후 접근은 모듈 전역에서 바로 조회
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -180,15 +180,18 @@ class EmailProcessor:
                     content_id=part.get('Content-ID')
                 )
 
-                # 해시 계산
-                attachment_model.calculate_hash()
-
                 attachments.append(attachment_model)
 
             except Exception as e:
                 print(f"첨부파일 추출 오류 ({filename}): {e}")
                 continue
 
+        # 해시 계산 (저장한 첨부파일을 한 번에 병렬 처리)
+        hashes = self.integrity_service.calculate_hashes_batch(
+            [attachment.file_path for attachment in attachments])
+        for attachment, file_hash in zip(attachments, hashes):
+            attachment.file_hash = file_hash
+
         return attachments
 
     def filter_emails(self, emails: List[EmailModel]) -> List[EmailModel]:
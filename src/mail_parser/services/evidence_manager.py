@@ -2,12 +2,12 @@
 Evidence management service for court submission.
 """
 
-import json
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+from ..json_utils import read_json, write_json
 from ..models import EmailModel, EvidenceModel, EvidenceType, EvidenceStatus
 from .integrity_service import IntegrityService
 
@@ -36,8 +36,7 @@ class EvidenceManager:
             return
 
         try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(self.metadata_file)
 
             for evidence_data in data.get('evidence_list', []):
                 evidence = EvidenceModel.from_dict(evidence_data)
@@ -61,8 +60,7 @@ class EvidenceManager:
                 'last_updated': datetime.now().isoformat()
             }
 
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            write_json(self.metadata_file, data)
 
         except Exception as e:
             print(f"메타데이터 저장 오류: {e}")
@@ -2,11 +2,34 @@
 Integrity verification service.
 """
 
+import atexit
 import hashlib
-import json
+import os
+import weakref
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import BinaryIO, Dict, Any, List, Optional, Tuple, Union
+
+from ..json_utils import dumps_json_line, iter_json_lines, read_json
+
+# hashlib.file_digest (Python 3.11+) 가 없을 때 파일을 읽는 청크 크기
+HASH_CHUNK_SIZE = 1 << 20
+# 무결성 로그(NDJSON) 쓰기 버퍼 크기
+LOG_BUFFER_SIZE = 1 << 20
+# 집계에 필요한 무결성 로그 항목 키 (하나라도 없으면 로드 시 건너뜀)
+REQUIRED_LOG_KEYS = ('timestamp', 'entity_id', 'entity_type', 'verified')
+
+# 로그 파일이 열려 있는 서비스 (약한 참조라 종료 시 flush 등록이 인스턴스를 붙잡지 않음)
+_OPEN_SERVICES = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_services():
+    """프로세스 종료 시 아직 열려 있는 무결성 로그 버퍼를 기록"""
+    for service in list(_OPEN_SERVICES):
+        service.flush()
 
 
 class IntegrityService:
@@ -16,37 +39,96 @@ class IntegrityService:
         """초기화"""
         self.log_file = Path(log_file)
         self.integrity_log = []
-
-        # 기존 로그 로드
+        # 추가 기록용 파일 (첫 기록 시 연다)
+        self._log_fh: Optional[BinaryIO] = None
+        # 보고서/조회용 누적 집계 (로그를 다시 훑지 않도록 항목 추가 시 갱신)
+        self._verified = 0
+        self._last_ts: Optional[str] = None
+        self._failed_list: List[Dict[str, Any]] = []
+        self._by_entity: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+
+        # 기존 로그 로드 (집계할 수 없는 형식의 항목은 경고 후 제외)
         self._load_integrity_log()
+        valid_log = [log_entry for log_entry in self.integrity_log
+                     if isinstance(log_entry, dict) and
+                     all(key in log_entry for key in REQUIRED_LOG_KEYS)]
+        if len(valid_log) != len(self.integrity_log):
+            print(f"무결성 로그 형식 오류: {len(self.integrity_log) - len(valid_log)}개 항목을 "
+                  f"건너뜁니다 ({self.log_file})")
+            self.integrity_log = valid_log
+        for log_entry in self.integrity_log:
+            self._index_entry(log_entry)
 
     def _load_integrity_log(self):
-        """무결성 로그 로드"""
+        """무결성 로그 로드 (한 줄에 항목 하나인 NDJSON, 이전 JSON 배열 형식도 읽음)"""
         if not self.log_file.exists():
             return
 
         try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                self.integrity_log = json.load(f)
+            with open(self.log_file, 'rb') as f:
+                legacy = f.read(1).lstrip() == b'['
+            if legacy:
+                self.integrity_log = read_json(self.log_file)
+                # 이후 항목을 줄 단위로 추가할 수 있도록 NDJSON으로 한 번 변환
+                self._rewrite_integrity_log()
+            else:
+                self.integrity_log = list(iter_json_lines(self.log_file))
         except Exception as e:
             print(f"무결성 로그 로드 오류: {e}")
             self.integrity_log = []
 
-    def _save_integrity_log(self):
-        """무결성 로그 저장"""
+    def _index_entry(self, log_entry: Dict[str, Any]):
+        """누적 집계에 항목 하나 반영"""
+        if log_entry['verified']:
+            self._verified += 1
+        else:
+            self._failed_list.append(log_entry)
+        timestamp = log_entry['timestamp']
+        if self._last_ts is None or timestamp > self._last_ts:
+            self._last_ts = timestamp
+        self._by_entity[(log_entry['entity_id'], log_entry['entity_type'])].append(log_entry)
+
+    def _rewrite_integrity_log(self):
+        """메모리의 무결성 로그 전체를 NDJSON으로 다시 기록"""
         try:
-            with open(self.log_file, 'w', encoding='utf-8') as f:
-                json.dump(self.integrity_log, f, ensure_ascii=False, indent=2)
+            with open(self.log_file, 'wb') as f:
+                for log_entry in self.integrity_log:
+                    f.write(dumps_json_line(log_entry))
         except Exception as e:
             print(f"무결성 로그 저장 오류: {e}")
 
+    def _append_integrity_log(self, log_entry: Dict[str, Any]):
+        """무결성 로그 항목 한 줄 추가 (버퍼에 모았다가 flush/종료 시 기록)"""
+        try:
+            if self._log_fh is None:
+                self._log_fh = open(self.log_file, 'ab', buffering=LOG_BUFFER_SIZE)
+                _OPEN_SERVICES.add(self)
+            self._log_fh.write(dumps_json_line(log_entry))
+        except Exception as e:
+            print(f"무결성 로그 저장 오류: {e}")
+
+    def flush(self):
+        """버퍼에 남은 무결성 로그를 파일에 기록"""
+        if self._log_fh is not None and not self._log_fh.closed:
+            self._log_fh.flush()
+
+    def close(self):
+        """무결성 로그 파일 닫기"""
+        if self._log_fh is not None:
+            self.flush()
+            self._log_fh.close()
+            _OPEN_SERVICES.discard(self)
+            self._log_fh = None
+
     def calculate_file_hash(self, file_path: str) -> str:
         """파일 해시 계산"""
-        hasher = hashlib.sha256()
-
         try:
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
+                # 3.11+: 파일 읽기와 해시 갱신을 C 코드에서 GIL 없이 수행
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+                hasher = hashlib.sha256()
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
                     hasher.update(chunk)
             return hasher.hexdigest()
         except Exception as e:
@@ -55,15 +137,28 @@ class IntegrityService:
 
     def calculate_message_hash(self, message_content: str) -> str:
         """메시지 내용 해시 계산"""
-        hasher = hashlib.sha256()
-        hasher.update(message_content.encode('utf-8'))
-        return hasher.hexdigest()
+        return hashlib.sha256(message_content.encode('utf-8')).hexdigest()
 
     def calculate_data_hash(self, data: bytes) -> str:
-        """바이너리 데이터 해시 계산"""
-        hasher = hashlib.sha256()
-        hasher.update(data)
-        return hasher.hexdigest()
+        """바이너리 데이터 해시 계산 (bytes, memoryview 등 버퍼 객체는 복사 없이 사용)"""
+        return hashlib.sha256(data).hexdigest()
+
+    def calculate_hashes_batch(self, items: List[Union[str, Path, bytes]]) -> List[str]:
+        """
+        여러 파일(경로) 또는 바이너리 데이터의 해시를 한 번에 계산합니다.
+        hashlib은 해시 계산 중 GIL을 해제하므로 스레드 풀로 병렬 처리합니다.
+        결과는 입력 순서와 같으며, 읽을 수 없는 파일은 빈 문자열입니다.
+        """
+        def _hash(item) -> str:
+            if isinstance(item, (str, Path)):
+                return self.calculate_file_hash(str(item))
+            return self.calculate_data_hash(item)
+
+        if len(items) < 2:
+            return [_hash(item) for item in items]
+        max_workers = min(len(items), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_hash, items))
 
     def verify_file_integrity(self, file_path: str, expected_hash: str) -> bool:
         """파일 무결성 검증"""
@@ -93,7 +188,8 @@ class IntegrityService:
         }
 
         self.integrity_log.append(log_entry)
-        self._save_integrity_log()
+        self._index_entry(log_entry)
+        self._append_integrity_log(log_entry)
 
     def get_integrity_report(self) -> Dict[str, Any]:
         """무결성 검증 리포트 생성"""
@@ -107,13 +203,12 @@ class IntegrityService:
             }
 
         total_checks = len(self.integrity_log)
-        verified_count = len(
-            [log for log in self.integrity_log if log['verified']])
+        verified_count = self._verified
         failed_count = total_checks - verified_count
         success_rate = verified_count / total_checks * 100 if total_checks > 0 else 0.0
 
         # 최근 검증 날짜
-        last_check = max(log['timestamp'] for log in self.integrity_log)
+        last_check = self._last_ts
 
         return {
             'total_checks': total_checks,
@@ -125,20 +220,18 @@ class IntegrityService:
 
     def get_failed_verifications(self) -> list:
         """검증 실패 목록 조회"""
-        return [log for log in self.integrity_log if not log['verified']]
+        return list(self._failed_list)
 
     def create_chain_of_custody(self, entity_id: str, entity_type: str) -> Dict[str, Any]:
         """증거 보관 연쇄성 기록 생성"""
-        entity_logs = [
-            log for log in self.integrity_log
-            if log['entity_id'] == entity_id and log['entity_type'] == entity_type
-        ]
+        entity_logs = self._by_entity.get((entity_id, entity_type))
 
         if not entity_logs:
             return {}
 
-        # 시간순 정렬
+        # 시간순 정렬 (항목은 대부분 시간순으로 추가되므로 거의 선형 시간)
         entity_logs.sort(key=lambda x: x['timestamp'])
+        entity_logs = list(entity_logs)
 
         return {
             'entity_id': entity_id,
@@ -2,12 +2,19 @@
 Timeline generation service for email visualization.
 """
 
+import csv
+import io
+import json
 import uuid
+from collections import Counter
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO
 
 from ..models import EmailModel, EvidenceModel, TimelineModel, TimelineEvent, TimelineEventType
 
+# 파일로 내보낼 때의 쓰기 버퍼 크기
+EXPORT_BUFFER_SIZE = 256 * 1024
+
 
 class TimelineGenerator:
     """타임라인 생성 서비스"""
@@ -156,19 +163,8 @@ class TimelineGenerator:
         # 이벤트를 날짜별로 그룹화
         events_by_date = {}
         for event in timeline.events:
-            date_key = event.timestamp.strftime("%Y-%m-%d")
-            if date_key not in events_by_date:
-                events_by_date[date_key] = []
-            events_by_date[date_key].append({
-                'id': event.event_id,
-                'type': event.event_type.value,
-                'time': event.timestamp.strftime("%H:%M:%S"),
-                'title': event.title,
-                'description': event.description,
-                'participants': event.participants,
-                'attachments': event.attachments,
-                'metadata': event.metadata
-            })
+            events_by_date.setdefault(event.date_key, []).append(
+                event.to_web_dict())
 
         # 날짜순 정렬
         sorted_dates = sorted(events_by_date.keys())
@@ -212,57 +208,66 @@ class TimelineGenerator:
         )
 
         # 웹용 데이터로 변환
-        return [
-            {
-                'id': event.event_id,
-                'type': event.event_type.value,
-                'timestamp': event.timestamp.isoformat(),
-                'title': event.title,
-                'description': event.description,
-                'participants': event.participants,
-                'attachments': event.attachments,
-                'metadata': event.metadata
-            }
-            for event in filtered_events
-        ]
+        return [event.to_web_dict(iso_timestamp=True) for event in filtered_events]
 
-    def export_timeline(self, timeline_id: str, format: str = 'json') -> str:
-        """타임라인 내보내기"""
+    def export_timeline(
+        self,
+        timeline_id: str,
+        format: str = 'json',
+        out_path: Optional[str] = None,
+        pretty: bool = False
+    ) -> str:
+        """
+        타임라인 내보내기.
+        out_path를 주면 파일로 바로 기록하고 경로를, 아니면 내보낸 문자열을 반환합니다.
+        JSON은 pretty=True일 때만 들여쓰기합니다.
+        """
         timeline = self.timelines.get(timeline_id)
         if not timeline:
             return ""
 
-        if format.lower() == 'json':
-            import json
-            return json.dumps(timeline.to_dict(), ensure_ascii=False, indent=2)
-
-        elif format.lower() == 'csv':
-            import csv
-            import io
+        format = format.lower()
+        if format not in ('json', 'csv'):
+            return ""
 
+        if out_path is None:
             output = io.StringIO()
-            writer = csv.writer(output)
-
-            # 헤더
-            writer.writerow([
-                '날짜', '시간', '이벤트 유형', '제목', '설명', '참여자', '첨부파일'
-            ])
-
-            # 데이터
-            for event in timeline.events:
-                writer.writerow([
-                    event.timestamp.strftime("%Y-%m-%d"),
-                    event.timestamp.strftime("%H:%M:%S"),
-                    event.event_type.value,
-                    event.title,
-                    event.description or '',
-                    '; '.join(event.participants),
-                    '; '.join(event.attachments) if event.attachments else ''
-                ])
-
+            self._write_timeline(timeline, format, output, pretty)
             return output.getvalue()
 
-        return ""
+        with open(out_path, 'w', encoding='utf-8', newline='',
+                  buffering=EXPORT_BUFFER_SIZE) as f:
+            self._write_timeline(timeline, format, f, pretty)
+        return out_path
+
+    @staticmethod
+    def _write_timeline(timeline: TimelineModel, format: str, fp: TextIO, pretty: bool):
+        """타임라인을 JSON 또는 CSV로 fp에 기록"""
+        if format == 'json':
+            # json.dump는 순수 파이썬 인코더를 쓰므로 C 인코더(dumps) 결과를 한 번에 기록
+            fp.write(json.dumps(
+                timeline.to_dict(), ensure_ascii=False,
+                indent=2 if pretty else None,
+                separators=None if pretty else (',', ':')))
+            return
+
+        writer = csv.writer(fp)
+
+        # 헤더
+        writer.writerow([
+            '날짜', '시간', '이벤트 유형', '제목', '설명', '참여자', '첨부파일'
+        ])
+
+        # 데이터
+        writer.writerows([
+            event.date_key,
+            event.time_key,
+            event.event_type.value,
+            event.title,
+            event.description or '',
+            '; '.join(event.participants),
+            '; '.join(event.attachments) if event.attachments else ''
+        ] for event in timeline.events)
 
     def get_statistics(self, timeline_id: str) -> Dict[str, Any]:
         """타임라인 통계"""
@@ -270,30 +275,19 @@ class TimelineGenerator:
         if not timeline:
             return {}
 
-        # 이벤트 유형별 통계
-        event_type_counts = {}
-        for event in timeline.events:
-            event_type = event.event_type.value
-            event_type_counts[event_type] = event_type_counts.get(
-                event_type, 0) + 1
-
-        # 참여자별 통계
-        participant_counts = {}
-        for event in timeline.events:
-            for participant in event.participants:
-                participant_counts[participant] = participant_counts.get(
-                    participant, 0) + 1
-
-        # 일별 이벤트 수
-        daily_counts = {}
+        # 이벤트 유형별 / 참여자별 / 일별 이벤트 수 (한 번 순회로 집계)
+        event_type_counts = Counter()
+        participant_counts = Counter()
+        daily_counts = Counter()
         for event in timeline.events:
-            date_key = event.timestamp.strftime("%Y-%m-%d")
-            daily_counts[date_key] = daily_counts.get(date_key, 0) + 1
+            event_type_counts[event.event_type.value] += 1
+            participant_counts.update(event.participants)
+            daily_counts[event.date_key] += 1
 
         return {
             'timeline_summary': timeline.get_timeline_summary(),
-            'event_type_distribution': event_type_counts,
-            'participant_activity': dict(sorted(participant_counts.items(), key=lambda x: x[1], reverse=True)),
+            'event_type_distribution': dict(event_type_counts),
+            'participant_activity': dict(participant_counts.most_common()),
             'daily_event_counts': dict(sorted(daily_counts.items())),
-            'busiest_day': max(daily_counts.items(), key=lambda x: x[1]) if daily_counts else None
+            'busiest_day': daily_counts.most_common(1)[0] if daily_counts else None
         }
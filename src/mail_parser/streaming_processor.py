@@ -3,14 +3,24 @@ import gc
 import logging
 import mailbox
 import os
+import time
+from email.message import Message
 from pathlib import Path
-from typing import Dict, Iterator, Optional
+from typing import Dict, Iterator, Optional, Union
+
+from .mmap_mbox import MMapMbox
 
 try:
     import psutil
 except Exception:
     psutil = None
 
+# 스트리밍 모드에서 커널에 미리 읽기를 요청하는 범위 (8 x 1MB)
+STREAM_READAHEAD_BYTES = 8 * 1024 * 1024
+# 메모리 사용량 확인 주기 (메시지 수 또는 경과 시간(초) 중 먼저 도달하는 쪽)
+MEMORY_CHECK_EVERY = 256
+MEMORY_CHECK_INTERVAL = 0.5
+
 
 class StreamingEmailProcessor:
     """대용량 mbox 파일 스트리밍 처리"""
@@ -21,6 +31,9 @@ class StreamingEmailProcessor:
         self.logger = logging.getLogger(__name__)
         self.processed_count = 0
         self.error_count = 0
+        # psutil 프로세스 핸들과 전체 메모리 크기 (바뀌지 않으므로 한 번만 조회)
+        self._process = None
+        self._total_memory = None
 
     def should_use_streaming(self, file_path: str) -> bool:
         """스트리밍 처리가 필요한지 판단"""
@@ -41,7 +54,7 @@ class StreamingEmailProcessor:
             self.logger.error(f"파일 크기 확인 실패: {str(e)}")
             return False
 
-    def stream_emails(self, mbox_path: str) -> Iterator[mailbox.Message]:
+    def stream_emails(self, mbox_path: str) -> Iterator[Union[mailbox.Message, Message]]:
         """이메일 스트리밍 처리"""
         if not os.path.exists(mbox_path):
             raise FileNotFoundError(f"mbox 파일을 찾을 수 없습니다: {mbox_path}")
@@ -73,12 +86,20 @@ class StreamingEmailProcessor:
             self.logger.error(f"일반 모드 처리 실패: {str(e)}")
             raise
 
-    def _process_streaming_mode(self, mbox_path: str) -> Iterator[mailbox.Message]:
-        """스트리밍 모드 처리"""
+    def _process_streaming_mode(self, mbox_path: str) -> Iterator[Message]:
+        """
+        스트리밍 모드 처리.
+        mailbox.mbox는 목차를 만들 때 파일을 줄 단위로 읽으므로, 대용량 파일은
+        mmap으로 'From ' 구분선 위치만 찾고 각 메시지는 꺼낼 때 파싱합니다.
+        파싱하는 동안 다음 구간은 커널이 미리 읽어 둡니다 (MADV_WILLNEED).
+        """
+        mbox = None
+        last_check_i = 0
+        last_check_t = time.monotonic()
         try:
-            mbox = mailbox.mbox(mbox_path)
+            mbox = MMapMbox(mbox_path)
 
-            for i, message in enumerate(mbox):
+            for i, (_, message) in enumerate(mbox.iteritems(STREAM_READAHEAD_BYTES)):
                 self.processed_count += 1
 
                 # 진행률 로그 (1000개마다)
@@ -94,10 +115,14 @@ class StreamingEmailProcessor:
                     if memory_info['rss_mb'] > 1024:  # 1GB 이상이면 가비지 컬렉션
                         gc.collect()
 
-                # 메모리 임계값 체크
-                if self.should_throttle_processing():
-                    self.logger.warning("메모리 사용량이 높아 처리 속도를 조절합니다")
-                    gc.collect()
+                # 메모리 임계값 체크 (매 메시지가 아니라 일정 주기로만 확인)
+                now = time.monotonic()
+                if (i - last_check_i >= MEMORY_CHECK_EVERY or
+                        now - last_check_t > MEMORY_CHECK_INTERVAL):
+                    last_check_i, last_check_t = i, now
+                    if self.should_throttle_processing():
+                        self.logger.warning("메모리 사용량이 높아 처리 속도를 조절합니다")
+                        gc.collect()
 
                 try:
                     yield message
@@ -112,6 +137,9 @@ class StreamingEmailProcessor:
         except Exception as e:
             self.logger.error(f"스트리밍 처리 중 오류: {str(e)}")
             raise
+        finally:
+            if mbox is not None:
+                mbox.close()
 
     def get_memory_usage(self) -> Dict[str, float]:
         """메모리 사용량 모니터링"""
@@ -120,14 +148,19 @@ class StreamingEmailProcessor:
                 # psutil not installed; return best-effort zeros
                 return {'rss_mb': 0, 'vms_mb': 0, 'percent': 0, 'available_mb': 0}
 
-            process = psutil.Process()
-            memory_info = process.memory_info()
+            if self._process is None:
+                self._process = psutil.Process()
+            memory_info = self._process.memory_info()
+            virtual_memory = psutil.virtual_memory()
+            if self._total_memory is None:
+                self._total_memory = virtual_memory.total
 
             return {
                 'rss_mb': memory_info.rss / 1024 / 1024,
                 'vms_mb': memory_info.vms / 1024 / 1024,
-                'percent': process.memory_percent(),
-                'available_mb': psutil.virtual_memory().available / 1024 / 1024
+                # Process.memory_percent()와 같은 값 (전체 메모리를 다시 조회하지 않음)
+                'percent': memory_info.rss / self._total_memory * 100,
+                'available_mb': virtual_memory.available / 1024 / 1024
             }
         except Exception as e:
             self.logger.error(f"메모리 사용량 확인 실패: {str(e)}")
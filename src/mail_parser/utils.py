@@ -2,12 +2,24 @@
 import re
 from email.header import decode_header
 from datetime import datetime
+from functools import lru_cache
 import email
 
+# 파일/폴더명에 쓸 수 없는 문자와 연속된 '_'
+_FILENAME_BAD_CHARS_RE = re.compile(r'[\\/*?:"<>|]')
+_FILENAME_UNDERSCORES_RE = re.compile(r'__+')
+
 def decode_text(header_text):
     """헤더 텍스트(제목, 파일명 등)를 디코딩합니다."""
     if not header_text:
         return ""
+    # 같은 제목/파일명/주소가 메시지마다 반복되므로 문자열은 캐시된 결과 사용
+    # (Header 객체처럼 해시할 수 없는 값은 매번 디코딩)
+    if isinstance(header_text, str):
+        return _decode_text_cached(header_text)
+    return _decode_text(header_text)
+
+def _decode_text(header_text):
     decoded_parts = decode_header(header_text)
     parts = []
     for part, charset in decoded_parts:
@@ -20,11 +32,13 @@ def decode_text(header_text):
             parts.append(str(part))
     return ''.join(parts)
 
+_decode_text_cached = lru_cache(maxsize=8192)(_decode_text)
+
 def sanitize_filename(filename):
     """공백을 '_'로 바꾸고, 파일 및 폴더명으로 사용할 수 없는 문자를 제거합니다."""
     sanitized = filename.replace(" ", "_")
-    sanitized = re.sub(r'[\\/*?:"<>|]', "", sanitized).strip()
-    sanitized = re.sub(r'__+', '_', sanitized)
+    sanitized = _FILENAME_BAD_CHARS_RE.sub("", sanitized).strip()
+    sanitized = _FILENAME_UNDERSCORES_RE.sub('_', sanitized)
     return sanitized[:150]
 
 def get_email_date(msg):
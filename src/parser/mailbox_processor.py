@@ -1,6 +1,6 @@
 import mailbox
 import os
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime
 from typing import List
 
@@ -19,6 +19,8 @@ def process_mailbox(mbox_path: str, output_dir: str = None) -> List[List[object]
     mbox = mailbox.mbox(mbox_path)
     messages = {}
     replies = defaultdict(list)
+    # message id -> parent id (In-Reply-To, 없으면 References의 마지막 항목)
+    parents = {}
 
     for msg in mbox:
         msg_id = msg.get('Message-ID')
@@ -28,6 +30,7 @@ def process_mailbox(mbox_path: str, output_dir: str = None) -> List[List[object]
         refs = msg.get('References', '').split()
         in_reply = msg.get('In-Reply-To')
         parent = in_reply or (refs[-1] if refs else None)
+        parents[msg_id] = parent
         if parent:
             replies[parent].append(msg_id)
 
@@ -39,19 +42,17 @@ def process_mailbox(mbox_path: str, output_dir: str = None) -> List[List[object]
             continue
 
         # find root (message without parent in messages)
-        cur = messages[mid]
-        parent_id = cur.get('In-Reply-To') or (cur.get('References',
-                                                       '').split()[-1] if cur.get('References') else None)
+        parent_id = parents[mid]
         if parent_id and parent_id in messages:
             # will be processed when root iterated
             continue
 
         # BFS collect thread
-        q = [mid]
+        q = deque([mid])
         thread = []
         visited = set()
         while q:
-            cid = q.pop(0)
+            cid = q.popleft()
             if cid in visited:
                 continue
             visited.add(cid)
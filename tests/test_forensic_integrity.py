@@ -96,6 +96,76 @@ class TestForensicIntegrity(unittest.TestCase):
                 except Exception:
                     pass
 
+    def test_verify_against_record(self):
+        """연계보관성 기록 기준 검증 테스트"""
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(b"record based verification")
+            temp_file.flush()
+
+            try:
+                record = self.forensic_service.create_chain_of_custody(
+                    temp_file.name)
+                self.assertIsNotNone(record.captured_mtime_ns)
+                self.assertTrue(
+                    self.forensic_service.verify_integrity_against_record(record))
+
+                # 파일 수정 후에는 해시 재계산으로 실패해야 함
+                with open(temp_file.name, 'ab') as f:
+                    f.write(b" tampered")
+                self.assertFalse(
+                    self.forensic_service.verify_integrity_against_record(record))
+            finally:
+                try:
+                    temp_file.close()
+                except Exception:
+                    pass
+                try:
+                    os.unlink(temp_file.name)
+                except Exception:
+                    pass
+
+    def test_copy_and_hash(self):
+        """복사와 해시 동시 수행 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src = os.path.join(temp_dir, 'source.eml')
+            dst = os.path.join(temp_dir, 'copy.eml')
+            content = b"evidence payload" * 4096
+            with open(src, 'wb') as f:
+                f.write(content)
+
+            import hashlib
+            digest = self.forensic_service.copy_and_hash(src, dst)
+
+            self.assertEqual(digest, hashlib.sha256(content).hexdigest())
+            with open(dst, 'rb') as f:
+                self.assertEqual(f.read(), content)
+
+    def test_pipelined_hash_matches_sequential(self):
+        """대용량 파이프라인 해시 결과 일치 테스트"""
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(os.urandom(256 * 1024))
+            temp_file.flush()
+
+            try:
+                import hashlib
+                with open(temp_file.name, 'rb') as f:
+                    expected = hashlib.sha256(f.read()).hexdigest()
+
+                self.assertEqual(
+                    self.forensic_service._calculate_sha256_pipelined(
+                        temp_file.name),
+                    expected
+                )
+            finally:
+                try:
+                    temp_file.close()
+                except Exception:
+                    pass
+                try:
+                    os.unlink(temp_file.name)
+                except Exception:
+                    pass
+
     def test_custody_log_export(self):
         """연계보관성 로그 내보내기 테스트"""
         # 테스트 파일 생성
@@ -144,6 +214,34 @@ class TestForensicIntegrity(unittest.TestCase):
                 except Exception:
                     pass
 
+    def test_journal_export_current_session(self):
+        """저널을 이어 쓰더라도 내보내기에는 이번 세션의 기록만 포함"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            evidence_path = os.path.join(temp_dir, 'evidence.eml')
+            with open(evidence_path, 'wb') as f:
+                f.write(b"test content")
+            journal_path = os.path.join(temp_dir, 'custody.jsonl')
+
+            previous = ForensicIntegrityService(journal_path)
+            previous.create_chain_of_custody(evidence_path, "이전 실행")
+            previous.close()
+
+            service = ForensicIntegrityService(journal_path)
+            service.create_chain_of_custody(evidence_path, "이번 실행")
+            exported_path = service.export_custody_log(
+                os.path.join(temp_dir, 'custody.json'))
+            service.close()
+
+            import json
+            with open(exported_path, 'r', encoding='utf-8') as f:
+                log_data = json.load(f)
+            self.assertEqual([record['notes'] for record in log_data['records']],
+                             ["이번 실행"])
+            self.assertEqual(log_data['report_info']['total_records'], 1)
+            # 저널 파일에는 두 실행의 기록이 모두 남음
+            with open(journal_path, 'rb') as f:
+                self.assertEqual(len(f.read().splitlines()), 2)
+
     def test_custody_summary(self):
         """연계보관성 요약 테스트"""
         # 초기 상태 (기록 없음)
@@ -0,0 +1,33 @@
+# tests/test_integrity.py
+import hashlib
+import unittest
+
+from src.mail_parser import integrity
+from src.mail_parser.integrity import CONTENT_HASH_CACHE_MAX_CHARS, IntegrityManager
+
+
+class TestContentHash(unittest.TestCase):
+    """문자열 해시 캐시 테스트"""
+
+    def setUp(self):
+        integrity._cached_content_hash.cache_clear()
+
+    def test_small_content_cached(self):
+        """짧은 내용은 캐시에 보관"""
+        content = '짧은 본문'
+        manager = IntegrityManager()
+        self.assertEqual(manager.calculate_content_hash(content),
+                         hashlib.sha256(content.encode('utf-8')).hexdigest())
+        self.assertEqual(integrity._cached_content_hash.cache_info().currsize, 1)
+
+    def test_large_content_not_cached(self):
+        """큰 내용은 캐시에 남기지 않음"""
+        content = 'a' * (CONTENT_HASH_CACHE_MAX_CHARS + 1)
+        manager = IntegrityManager()
+        self.assertEqual(manager.calculate_content_hash(content, 'md5'),
+                         hashlib.md5(content.encode('utf-8')).hexdigest())
+        self.assertEqual(integrity._cached_content_hash.cache_info().currsize, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
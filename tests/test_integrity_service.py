@@ -0,0 +1,111 @@
+# tests/test_integrity_service.py
+import json
+import os
+import gc
+import tempfile
+import unittest
+import weakref
+
+from src.mail_parser.services import integrity_service
+from src.mail_parser.services.integrity_service import IntegrityService
+
+
+class TestIntegrityServiceLog(unittest.TestCase):
+    """무결성 로그(NDJSON) 기록/로드 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.temp_dir.name, 'integrity.log')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_append_and_reload(self):
+        """추가한 항목이 한 줄씩 기록되고 다시 로드됨"""
+        service = IntegrityService(self.log_path)
+        service.log_integrity_check('e1', 'email', '/a', 'h', 'h', True)
+        service.log_integrity_check('e2', 'email', '/b', 'h', 'x', False, '불일치')
+        service.close()
+
+        with open(self.log_path, 'rb') as f:
+            self.assertEqual(len(f.read().splitlines()), 2)
+
+        reloaded = IntegrityService(self.log_path)
+        self.assertEqual(reloaded.integrity_log, service.integrity_log)
+        self.assertEqual(reloaded.get_integrity_report()['failed_count'], 1)
+
+    def test_exit_flush_does_not_keep_service(self):
+        """종료 시 flush 등록이 인스턴스를 붙잡지 않고, close는 등록을 해제"""
+        service = IntegrityService(self.log_path)
+        service.log_integrity_check('e1', 'email', '/a', 'h', 'h', True)
+        self.assertIn(service, integrity_service._OPEN_SERVICES)
+
+        integrity_service._flush_open_services()
+        with open(self.log_path, 'rb') as f:
+            self.assertEqual(len(f.read().splitlines()), 1)
+
+        service.close()
+        self.assertNotIn(service, integrity_service._OPEN_SERVICES)
+
+        unclosed = IntegrityService(self.log_path)
+        unclosed.log_integrity_check('e2', 'email', '/b', 'h', 'h', True)
+        ref = weakref.ref(unclosed)
+        del unclosed
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_legacy_json_array(self):
+        """이전 JSON 배열 형식 로그를 읽고 이어서 기록"""
+        legacy = [{'timestamp': 't0', 'entity_id': 'e0', 'entity_type': 'email',
+                   'verified': True}]
+        with open(self.log_path, 'w', encoding='utf-8') as f:
+            json.dump(legacy, f)
+
+        service = IntegrityService(self.log_path)
+        self.assertEqual(service.integrity_log, legacy)
+        service.log_integrity_check('e1', 'email', '/a', 'h', 'h', True)
+        service.close()
+
+        reloaded = IntegrityService(self.log_path)
+        self.assertEqual([log['entity_id'] for log in reloaded.integrity_log],
+                         ['e0', 'e1'])
+
+    def test_malformed_entries_skipped(self):
+        """키가 빠진 항목이나 객체가 아닌 줄은 건너뛰고 나머지로 집계"""
+        with open(self.log_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'timestamp': 't0', 'entity_id': 'e0',
+                                'entity_type': 'email', 'verified': True}) + '\n')
+            f.write(json.dumps({'entity_id': 'e1', 'verified': False}) + '\n')
+            f.write('[1, 2]\n')
+
+        service = IntegrityService(self.log_path)
+        self.assertEqual([log['entity_id'] for log in service.integrity_log], ['e0'])
+        report = service.get_integrity_report()
+        self.assertEqual((report['total_checks'], report['failed_count']), (1, 0))
+        service.log_integrity_check('e1', 'email', '/a', 'h', 'x', False)
+        service.close()
+        self.assertEqual(service.get_integrity_report()['failed_count'], 1)
+
+    def test_report_and_custody(self):
+        """집계 보고서, 실패 목록, 보관 연쇄성 기록"""
+        service = IntegrityService(self.log_path)
+        service.log_integrity_check('e1', 'email', '/a', 'h', 'h', True)
+        service.log_integrity_check('e2', 'email', '/b', 'h', 'x', False)
+        service.log_integrity_check('e1', 'email', '/a', 'h', 'h', True)
+        service.close()
+
+        report = service.get_integrity_report()
+        self.assertEqual((report['total_checks'], report['verified_count'],
+                          report['failed_count']), (3, 2, 1))
+        self.assertEqual(report['last_check'], service.integrity_log[-1]['timestamp'])
+        self.assertEqual([log['entity_id'] for log in service.get_failed_verifications()],
+                         ['e2'])
+
+        custody = service.create_chain_of_custody('e1', 'email')
+        self.assertEqual(custody['verification_count'], 2)
+        self.assertTrue(custody['all_verified'])
+        self.assertEqual(service.create_chain_of_custody('e3', 'email'), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+# tests/test_logger.py
+import os
+import tempfile
+import unittest
+
+from src.mail_parser.logger import _close_handlers, setup_logger
+
+
+class TestSetupLogger(unittest.TestCase):
+    """로거 재사용/재구성 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.name = 'test_setup_logger'
+
+    def tearDown(self):
+        import logging
+        _close_handlers(logging.getLogger(self.name))
+        self.temp_dir.cleanup()
+
+    def test_same_arguments_reuse_logger(self):
+        """같은 인자로 다시 호출하면 핸들러를 다시 만들지 않음"""
+        log_dir = os.path.join(self.temp_dir.name, 'a')
+        logger = setup_logger(self.name, log_dir)
+        handlers = list(logger.handlers)
+        self.assertIs(setup_logger(self.name, log_dir), logger)
+        self.assertEqual(logger.handlers, handlers)
+
+    def test_changed_log_dir_reconfigures(self):
+        """log_dir이 바뀌면 새 디렉토리에 기록"""
+        first_dir = os.path.join(self.temp_dir.name, 'a')
+        second_dir = os.path.join(self.temp_dir.name, 'b')
+        setup_logger(self.name, first_dir)
+        logger = setup_logger(self.name, second_dir)
+        logger.error("두 번째 디렉토리 기록")
+        with open(os.path.join(second_dir, f'{self.name}.log'), encoding='utf-8') as f:
+            self.assertIn("두 번째 디렉토리 기록", f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# tests/test_mmap_mbox.py
+import io
+import mailbox
+import os
+import tempfile
+import unittest
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+from src.mail_parser.mmap_mbox import MMapMbox
+
+
+class TestMMapMbox(unittest.TestCase):
+    """mmap 기반 mbox 리더 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.mbox_path = os.path.join(self.temp_dir.name, 'test.mbox')
+
+        mbox = mailbox.mbox(self.mbox_path)
+        plain = MIMEText('본문\nFrom 으로 시작하는 줄', 'plain', 'utf-8')
+        plain['Subject'] = 'plain'
+        plain['Message-ID'] = '<plain@test>'
+        mbox.add(plain)
+
+        multi = MIMEMultipart()
+        multi['Subject'] = 'multi'
+        multi['Message-ID'] = '<multi@test>'
+        multi.attach(MIMEText('<p>html</p>', 'html', 'utf-8'))
+        mbox.add(multi)
+        mbox.flush()
+        mbox.close()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_matches_mailbox_mbox(self):
+        """mailbox.mbox와 같은 키와 메시지 바이트 반환"""
+        expected = mailbox.mbox(self.mbox_path)
+        reader = MMapMbox(self.mbox_path)
+        try:
+            self.assertEqual(reader.keys(), list(expected.keys()))
+            for key in expected.keys():
+                self.assertEqual(reader.get_bytes(key), expected.get_bytes(key))
+                copied = io.BytesIO()
+                reader.copy_to(key, copied)
+                self.assertEqual(copied.getvalue(), expected.get_bytes(key))
+                self.assertEqual(reader.get_message(key)['Message-ID'],
+                                 expected.get_message(key)['Message-ID'])
+        finally:
+            reader.close()
+            expected.close()
+
+    def test_headers_only(self):
+        """헤더만 파싱해도 메타데이터 헤더는 동일"""
+        reader = MMapMbox(self.mbox_path)
+        try:
+            for key in reader.keys():
+                headers = reader.get_headers(key)
+                full = reader.get_message(key)
+                self.assertEqual(headers.items(), full.items())
+                self.assertFalse(headers.get_payload())
+        finally:
+            reader.close()
+
+    def test_iteritems_readahead(self):
+        """미리 읽기 힌트를 주어도 같은 메시지를 순서대로 반환"""
+        reader = MMapMbox(self.mbox_path)
+        try:
+            plain = [msg.as_bytes() for _, msg in reader.iteritems()]
+            advised = [msg.as_bytes() for _, msg in reader.iteritems(readahead=1)]
+            self.assertEqual(advised, plain)
+            self.assertEqual(len(plain), 2)
+        finally:
+            reader.close()
+
+    def test_missing_key(self):
+        """없는 키 조회 시 KeyError"""
+        reader = MMapMbox(self.mbox_path)
+        try:
+            self.assertNotIn(5, reader)
+            with self.assertRaises(KeyError):
+                reader.get_message(5)
+        finally:
+            reader.close()
+
+    def test_empty_file(self):
+        """빈 파일은 메시지 0개"""
+        empty_path = os.path.join(self.temp_dir.name, 'empty.mbox')
+        open(empty_path, 'wb').close()
+        reader = MMapMbox(empty_path)
+        try:
+            self.assertEqual(len(reader), 0)
+        finally:
+            reader.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+# tests/test_packaging.py
+import hashlib
+import io
+import os
+import tarfile
+import tempfile
+import threading
+import unittest
+import zipfile
+from unittest import mock
+
+from src.mail_parser import packaging
+from src.mail_parser.packaging import (ATTACHMENT_BUNDLE_NAME, HASH_MANIFEST_NAME,
+                                       EvidencePackager)
+
+
+class TestEvidencePackage(unittest.TestCase):
+    """증거 패키지 ZIP 왕복 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = os.path.join(self.temp_dir.name, 'processed')
+        mail_dir = os.path.join(self.base_dir, 'mail1')
+        os.makedirs(os.path.join(mail_dir, 'pdf_evidence'))
+
+        # 파일 이름 -> 내용 (압축/무압축, 작은 파일/큰 파일 경로를 모두 거치도록 구성)
+        self.files = {
+            os.path.join('pdf_evidence', 'evidence.pdf'): b'%PDF-1.4 ' * 100,
+            os.path.join('pdf_evidence', 'evidence2.pdf'): b'%PDF-1.4 ' * 90,
+            os.path.join('pdf_evidence', 'evidence3.pdf'): b'%PDF-1.4 ' * 80,
+            'small.doc': b'small attachment',
+            'small.png': os.urandom(500),
+            'large.doc': b'compressible text ' * 1000,
+            'large.png': os.urandom(20000),
+        }
+        for name, data in self.files.items():
+            with open(os.path.join(mail_dir, name), 'wb') as f:
+                f.write(data)
+
+        self.output_path = os.path.join(self.temp_dir.name, 'package.zip')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _create_package(self) -> zipfile.ZipFile:
+        # 작은 테스트 파일로도 tar 묶음과 대용량(스트리밍/sendfile) 경로를 거치도록 기준 축소
+        with mock.patch.object(packaging, 'SMALL_ATTACHMENT_BYTES', 1024), \
+                mock.patch.object(packaging, 'PARALLEL_COMPRESS_MAX_BYTES', 4096):
+            EvidencePackager(self.base_dir).create_evidence_package(
+                '갑', 'case', self.output_path)
+        return zipfile.ZipFile(self.output_path)
+
+    def _assert_round_trip(self, zipf: zipfile.ZipFile):
+        self.assertIsNone(zipf.testzip())
+
+        expected = {
+            f'01_증거파일/mail1_{name}': self.files[os.path.join('pdf_evidence', name)]
+            for name in ('evidence.pdf', 'evidence2.pdf', 'evidence3.pdf')
+        }
+        expected.update({
+            '02_첨부파일/mail1_small.doc': self.files['small.doc'],
+            '02_첨부파일/mail1_small.png': self.files['small.png'],
+            '02_첨부파일/mail1_large.doc': self.files['large.doc'],
+            '02_첨부파일/mail1_large.png': self.files['large.png'],
+        })
+
+        # 1MB(여기서는 1KB) 미만 첨부파일은 tar 안에 소유자 정보 없이 묶임
+        contents = {}
+        with tarfile.open(fileobj=io.BytesIO(zipf.read(ATTACHMENT_BUNDLE_NAME))) as tar:
+            for member in tar.getmembers():
+                self.assertEqual((member.uid, member.gid, member.uname, member.gname),
+                                 (0, 0, '', ''))
+                contents['02_첨부파일/' + member.name] = tar.extractfile(member).read()
+        for name in zipf.namelist():
+            if name.startswith(('01_', '02_')) and name != ATTACHMENT_BUNDLE_NAME:
+                contents[name] = zipf.read(name)
+        self.assertEqual(contents, expected)
+
+        # 해시 목록에는 ZIP 멤버, tar 묶음, 묶인 파일마다의 SHA-256이 모두 기록됨
+        manifest = {}
+        for line in zipf.read(HASH_MANIFEST_NAME).decode('utf-8').splitlines():
+            digest, name = line.split('  ', 1)
+            manifest[name] = digest
+        expected_hashes = {name: hashlib.sha256(data).hexdigest()
+                           for name, data in expected.items()}
+        expected_hashes[ATTACHMENT_BUNDLE_NAME] = hashlib.sha256(
+            zipf.read(ATTACHMENT_BUNDLE_NAME)).hexdigest()
+        self.assertEqual(manifest, expected_hashes)
+
+    def test_raw_member_internals_available(self):
+        """실행 중인 Python의 zipfile이 직접 기록에 필요한 내부 속성을 제공"""
+        with zipfile.ZipFile(io.BytesIO(), 'w') as zipf:
+            self.assertTrue(packaging._supports_raw_members(zipf))
+
+    def test_round_trip(self):
+        """모든 멤버의 CRC와 SHA-256이 원본과 일치"""
+        with self._create_package() as zipf:
+            self._assert_round_trip(zipf)
+
+    def test_round_trip_without_sendfile(self):
+        """sendfile 없이도 같은 결과"""
+        with mock.patch.object(packaging, 'SENDFILE_SUPPORTED', False), \
+                self._create_package() as zipf:
+            self._assert_round_trip(zipf)
+
+    def test_round_trip_public_api_only(self):
+        """zipfile 내부 속성을 쓸 수 없으면 공개 API로 기록해도 같은 결과"""
+        with mock.patch.object(packaging, '_supports_raw_members', return_value=False), \
+                self._create_package() as zipf:
+            self._assert_round_trip(zipf)
+
+    def test_pending_bytes_bounded(self):
+        """미리 압축해 기록을 기다리는 파일의 원본 크기 합이 상한을 넘지 않음"""
+        budget = 1500
+        outstanding = {'bytes': 0, 'max': 0}
+        lock = threading.Lock()
+        compress_file = packaging._compress_file
+        write_member = packaging._write_compressed_member
+
+        def _tracked_compress(src, compress_type):
+            with lock:
+                outstanding['bytes'] += os.path.getsize(src)
+                outstanding['max'] = max(outstanding['max'], outstanding['bytes'])
+            return compress_file(src, compress_type)
+
+        def _tracked_write(zipf, src, *args):
+            write_member(zipf, src, *args)
+            with lock:
+                outstanding['bytes'] -= os.path.getsize(src)
+
+        with mock.patch.object(packaging, 'PARALLEL_PENDING_MAX_BYTES', budget), \
+                mock.patch.object(packaging, '_compress_file', _tracked_compress), \
+                mock.patch.object(packaging, '_write_compressed_member', _tracked_write), \
+                self._create_package() as zipf:
+            self._assert_round_trip(zipf)
+        self.assertGreater(outstanding['max'], 0)
+        self.assertLessEqual(outstanding['max'], budget)
+        self.assertEqual(outstanding['bytes'], 0)
+
+    def test_created_at_per_package(self):
+        """같은 패키저를 재사용해도 패키지마다 생성 시점의 일시를 기록"""
+        import json
+        from datetime import datetime
+        packager = EvidencePackager(self.base_dir)
+        stamps = [datetime(2024, 1, 1, 9, 0, 0), datetime(2024, 1, 2, 10, 30, 0)]
+        for index, stamp in enumerate(stamps):
+            output_path = os.path.join(self.temp_dir.name, f'package{index}.zip')
+            with mock.patch.object(packaging, 'datetime') as fake_datetime:
+                fake_datetime.now.return_value = stamp
+                packager.create_evidence_package('갑', 'case', output_path)
+            with zipfile.ZipFile(output_path) as zipf:
+                metadata = json.loads(zipf.read('package_metadata.json'))
+                readme = zipf.read('README.md').decode('utf-8')
+            self.assertEqual(metadata['package_info']['created_at'], stamp.isoformat())
+            self.assertIn(stamp.strftime('%Y-%m-%d %H:%M:%S'), readme)
+
+    def test_checklist_uses_platform_line_endings(self):
+        """체크리스트는 플랫폼 줄바꿈(os.linesep)으로 기록"""
+        packager = EvidencePackager(self.base_dir)
+        checklist_path = os.path.join(self.temp_dir.name, 'checklist.txt')
+        with mock.patch.object(packaging.os, 'linesep', '\r\n'):
+            packager.create_delivery_checklist(self.output_path, checklist_path)
+        with open(checklist_path, 'rb') as f:
+            data = f.read()
+        self.assertIn(b'\r\n', data)
+        self.assertNotIn(b'\n', data.replace(b'\r\n', b''))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,370 @@
+# tests/test_processor.py
+import base64
+import contextlib
+import hashlib
+import io
+import json
+import mailbox
+import os
+import tempfile
+import threading
+import unittest
+from email.header import Header
+from email.mime.application import MIMEApplication
+from email.mime.image import MIMEImage
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from unittest import mock
+
+from src.mail_parser import processor as processor_module
+from src.mail_parser.processor import (EmailEvidenceProcessor, _iter_prefetched,
+                                       _PartIndex, _PartView, _stream_decode_base64)
+from src.mail_parser.utils import decode_text
+
+CONFIG = {
+    'exclude_keywords': ['광고', 'SPAM'],
+    'exclude_senders': ['noreply@'],
+    'exclude_domains': ['bad.com'],
+    'date_range': {'start': '2023-01-01', 'end': '2024-12-31'},
+    'required_keywords': {'keywords': ['계약', 'contract']},
+}
+
+
+def _text_message(body: str, subject: str = 'subject', sender: str = 'a@good.com',
+                  date: str = 'Mon, 01 Jan 2024 10:00:00 +0900',
+                  msg_id: str = None) -> MIMEText:
+    msg = MIMEText(body, 'plain', 'utf-8')
+    msg['Subject'] = subject
+    msg['From'] = sender
+    msg['Date'] = date
+    if msg_id:
+        msg['Message-ID'] = msg_id
+    return msg
+
+
+def _related_message(html: str) -> MIMEMultipart:
+    """HTML 본문 + CID 인라인 이미지 두 개 + 첨부파일"""
+    msg = MIMEMultipart('related')
+    msg.attach(MIMEText(html, 'html', 'utf-8'))
+    img1 = MIMEImage(b'\x89PNG' + bytes(range(256)), 'png')
+    img1.add_header('Content-ID', '<img1>')
+    img1.add_header('Content-Disposition', 'inline')
+    msg.attach(img1)
+    img2 = MIMEImage(b'GIF89a' + bytes(10), 'gif')
+    img2.add_header('Content-ID', '<img2>')
+    msg.attach(img2)
+    att = MIMEApplication(b'%PDF-1.4 data', 'pdf')
+    att.add_header('Content-Disposition', 'attachment', filename='contract.pdf')
+    msg.attach(att)
+    return msg
+
+
+class _ProcessorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.temp_dir.name, 'config.json')
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump(CONFIG, f, ensure_ascii=False)
+        self.processor = EmailEvidenceProcessor(self.config_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+
+class TestExclusion(_ProcessorTestCase):
+    """제외 검사 사유와 필수 키워드/날짜 범위 처리 테스트"""
+
+    def test_exclusion_reasons(self):
+        """검사 순서대로 첫 번째 사유를 반환"""
+        cases = [
+            (_text_message('contract 광고'), "제외 키워드 '광고' 포함"),
+            (_text_message('contract', subject='spam mail'), "제외 키워드 'SPAM' 포함"),
+            (_text_message('contract', sender='NoReply@svc.com'),
+             "제외 발신자 'noreply@' 포함"),
+            (_text_message('contract', sender='Bob <bob@bad.com>'),
+             "제외 도메인 'bad.com' 포함"),
+            (_text_message('contract', date='Tue, 03 Jan 2020 10:00:00 +0900'),
+             "시작일 '2023-01-01' 이전"),
+            (_text_message('contract', date='Thu, 02 Jan 2025 10:00:00 +0900'),
+             "종료일 '2024-12-31' 이후"),
+            (_text_message('hello'), "필수 키워드 미포함 (요구: 계약, contract...)"),
+            (_text_message('contract'), "포함"),
+        ]
+        for msg, reason in cases:
+            with self.subTest(reason=reason):
+                self.assertEqual(self.processor._is_excluded(msg),
+                                 (reason != "포함", reason))
+
+    def test_required_keyword_locations(self):
+        """필수 키워드는 제목, 본문, 뒤쪽 텍스트 파트 어디에 있어도 인정 (대소문자 무시)"""
+        self.assertFalse(self.processor._is_excluded(
+            _text_message('hello', subject='CONTRACT 건'))[0])
+        self.assertFalse(self.processor._is_excluded(_text_message('계약서 송부'))[0])
+
+        multi = MIMEMultipart()
+        multi['Subject'] = 'misc'
+        multi['From'] = 'a@good.com'
+        multi['Date'] = 'Mon, 01 Jan 2024 10:00:00 +0900'
+        multi.attach(MIMEText('first part', 'plain', 'utf-8'))
+        multi.attach(MIMEText('<p>Contract</p>', 'html', 'utf-8'))
+        self.assertFalse(self.processor._is_excluded(multi)[0])
+
+    def test_date_range_boundaries(self):
+        """시작일/종료일 당일은 포함"""
+        for date in ('Sun, 01 Jan 2023 00:00:00 +0900',
+                     'Tue, 31 Dec 2024 23:59:59 +0900'):
+            with self.subTest(date=date):
+                self.assertEqual(self.processor._is_excluded(
+                    _text_message('contract', date=date)), (False, "포함"))
+
+    def test_no_filters(self):
+        """필터 설정이 없으면 모두 포함"""
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({}, f)
+        processor = EmailEvidenceProcessor(self.config_path)
+        self.assertEqual(processor._is_excluded(
+            _text_message('광고', date='Tue, 03 Jan 2020 10:00:00 +0900')),
+            (False, "포함"))
+
+
+class TestBase64StreamDecode(unittest.TestCase):
+    """base64 청크 디코딩이 get_payload(decode=True)와 같은 결과인지 테스트"""
+
+    def _attachment(self, data: bytes) -> MIMEApplication:
+        att = MIMEApplication(data, 'octet-stream')
+        att.add_header('Content-Disposition', 'attachment', filename='data.bin')
+        return att
+
+    def test_matches_get_payload(self):
+        """청크 경계가 줄/4바이트 경계와 어긋나도 같은 바이트"""
+        for size in (0, 1, 2, 3, 57, 1000, 4099):
+            data = os.urandom(size)
+            part = self._attachment(data)
+            with self.subTest(size=size), \
+                    mock.patch.object(processor_module, 'STREAM_DECODE_CHUNK_CHARS', 100):
+                out = io.BytesIO()
+                self.assertTrue(_stream_decode_base64(part.get_payload(), out))
+                self.assertEqual(out.getvalue(), part.get_payload(decode=True))
+
+    def test_malformed_payload(self):
+        """형식이 일반적이지 않으면 False (호출 측이 관대한 디코딩으로 재기록)"""
+        for payload in ('QUJD\nRA=\nQUJD\n', 'QU*D\n', 'QUJDR\n'):
+            with self.subTest(payload=payload):
+                self.assertFalse(_stream_decode_base64(payload, io.BytesIO()))
+
+    def test_write_decoded(self):
+        """스트리밍 대상 파트와 실패 후 대체 경로 모두 get_payload(decode=True)와 동일"""
+        data = os.urandom(5000)
+        good = self._attachment(data)
+        bad = self._attachment(b'')
+        bad.set_payload(base64.b64encode(data).decode('ascii') + '\n*garbage*\n')
+        with mock.patch.object(processor_module, 'STREAM_DECODE_MIN_CHARS', 1024), \
+                mock.patch.object(processor_module, 'STREAM_DECODE_CHUNK_CHARS', 256):
+            for part in (good, bad):
+                view = _PartView(part)
+                self.assertTrue(view.streamable)
+                out = io.BytesIO()
+                self.assertTrue(view.write_decoded(out))
+                self.assertEqual(out.getvalue(), part.get_payload(decode=True))
+
+
+class TestIterPrefetched(unittest.TestCase):
+    """읽기 스레드를 둔 미리 읽기 반복자 테스트"""
+
+    def test_yields_in_order(self):
+        """모든 항목을 순서대로 반환하고, 읽기 중 예외는 호출 측으로 전달"""
+        self.assertEqual(list(_iter_prefetched(range(10), 2)), list(range(10)))
+
+        def _failing():
+            yield 1
+            raise ValueError('읽기 실패')
+
+        with self.assertRaises(ValueError):
+            list(_iter_prefetched(_failing(), 2))
+
+    def test_early_stop_with_full_queue(self):
+        """큐가 가득 찬 상태에서 호출 측이 중단해도 읽기 스레드가 종료됨"""
+        for count in (2, 100):
+            with self.subTest(count=count):
+                def _consume():
+                    prefetched = _iter_prefetched(range(count), 1)
+                    next(prefetched)
+                    # 읽기 스레드가 다음 항목(또는 종료 표시)으로 큐를 채울 때까지 대기
+                    threading.Event().wait(0.3)
+                    prefetched.close()
+
+                consumer = threading.Thread(target=_consume, daemon=True)
+                consumer.start()
+                consumer.join(timeout=5)
+                self.assertFalse(consumer.is_alive())
+
+
+class TestInlineCidImages(unittest.TestCase):
+    """HTML 본문의 CID 이미지 내장 결과 테스트"""
+
+    def test_write_inlined_html(self):
+        """참조된 CID는 data URI로 바뀌고, 없는 CID 참조는 그대로 유지"""
+        html = ('<p>a <img src="cid:img1"> b <img src=\'cid:img1\'>'
+                ' c <img src="cid:img2"> d <img src="cid:none"></p>')
+        index = _PartIndex(_related_message(html))
+        self.assertEqual(sorted(index.inline_by_cid), ['img1', 'img2'])
+        self.assertEqual(len(index.attachments), 1)
+
+        png = base64.b64encode(b'\x89PNG' + bytes(range(256))).decode('ascii')
+        gif = base64.b64encode(b'GIF89a' + bytes(10)).decode('ascii')
+        out = io.StringIO()
+        EmailEvidenceProcessor._write_inlined_html(out, html, index.inline_by_cid)
+        self.assertEqual(
+            out.getvalue(),
+            f'<p>a <img src="data:image/png;base64,{png}"> '
+            f'b <img src=\'data:image/png;base64,{png}\'> '
+            f'c <img src="data:image/gif;base64,{gif}"> d <img src="cid:none"></p>')
+
+
+class TestProcessAll(_ProcessorTestCase):
+    """병렬 처리와 순차 처리의 결과 동일성 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.mbox_path = os.path.join(self.temp_dir.name, 'test.mbox')
+        mbox = mailbox.mbox(self.mbox_path)
+
+        related = _related_message('<p>계약서 <img src="cid:img1"></p>')
+        related['Subject'] = '계약 관련'
+        related['From'] = 'Hong <hong@good.com>'
+        related['Date'] = 'Mon, 01 Jan 2024 10:00:00 +0900'
+        related['Message-ID'] = '<m1@test>'
+        mbox.add(related)
+        mbox.add(_text_message('광고 contract', subject='ad', msg_id='<m2@test>'))
+        mbox.add(_text_message('hello', subject='misc', msg_id='<m3@test>'))
+
+        files = MIMEMultipart()
+        files['Subject'] = 'contract files'
+        files['From'] = 'lee@good.com'
+        files['Date'] = 'Fri, 05 Jan 2024 10:00:00 +0900'
+        files['Message-ID'] = '<m4@test>'
+        files.attach(MIMEText('see attached contract', 'plain', 'utf-8'))
+        att = MIMEApplication(b'zip' * 1000, 'zip')
+        att.add_header('Content-Disposition', 'attachment', filename='a.zip')
+        files.attach(att)
+        mbox.add(files)
+        mbox.flush()
+        mbox.close()
+
+        self.processor.load_mbox(self.mbox_path)
+
+    def _run(self, name: str, workers: int):
+        output_dir = os.path.join(self.temp_dir.name, name)
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = self.processor.process_all(output_dir, workers=workers)
+        tree = {}
+        for root, _, files in os.walk(output_dir):
+            for file in files:
+                path = os.path.join(root, file)
+                with open(path, 'rb') as f:
+                    tree[os.path.relpath(path, output_dir)] = \
+                        hashlib.sha256(f.read()).hexdigest()
+        return [os.path.relpath(r, output_dir) if r else None for r in results], tree
+
+    def test_parallel_matches_serial(self):
+        """반환 경로 순서와 생성 파일 내용이 같음"""
+        serial = self._run('serial', workers=1)
+        self.assertEqual(sum(r is not None for r in serial[0]), 1)
+        self.assertTrue(any(name.endswith('.eml') for name in serial[1]))
+        self.assertEqual(self._run('parallel', workers=2), serial)
+
+    def test_failed_attachment_write_removed(self):
+        """첨부파일 기록 중 실패하면 잘린 파일을 남기지 않아 다시 처리할 때 새로 기록됨"""
+        def _fail(view, fileobj):
+            fileobj.write(b'partial')
+            raise OSError(28, 'No space left on device')
+
+        with mock.patch.object(_PartView, 'write_decoded', _fail), \
+                self.assertRaises(OSError):
+            self._run('out', workers=1)
+        self.assertNotIn('a.zip', [name for _, _, files in
+                                   os.walk(os.path.join(self.temp_dir.name, 'out'))
+                                   for name in files])
+
+        tree = self._run('out', workers=1)[1]
+        attachment = [digest for name, digest in tree.items()
+                      if os.path.basename(name) == 'a.zip']
+        self.assertEqual(attachment, [hashlib.sha256(b'zip' * 1000).hexdigest()])
+
+    def test_reload_closes_previous_mbox(self):
+        """mmap mbox를 다시 로드하면 이전 mmap과 파일 핸들을 닫음"""
+        self.processor.use_mmap_mbox = True
+        self.processor.load_mbox(self.mbox_path)
+        previous = self.processor.mbox
+        self.processor.load_mbox(self.mbox_path)
+        self.assertIsNot(self.processor.mbox, previous)
+        self.assertIsNone(previous.mm)
+        self.assertTrue(previous._file.closed)
+        self.processor.close_mbox()
+        self.assertIsNone(self.processor.mbox)
+
+
+class TestMetadataCache(_ProcessorTestCase):
+    """mbox 메타데이터 캐시(JSON) 저장/복원 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = os.path.join(self.temp_dir.name, 'cache')
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(CONFIG, processing_options={
+                'use_metadata_cache': True, 'metadata_cache_dir': self.cache_dir}),
+                f, ensure_ascii=False)
+        self.mbox_path = os.path.join(self.temp_dir.name, 'test.mbox')
+        # 8비트 원문 제목 (Header 객체로 파싱됨) 과 일반 메시지
+        raw = ('From MAILER-DAEMON Mon Jan  1 00:00:00 2024\n'
+               'Subject: 한글 원문 제목\nFrom: a@good.com\n'
+               'Date: Mon, 01 Jan 2024 10:00:00 +0900\nMessage-ID: <raw@test>\n'
+               'In-Reply-To: <m1@test>\n\nbody\n\n').encode('cp949')
+        with open(self.mbox_path, 'wb') as f:
+            f.write(raw)
+        mbox = mailbox.mbox(self.mbox_path)
+        mbox.add(_text_message('contract', subject='=?utf-8?b?6rOE7JW9?=',
+                               msg_id='<m1@test>'))
+        mbox.flush()
+        mbox.close()
+
+    def _load(self):
+        processor = EmailEvidenceProcessor(self.config_path)
+        processor.load_mbox(self.mbox_path)
+        return processor.metadata_map
+
+    def test_round_trip(self):
+        """캐시에서 읽은 메타데이터가 헤더 파싱 결과와 같음"""
+        parsed = self._load()
+        self.assertIsInstance(parsed['<raw@test>']['subject'], Header)
+        cache_files = os.listdir(self.cache_dir)
+        self.assertEqual(len(cache_files), 1)
+        self.assertTrue(cache_files[0].endswith('.json'))
+        if os.name == 'posix':
+            self.assertEqual(os.stat(self.cache_dir).st_mode & 0o777, 0o700)
+
+        with mock.patch.object(processor_module, '_iter_mbox_headers',
+                               side_effect=AssertionError('캐시 미사용')):
+            cached = self._load()
+        self.assertEqual(cached.keys(), parsed.keys())
+        for msg_id, meta in parsed.items():
+            with self.subTest(msg_id=msg_id):
+                self.assertEqual(cached[msg_id]['key'], meta['key'])
+                self.assertEqual(cached[msg_id]['date'], meta['date'])
+                self.assertEqual(cached[msg_id]['in_reply_to'], meta['in_reply_to'])
+                self.assertEqual(cached[msg_id]['references'], meta['references'])
+                self.assertEqual(decode_text(cached[msg_id]['subject']),
+                                 decode_text(meta['subject']))
+
+    def test_invalid_cache_ignored(self):
+        """읽을 수 없는 캐시 파일은 무시하고 헤더를 다시 파싱"""
+        parsed = self._load()
+        cache_path = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+        with open(cache_path, 'wb') as f:
+            f.write(b'\x80\x04not json')
+        self.assertEqual(self._load().keys(), parsed.keys())
+
+
+if __name__ == '__main__':
+    unittest.main()
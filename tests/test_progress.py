@@ -0,0 +1,38 @@
+# tests/test_progress.py
+import contextlib
+import io
+import unittest
+
+from src.mail_parser.progress import EmailProcessingProgress, ProgressBar
+
+
+class TestProgressOutput(unittest.TestCase):
+    """터미널이 아닌 출력(리다이렉트/로그)에서의 진행 상황 출력 테스트"""
+
+    def test_progress_bar_without_tty(self):
+        """바를 다시 그리는 \\r 출력 없이 완료 줄만 기록"""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            bar = ProgressBar(10, "처리")
+            for _ in range(10):
+                bar.update()
+            bar.finish()
+        self.assertNotIn('\r', output.getvalue())
+        self.assertIn("처리 10/10 완료!", output.getvalue())
+
+    def test_email_progress_lines_without_tty(self):
+        """메일 처리 진행 줄은 터미널이 아니어도 출력"""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            progress = EmailProcessingProgress(total_emails=4)
+            progress.set_stage("메일 처리")
+            progress.update_email_processed()
+            progress.update_email_excluded()
+            progress.display_summary()
+        self.assertNotIn('\r', output.getvalue())
+        self.assertIn("진행률: 1/4 (25.0%) | 처리됨: 1, 제외됨: 0", output.getvalue())
+        self.assertIn("진행률: 2/4 (50.0%) | 처리됨: 1, 제외됨: 1", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# tests/test_reporter.py
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from src.mail_parser import json_utils
+from src.mail_parser.reporter import ReportGenerator, _evidence_row
+
+
+class TestEvidenceRow(unittest.TestCase):
+    """증거목록 행 변환 테스트"""
+
+    def test_attachments_column(self):
+        """첨부파일 목록은 한 칸 문자열로, 없거나 None이면 '없음'"""
+        self.assertEqual(_evidence_row({'attachments': ['a.pdf', 'b.png']})[5],
+                         'a.pdf, b.png')
+        self.assertEqual(_evidence_row({})[5], '없음')
+        self.assertEqual(_evidence_row({'attachments': []})[5], '없음')
+        self.assertEqual(_evidence_row({'attachments': None})[5], '없음')
+
+
+class TestReportSpool(unittest.TestCase):
+    """spool 모드와 메모리 모드의 항목 동일성 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _entries(self):
+        kst = timezone(timedelta(hours=9))
+        return [
+            ('processed', {'evidence_number': '갑 제1호증',
+                           'date': datetime(2024, 1, 2, 3, 4, 5),
+                           'subject': '제목', 'attachments': ['a.pdf']}),
+            ('excluded', {'date': datetime(2024, 2, 3, 4, 5, 6, tzinfo=kst),
+                          'subject': '광고', 'exclusion_reason': '제외 키워드'}),
+            ('processed', {'evidence_number': '갑 제2호증', 'date': '날짜 미상',
+                           'attachments': None}),
+        ]
+
+    def _collect(self, spool: bool):
+        reporter = ReportGenerator(os.path.join(self.temp_dir.name, str(spool)),
+                                   spool=spool)
+        try:
+            for kind, entry in self._entries():
+                if kind == 'processed':
+                    reporter.add_evidence_entry(entry)
+                else:
+                    reporter.add_excluded_entry(entry)
+            return reporter.evidence_list
+        finally:
+            reporter.close()
+
+    def test_spool_matches_memory(self):
+        """spool 모드에서도 datetime 값이 그대로 복원됨"""
+        expected = self._collect(spool=False)
+        self.assertEqual(self._collect(spool=True), expected)
+        self.assertIsInstance(expected[0]['date'], datetime)
+
+    def test_spool_without_orjson(self):
+        """orjson이 없어도 datetime 항목을 spool에 기록할 수 있음"""
+        with mock.patch.object(json_utils, 'ORJSON_AVAILABLE', False):
+            self.assertEqual(self._collect(spool=True), self._collect(spool=False))
+
+
+if __name__ == '__main__':
+    unittest.main()